@@ -0,0 +1,284 @@
+# Amphipod burrow module
+#
+# Burrow states for day 23, packed into a single int of 3-bit cells, and the
+# move generator for the search.  The cells are numbered as the characters of
+# the map strings used by the puzzles: cells 0-10 are the hallway, followed by
+# the 4 rooms, `depth` consecutive cells per room, with the first cell of each
+# room closest to the hallway.  Cell `i` occupies bits `3*i` to `3*i + 2` of
+# the state, and holds 0 if empty or 1-4 for an amphipod of type A-D.  The
+# tables needed to move amphipods (which room contents can accept or release
+# an amphipod, and which hallway cells lie between two others) are computed
+# once per room depth, so that generating a move takes only integer
+# operations.
+#
+# The search is A*, guided by a lower bound on the energy still needed: every
+# amphipod that is not yet in its final position must at least walk out of its
+# room (if it is in one), along the hallway to its own room (or, if it is
+# already in its own room but blocking another amphipod, one step aside and
+# back), and into its room, which is filled from the bottom up; blocking by
+# other amphipods is ignored.  Rooms of any depth (2, 4, 6, ...) are handled,
+# so both parts of the puzzle share one solver.
+
+import itertools
+
+import shortest_path
+from progress import ProgressReporter
+
+hallLength    = 11
+roomEntrances = (2, 4, 6, 8)             # Hallway cell outside each room
+symbols       = ".ABCD"                  # Symbol for each cell value
+energyPerStep = (0, 1, 10, 100, 1000)    # Indexed by cell value
+
+def cellMask(cell):
+    """Return the mask of the bits of `cell` in a packed state"""
+    return 7 << 3 * cell
+
+class Burrow:
+    """The tables for moving amphipods in a burrow whose rooms are `depth`
+    cells deep"""
+
+    def __init__(self, depth):
+        self.depth = depth
+        self.cells = hallLength + 4 * depth
+        self.roomShift = [ 3 * (hallLength + r * depth) for r in range(4) ]
+        self.roomBits  = (1 << 3 * depth) - 1
+
+        # `betweenMask[a][b]` covers the hallway cells strictly between `a`
+        # and `b`, which must be empty for an amphipod to pass.
+        self.betweenMask = [ [ sum(cellMask(c) for c in range(min(a, b) + 1, max(a, b)))
+                               for b in range(hallLength) ]
+                             for a in range(hallLength) ]
+
+        # Hallway cells in which an amphipod leaving each room may stop, in
+        # order outward from the room's entrance, to the left and to the right
+        self.hallStops  = tuple(c for c in range(hallLength) if c not in roomEntrances)
+        self.leftStops  = [ tuple(c for c in reversed(self.hallStops) if c < e)
+                            for e in roomEntrances ]
+        self.rightStops = [ tuple(c for c in self.hallStops if c > e) for e in roomEntrances ]
+
+        # For each room, indexed by the room's contents (its bits of the state
+        # shifted down), `entry` gives `(cell, steps)` for the deepest empty
+        # cell of a room that holds only amphipods that belong there and has
+        # space, and `exit` gives `(cell, steps, amphipod)` for the amphipod
+        # nearest the hallway of a room that holds any that do not belong.
+        # `steps` is the number of steps between the cell and the entrance.
+        # Only contents without gaps are listed, as no others can occur.
+        self.entry = [ ]
+        self.exit  = [ ]
+        for r in range(4):
+            own = r + 1
+            entry, exit = { }, { }
+            for empty in range(depth + 1):
+                for below in itertools.product(range(1, 5), repeat = depth - empty):
+                    contents = 0
+                    for k, amphipod in enumerate(below):
+                        contents |= amphipod << 3 * (empty + k)
+                    firstCell = hallLength + r * depth
+                    if all(amphipod == own for amphipod in below):
+                        if empty: entry[contents] = (firstCell + empty - 1, empty)
+                    else:
+                        exit[contents] = (firstCell + empty, empty + 1, below[0])
+            self.entry.append(entry)
+            self.exit.append(exit)
+
+        # `roomBound[r]`, indexed by the room's contents like `entry` and
+        # `exit`, is the part of the lower bound on the remaining energy
+        # contributed by room `r`: the energy for each amphipod in the room that
+        # must leave to reach its final position, plus the energy for moving
+        # amphipods into the room's unfilled cells from its entrance.
+        # `hallBound[cell][amphipod]` is the energy for an amphipod in a
+        # hallway cell to reach the entrance of its room.
+        self.roomBound = [ ]
+        for r in range(4):
+            own = r + 1
+            bound = { }
+            for contents in itertools.chain(self.entry[r], self.exit[r], [ self.roomContents(r) ]):
+                cells = [ (contents >> 3 * k) & 7 for k in range(depth) ]
+                settled = 0
+                while settled < depth and cells[depth - 1 - settled] == own:
+                    settled += 1
+                unfilled = depth - settled
+                energy = energyPerStep[own] * unfilled * (unfilled + 1) // 2
+                for k in range(unfilled):
+                    amphipod = cells[k]
+                    if not amphipod: continue
+                    hall = abs(roomEntrances[r] - roomEntrances[amphipod - 1]) or 2
+                    energy += energyPerStep[amphipod] * (k + 1 + hall)
+                bound[contents] = energy
+            self.roomBound.append(bound)
+        self.hallBound = [ [ 0 ] + [ energyPerStep[amphipod] *
+                                     abs(cell - roomEntrances[amphipod - 1])
+                                     for amphipod in range(1, 5) ]
+                           for cell in range(hallLength) ]
+
+        self.goal = self.pack("." * hallLength +
+                              "".join(symbols[r + 1] * depth for r in range(4)))
+
+    def roomContents(self, r):
+        """Return the contents of room `r` when it is full of its own type of
+        amphipod"""
+        return sum((r + 1) << 3 * k for k in range(self.depth))
+
+    def pack(self, mapStr):
+        """Return the packed state for the map string `mapStr`"""
+        assert(len(mapStr) == self.cells)
+        state = 0
+        for cell, symbol in enumerate(mapStr):
+            state |= symbols.index(symbol) << 3 * cell
+        return state
+
+    def unpack(self, state):
+        """Return the map string for the packed `state`"""
+        return "".join(symbols[(state >> 3 * cell) & 7] for cell in range(self.cells))
+
+    def inPlace(self, state):
+        """Return the number of amphipods that are in their final positions"""
+        count = 0
+        for r in range(4):
+            for k in range(self.depth - 1, -1, -1):
+                if (state >> (self.roomShift[r] + 3 * k)) & 7 != r + 1: break
+                count += 1
+        return count
+
+    def nobrainers(self, state, energy):
+        """Perform any "no-brainer" moves and return a tuple `(newState,
+        newEnergy)`.  A no-brainer is any move that will move an amphipod to
+        its final position, from another room or from the hallway."""
+        exits = self.exit
+        changes = True
+        while changes:
+            changes = False
+
+            for r in range(4):
+                # First, see if the room can accept an amphipod
+                found = self.entry[r].get((state >> self.roomShift[r]) & self.roomBits)
+                if not found: continue
+                dest, destSteps = found
+                destEntrance = roomEntrances[r]
+                amphipod = r + 1
+
+                # Next, look for a source, first among the other rooms, then in
+                # the hallway, whose path to the room is clear
+                source = None
+                for srcRoom in range(4):
+                    if srcRoom == r: continue
+                    found = exits[srcRoom].get((state >> self.roomShift[srcRoom]) &
+                                               self.roomBits)
+                    if not found or found[2] != amphipod: continue
+                    srcEntrance = roomEntrances[srcRoom]
+                    if state & self.betweenMask[srcEntrance][destEntrance]: continue
+                    source = (found[0], found[1] + abs(srcEntrance - destEntrance))
+                    break
+                if source is None:
+                    for src in range(hallLength):
+                        if (state >> 3 * src) & 7 != amphipod: continue
+                        if state & self.betweenMask[src][destEntrance]: continue
+                        source = (src, abs(src - destEntrance))
+                        break
+                if source is None: continue
+
+                src, steps = source
+                state = state & ~cellMask(src) | amphipod << 3 * dest
+                energy += (steps + destSteps) * energyPerStep[amphipod]
+                changes = True
+                break
+
+        return (state, energy)
+
+    def nextMoves(self, state):
+        """Return a list of `(newState, energy)` tuples for each state
+        reachable from `state` by moving an amphipod from a room into the
+        hallway, followed by any no-brainer moves"""
+        moves = [ ]
+        for r in range(4):
+            found = self.exit[r].get((state >> self.roomShift[r]) & self.roomBits)
+            if not found: continue
+            src, steps, amphipod = found
+            entrance = roomEntrances[r]
+            lifted = state & ~cellMask(src)
+            for stops in (self.leftStops[r], self.rightStops[r]):
+                for dest in stops:
+                    if (state >> 3 * dest) & 7: break  # Path is blocked
+                    moves.append(self.nobrainers(lifted | amphipod << 3 * dest,
+                                                 (steps + abs(entrance - dest)) *
+                                                 energyPerStep[amphipod]))
+        return moves
+
+    def lowerBound(self, state):
+        """Return a lower bound on the energy needed to organize the
+        amphipods in `state`, ignoring blocking.  The bound is consistent: no
+        move reduces it by more than the energy the move takes."""
+        bound = 0
+        for r in range(4):
+            bound += self.roomBound[r][(state >> self.roomShift[r]) & self.roomBits]
+        for cell in self.hallStops:
+            amphipod = (state >> 3 * cell) & 7
+            if amphipod: bound += self.hallBound[cell][amphipod]
+        return bound
+
+    def solve(self, mapStr, verbose = False, stats = None, heuristic = True):
+        """Return the minimum energy to organize the amphipods in the map
+        string `mapStr`.  If `verbose` is true, show the progress of the search
+        on the terminal.  If `stats` is a `SearchStats`, record the work done by
+        the search in it.  If `heuristic` is false, the search is Dijkstra's
+        algorithm rather than A* (e.g., to measure the effect of the bound)."""
+        reporter = None
+        if verbose:
+            total = 4 * self.depth
+            reporter = ProgressReporter("Organizing",
+                                        lambda s : f"{self.unpack(s)} has "
+                                                   f"{self.inPlace(s):2d}/{total} in place")
+        goal = self.goal
+        _, cost, _ = shortest_path.shortestPath(self.pack(mapStr), lambda s : s == goal,
+                                                self.nextMoves,
+                                                self.lowerBound if heuristic else None,
+                                                progress = reporter, stats = stats)
+        return cost
+
+# `Burrow`s already built, by room depth
+burrows = { }
+
+def burrowFor(depth):
+    """Return the `Burrow` whose rooms are `depth` cells deep"""
+    if depth not in burrows:
+        burrows[depth] = Burrow(depth)
+    return burrows[depth]
+
+def solve(mapStr, verbose = False, stats = None, heuristic = True):
+    """Return the minimum energy to organize the amphipods in the map string
+    `mapStr`, whose room depth is implied by its length.  The other arguments
+    are as for `Burrow.solve`."""
+    depth = (len(mapStr) - hallLength) // 4
+    return burrowFor(depth).solve(mapStr, verbose, stats, heuristic)
+
+def parse(infile, insertRows = ()):
+    """Read a burrow map from `infile` and return it as a map string.  The
+    rooms may have any number of rows.  The rows in `insertRows` (e.g.,
+    "  #D#C#B#A#") are inserted after the first row of the rooms, as for part
+    2 of the puzzle."""
+    it = iter(infile)
+    line = next(it)
+    assert(line.rstrip() == "#############")
+    line = next(it)
+    assert(line.rstrip() == "#...........#")
+    rows = [ next(it) ]
+    rows += insertRows
+    for line in it:
+        if line.strip() == "#########": break
+        rows.append(line)
+    mapStr = "." * hallLength
+    for entrance in roomEntrances:
+        mapStr += "".join(row[entrance + 1] for row in rows)
+    return mapStr
+
+def printMap(mapStr):
+    """Print the map string `mapStr` as a burrow diagram"""
+    depth = (len(mapStr) - hallLength) // 4
+    rooms = [ mapStr[hallLength + r * depth : hallLength + (r + 1) * depth]
+              for r in range(4) ]
+    print("#############")
+    print("#{}#".format(mapStr[:hallLength]))
+    print("###{}###".format("#".join(room[0] for room in rooms)))
+    for k in range(1, depth):
+        print("  #{}#".format("#".join(room[k] for room in rooms)))
+    print("  #########")
@@ -0,0 +1 @@
+../2022/automaton.py
\ No newline at end of file
@@ -0,0 +1,180 @@
+# Interval arithmetic module
+#
+# Closed integer intervals [lo, hi] with the arithmetic used to bound the
+# values of the ALU registers in the MONAD puzzles (puzzle 24).  `Interval` is
+# a single interval; `IntervalArray` holds many intervals as parallel numpy
+# arrays of lower and upper bounds, so that an operation can be applied to all
+# of them in one vectorized call.  Each operation computes its result from the
+# four combinations of operand bounds.  The code generated by *monad.py*
+# computes the same bounds, and uses `Interval` to fold constant operands;
+# puzzle24.2d1.py bounds all of the candidates for a digit at once with
+# `IntervalArray`.
+
+def div(a, b):
+    """Return a / b, rounded towards zero.  This function differs from // in
+    that the latter operator rounds towards negative."""
+
+    if (a < 0) != (b < 0):
+        return -(-a // b)
+    else:
+        return a // b
+
+class Interval:
+    """The closed interval of integers [lo, hi]"""
+
+    __slots__ = ('lo', 'hi')
+
+    def __init__(self, lo, hi = None):
+        if hi is None: hi = lo
+        assert(lo <= hi)
+        self.lo = lo
+        self.hi = hi
+
+    def __repr__(self):
+        return f"Interval({self.lo}, {self.hi})"
+
+    def __eq__(self, other):
+        return self.lo == other.lo and self.hi == other.hi
+
+    def __iter__(self):
+        return iter((self.lo, self.hi))
+
+    def contains(self, value):
+        return self.lo <= value <= self.hi
+
+    def add(self, b):
+        return Interval(self.lo + b.lo, self.hi + b.hi)
+
+    def mul(self, b):
+        results = (self.lo * b.lo, self.lo * b.hi, self.hi * b.lo, self.hi * b.hi)
+        return Interval(min(results), max(results))
+
+    def div(self, b):
+        """Truncating division.  `b` must not have zero as a bound."""
+        assert(b.lo != 0 and b.hi != 0)
+        results = (div(self.lo, b.lo), div(self.lo, b.hi),
+                   div(self.hi, b.lo), div(self.hi, b.hi))
+        return Interval(min(results), max(results))
+
+    def mod(self, b):
+        """Remainder.  The bounds of `b` must be positive."""
+        assert(b.lo > 0 and b.hi > 0)
+        results = (self.lo % b.lo, self.lo % b.hi, self.hi % b.lo, self.hi % b.hi)
+        return Interval(min(results), max(results))
+
+    def eql(self, b):
+        """[1, 1] if both intervals hold the same single value, [0, 0] if they
+        do not overlap, and [0, 1] otherwise."""
+        if self.hi < b.lo or self.lo > b.hi:
+            return Interval(0)
+        elif self.hi == b.lo and self.lo == b.hi:
+            return Interval(1)
+        else:
+            return Interval(0, 1)
+
+class IntervalArray:
+    """An array of closed intervals of integers, represented as parallel
+    int64 numpy arrays, `lo` and `hi`, of lower and upper bounds.  Operations
+    are element-wise; an operand may also be an `Interval` or an int, which is
+    applied to every element.  The bounds must stay within the range of int64,
+    which is checked for each multiplication."""
+
+    __slots__ = ('lo', 'hi')
+
+    def __init__(self, lo, hi = None):
+        import numpy as np
+        self.lo = np.asarray(lo, dtype = np.int64)
+        self.hi = self.lo if hi is None else np.asarray(hi, dtype = np.int64)
+
+    @classmethod
+    def full(cls, size, interval):
+        """Return an `IntervalArray` of `size` copies of `interval`"""
+        import numpy as np
+        return cls(np.full(size, interval.lo, dtype = np.int64),
+                   np.full(size, interval.hi, dtype = np.int64))
+
+    def __len__(self):
+        return len(self.lo)
+
+    def __getitem__(self, i):
+        return Interval(int(self.lo[i]), int(self.hi[i]))
+
+    def __repr__(self):
+        return f"IntervalArray({self.lo.tolist()}, {self.hi.tolist()})"
+
+    def contains(self, value):
+        """Return a boolean array indicating which intervals contain `value`"""
+        return (self.lo <= value) & (value <= self.hi)
+
+    @staticmethod
+    def _bounds(b):
+        if isinstance(b, int):
+            return (b, b)
+        return (b.lo, b.hi)
+
+    def _corners(self, b, op):
+        """Return the element-wise min and max of `op` applied to the four
+        combinations of the bounds of `self` and `b`"""
+        import numpy as np
+        bLo, bHi = self._bounds(b)
+        r1, r2 = op(self.lo, bLo), op(self.lo, bHi)
+        r3, r4 = op(self.hi, bLo), op(self.hi, bHi)
+        return IntervalArray(np.minimum(np.minimum(r1, r2), np.minimum(r3, r4)),
+                             np.maximum(np.maximum(r1, r2), np.maximum(r3, r4)))
+
+    def _pair(self, r1, r2):
+        """Return the intervals bounded by the element-wise min and max of
+        `r1` and `r2`.  Used when the other operand is a single value, so that
+        only two combinations of bounds need to be computed."""
+        import numpy as np
+        return IntervalArray(np.minimum(r1, r2), np.maximum(r1, r2))
+
+    def add(self, b):
+        bLo, bHi = self._bounds(b)
+        return IntervalArray(self.lo + bLo, self.hi + bHi)
+
+    def mul(self, b):
+        import numpy as np
+        if isinstance(b, int):
+            if b == 0:
+                return IntervalArray(np.zeros_like(self.lo))
+            assert(np.abs(self.lo).max() * float(abs(b)) < 2.0 ** 63 and
+                   np.abs(self.hi).max() * float(abs(b)) < 2.0 ** 63)
+            return self._pair(self.lo * b, self.hi * b)
+        bound = (np.maximum(np.abs(self.lo), np.abs(self.hi)).astype(float) *
+                 np.maximum(np.abs(b.lo), np.abs(b.hi)))
+        assert(np.all(bound < 2.0 ** 63))   # The products must not overflow
+        return self._corners(b, np.multiply)
+
+    @staticmethod
+    def _truncDiv(x, y):
+        import numpy as np
+        q = np.abs(x) // np.abs(y)
+        return np.where((x < 0) != (y < 0), -q, q)
+
+    def div(self, b):
+        """Truncating division.  `b` must not have zero as a bound."""
+        import numpy as np
+        if isinstance(b, int):
+            assert(b != 0)
+            if b == 1: return self
+            return self._pair(self._truncDiv(self.lo, b), self._truncDiv(self.hi, b))
+        assert(np.all(b.lo != 0) and np.all(b.hi != 0))
+        return self._corners(b, self._truncDiv)
+
+    def mod(self, b):
+        """Remainder.  The bounds of `b` must be positive."""
+        import numpy as np
+        if isinstance(b, int):
+            assert(b > 0)
+            return self._pair(self.lo % b, self.hi % b)
+        assert(np.all(b.lo > 0) and np.all(b.hi > 0))
+        return self._corners(b, np.mod)
+
+    def eql(self, b):
+        """Element-wise version of `Interval.eql`"""
+        import numpy as np
+        bLo, bHi = self._bounds(b)
+        disjoint = (self.hi < bLo) | (self.lo > bHi)
+        same     = (self.hi == bLo) & (self.lo == bHi)
+        return IntervalArray(same.astype(np.int64), (~disjoint).astype(np.int64))
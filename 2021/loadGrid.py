@@ -0,0 +1 @@
+../2022/loadGrid.py
\ No newline at end of file
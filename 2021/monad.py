@@ -0,0 +1,294 @@
+# MONAD compiler module
+#
+# Compiles an ALU program (puzzle 24) into Python functions that bound the
+# values of the registers with interval arithmetic.  The program is split into
+# blocks at its `inp` instructions: block 0 holds any instructions before the
+# first `inp`, and block `i` starts with the `i`-th `inp`.  Each block becomes
+# one generated function,
+#
+#     block(wLo, wHi, xLo, xHi, yLo, yHi, zLo, zHi, inLo, inHi)
+#
+# that takes the bounds of the registers and of the block's input and returns
+# the tuple of the 8 new register bounds, or `None` if the block divides by an
+# interval that has 0 as a bound, or takes the remainder by one that has a
+# non-positive bound.  If the input's bounds are given when the block is
+# compiled (e.g., [1, 9], for inputs that are not yet known), the function
+# takes only the register bounds.
+#
+# The body is straight-line code on local variables, one statement per
+# instruction at most.  While compiling, each bound of each register is
+# tracked as a `Bound`: the expression that computes it, which is an int if it
+# is a known constant (an operand, the input's bounds, or a bound computed from
+# constants), and the least and greatest values that it can have, if these are
+# known.  An operation on constant bounds is done once, by the `Interval`
+# operations, rather than every time the block is run; an operation by a
+# constant computes only the bounds that it needs; and `eql` is 0 without a
+# test if the limits show that its operands cannot overlap (e.g., `eql x w`
+# after `mod x 26` and `add x 15`, when w is an input digit).  Statements
+# whose results are not used are then dropped.  The bounds computed are the
+# same as those of the `Interval` operations.
+#
+# The generated source of each distinct block is compiled once and its code
+# object is kept in `codeCache`, so that identical blocks (or a program that is
+# compiled again) share it.
+
+import re
+
+from interval import Interval, div
+
+registerNames = "wxyz"
+boundNames    = tuple(r + suffix for r in registerNames for suffix in ("Lo", "Hi"))
+namePattern   = re.compile(r'\b(?:[wxyz]Lo|[wxyz]Hi|inLo|inHi)\b')
+
+# Code objects of the compiled blocks, keyed by their generated source
+codeCache = { }
+
+def parseBlocks(infile):
+    """Return the instructions in `infile` as a list of blocks, each a list of
+    `(opcode, target, source)` tuples, where `target` is a register name and
+    `source` is a register name, an int, or `None` (for `inp`)"""
+    blocks = [ [ ] ]
+    for instrStr in infile:
+        if not instrStr.strip(): continue
+        opcode, target, *operands = instrStr.split()
+        assert(target in registerNames)
+        source = None
+        if opcode == 'inp':
+            assert(not operands)
+            blocks.append([ ])
+        elif operands[0] in registerNames:
+            source = operands[0]
+        else:
+            source = int(operands[0])
+        blocks[-1].append((opcode, target, source))
+    return blocks
+
+class Bound:
+    """A bound of a register while compiling a block: the expression that
+    computes it (an int if it is a constant), and the least and most values
+    that it can have, or `None` if these are unknown"""
+
+    __slots__ = ('expr', 'least', 'most')
+
+    def __init__(self, expr, least = None, most = None):
+        if isinstance(expr, int): least = most = expr
+        self.expr  = expr
+        self.least = least
+        self.most  = most
+
+    def __str__(self):
+        return str(self.expr)
+
+    def constant(self):
+        return self.expr if isinstance(self.expr, int) else None
+
+    def limited(self):
+        return self.least is not None and self.most is not None
+
+def limitsOf(op, a, b):
+    """Return the least and most values of `op(x, y)` for `x` and `y` in the
+    ranges of the `Bound`s `a` and `b`, where `op` is monotonic in each
+    argument, or `(None, None)` if a range is unknown"""
+    if not (a.limited() and b.limited()): return (None, None)
+    values = [ op(x, y) for x in (a.least, a.most) for y in (b.least, b.most) ]
+    return (min(values), max(values))
+
+def truncDiv(x, c):
+    """Return the expression for `x / c`, rounded towards zero, for `c` > 0"""
+    return f"({x} // {c} if {x} >= 0 else -(-{x} // {c}))"
+
+class BlockCompiler:
+    """Generates the source of the function for one block"""
+
+    def __init__(self, inputBounds = None):
+        self.bounds = { r : (Bound(r + "Lo"), Bound(r + "Hi")) for r in registerNames }
+        if inputBounds:
+            self.input = tuple(Bound(bound) for bound in inputBounds)
+        else:
+            self.input = (Bound("inLo"), Bound("inHi"))
+        self.statements = [ ]  # Tuples `(code, defined names, used names)`
+        self.live = True       # False once the block always fails
+
+    def operand(self, operand):
+        """Return the `Bound`s of `operand`, a register name or an int"""
+        if isinstance(operand, str):
+            return self.bounds[operand]
+        return (Bound(operand), Bound(operand))
+
+    def emit(self, code, defines = ()):
+        """Append the statement `code` (which may be several lines, using the
+        temporaries p, q, r, and s), which assigns the names `defines`"""
+        uses = set(namePattern.findall(code.split(" = ", 1)[-1] if defines else code))
+        self.statements.append((code, set(defines), uses))
+
+    def assign(self, target, lo, hi, loLimits = (None, None), hiLimits = (None, None)):
+        """Append the code to set the bounds of `target` to the expressions
+        `lo` and `hi`, whose values are within `loLimits` and `hiLimits`"""
+        names = (target + "Lo", target + "Hi")
+        self.emit(f"{names[0]}, {names[1]} = {lo}, {hi}", names)
+        self.bounds[target] = (Bound(names[0], *loLimits), Bound(names[1], *hiLimits))
+
+    def copy(self, target, bounds):
+        """Set the bounds of `target` to `bounds`, appending the code to copy
+        them unless they are constants (a variable cannot be shared, as it may
+        be changed before `target` is used)"""
+        lo, hi = bounds
+        if lo.constant() is not None and hi.constant() is not None:
+            self.bounds[target] = bounds
+        else:
+            self.assign(target, lo, hi, (lo.least, lo.most), (hi.least, hi.most))
+
+    def corners(self, target, a, b, op, fn = None):
+        """Bound `target` by the min and max of the expression `op` (with
+        placeholders for its operands) applied to the four combinations of the
+        bounds `a` and `b`.  If `fn` is the monotonic function computed by
+        `op`, it is used to find the limits of the new bounds."""
+        names = (target + "Lo", target + "Hi")
+        self.emit("p, q, r, s = " + ", ".join(op.format(x, y) for x in a for y in b) + "\n"
+                  "if q < p: p, q = q, p\n"
+                  "if s < r: r, s = s, r\n"
+                  f"{names[0]}, {names[1]} = (p if p < r else r), (q if q > s else s)", names)
+        loLimits = hiLimits = (None, None)
+        if fn:
+            limits = [ limitsOf(fn, x, y) for x in a for y in b ]
+            if all(least is not None for least, most in limits):
+                loLimits = (min(l[0] for l in limits), min(l[1] for l in limits))
+                hiLimits = (max(l[0] for l in limits), max(l[1] for l in limits))
+        self.bounds[target] = (Bound(names[0], *loLimits), Bound(names[1], *hiLimits))
+
+    def fail(self):
+        self.emit("return None")
+        self.live = False
+
+    def fold(self, opcode, target, a, b):
+        """Set the bounds of `target` to `a opcode b`, for constants `a` and
+        `b`"""
+        if (opcode == 'div' and 0 in b) or (opcode == 'mod' and min(b) <= 0):
+            self.fail()
+            return
+        result = getattr(Interval(*a), opcode)(Interval(*b))
+        self.bounds[target] = (Bound(result.lo), Bound(result.hi))
+
+    def instruction(self, opcode, target, source):
+        """Append the code for one instruction"""
+        if opcode == 'inp':
+            self.copy(target, self.input)
+            return
+
+        a, b = self.operand(target), self.operand(source)
+        aLo, aHi = a
+        bLo, bHi = b
+        constants = [ bound.constant() for bound in a + b ]
+        if None not in constants:
+            self.fold(opcode, target, constants[:2], constants[2:])
+            return
+        aValue = constants[0] if constants[0] == constants[1] else None
+        bValue = constants[2] if constants[2] == constants[3] else None
+
+        if opcode == 'add':
+            if bValue == 0:
+                pass
+            elif aValue == 0:
+                self.copy(target, b)
+            else:
+                add = lambda x, y: x + y
+                self.assign(target, f"{aLo} + {bLo}", f"{aHi} + {bHi}",
+                            limitsOf(add, aLo, bLo), limitsOf(add, aHi, bHi))
+
+        elif opcode == 'mul':
+            if aValue == 0 or bValue == 0:
+                self.bounds[target] = (Bound(0), Bound(0))
+            elif bValue == 1:
+                pass
+            elif aValue == 1:
+                self.copy(target, b)
+            elif aValue is not None or bValue is not None:
+                (xLo, xHi), c = (b, aValue) if bValue is None else (a, bValue)
+                if c < 0: xLo, xHi = xHi, xLo
+                mul = lambda x, y: x * y
+                self.assign(target, f"{xLo} * {c}", f"{xHi} * {c}",
+                            limitsOf(mul, xLo, Bound(c)), limitsOf(mul, xHi, Bound(c)))
+            else:
+                self.corners(target, a, b, "{} * {}", lambda x, y: x * y)
+
+        elif opcode == 'div':
+            if bValue == 0:
+                self.fail()
+            elif bValue == 1:
+                pass
+            elif bValue is not None:
+                lo, hi = truncDiv(aLo, abs(bValue)), truncDiv(aHi, abs(bValue))
+                if bValue < 0: lo, hi = f"-{hi}", f"-{lo}"
+                self.assign(target, lo, hi)
+            else:
+                self.emit(f"if {bLo} == 0 or {bHi} == 0: return None")
+                self.corners(target, a, b, "div({}, {})")
+
+        elif opcode == 'mod':
+            if bValue is not None and bValue <= 0:
+                self.fail()
+            elif bValue is not None:
+                names = (target + "Lo", target + "Hi")
+                self.emit(f"p, q = {aLo} % {bValue}, {aHi} % {bValue}\n"
+                          f"{names[0]}, {names[1]} = (p, q) if p <= q else (q, p)", names)
+                limits = (0, bValue - 1)
+                self.bounds[target] = (Bound(names[0], *limits), Bound(names[1], *limits))
+            else:
+                self.emit(f"if {bLo} <= 0 or {bHi} <= 0: return None")
+                self.corners(target, a, b, "{} % {}")
+
+        elif opcode == 'eql':
+            if ((aHi.most is not None and bLo.least is not None and aHi.most < bLo.least) or
+                (aLo.least is not None and bHi.most is not None and aLo.least > bHi.most)):
+                self.bounds[target] = (Bound(0), Bound(0))  # Cannot overlap
+            else:
+                self.emit(f"{target}Lo, {target}Hi = ("
+                          f"(0, 0) if {aHi} < {bLo} or {aLo} > {bHi} else "
+                          f"(1, 1) if {aHi} == {bLo} and {aLo} == {bHi} else (0, 1))",
+                          (target + "Lo", target + "Hi"))
+                self.bounds[target] = (Bound(target + "Lo", 0, 1), Bound(target + "Hi", 0, 1))
+
+        else:
+            assert(False and 'Invalid opcode')
+
+    def source(self, name, block):
+        """Return the source of the function `name` for the instructions in
+        `block`"""
+        for opcode, target, source in block:
+            if not self.live: break
+            self.instruction(opcode, target, source)
+        if self.live:
+            self.emit("return (" + ", ".join(str(bound) for r in registerNames
+                                             for bound in self.bounds[r]) + ")")
+
+        # Drop the assignments whose results are not used, working backwards
+        needed = set()
+        body = [ ]
+        for code, defines, uses in reversed(self.statements):
+            if defines and not (defines & needed): continue
+            needed = (needed - defines) | uses
+            body.append(code)
+
+        parameters = list(boundNames)
+        if self.input[0].constant() is None:
+            parameters += [ "inLo", "inHi" ]
+        return (f"def {name}({', '.join(parameters)}):\n" +
+                "".join(f"    {line}\n" for code in reversed(body)
+                                            for line in code.split("\n")))
+
+def compileBlock(block, inputBounds = None):
+    """Return the generated function for the list of instructions `block`.
+    If `inputBounds` is a tuple `(lo, hi)`, it is the bounds of the input,
+    which the function does not take as arguments."""
+    source = BlockCompiler(inputBounds).source("block", block)
+    code = codeCache.get(source)
+    if code is None:
+        code = codeCache[source] = compile(source, "<monad block>", "exec")
+    namespace = { 'div' : div }
+    exec(code, namespace)
+    return namespace['block']
+
+def compileProgram(infile, inputBounds = None):
+    """Return the list of generated functions for the blocks of the program
+    in `infile`.  `inputBounds` is as for `compileBlock`."""
+    return [ compileBlock(block, inputBounds) for block in parseBlocks(infile) ]
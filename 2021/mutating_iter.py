@@ -86,13 +86,158 @@ class MutatingIterator:
     def skip_rest(self):
         """Skip the remaining elements in the iteration sequence."""
 
-        self.skip_t(len(self.theList))
+        self.skip_to(len(self.theList))
 
     def restart(self):
         """Restart the iteration from the beginning"""
 
         self.skip_to(0)
 
+class LinkedMutatingIterator:
+    """Alternative to `MutatingIterator` having the same interface, but backed
+    by an array-based doubly linked list instead of a Python list, so that
+    `append`, `insert`, `insert_after`, and `remove` (of one element) take
+    constant time regardless of the current position.  Operations that
+    address elements by index (`insert_at`, `skip_to`, and `skip`) must walk
+    the list and take time proportional to the distance walked.  Unlike
+    `MutatingIterator`, the list passed to the constructor is copied, not
+    modified; use `get_list` to retrieve the current contents."""
+
+    def __init__(self, lst):
+        # Node 0 is a sentinel that is both before the first element and after
+        # the last element.  Removed nodes are kept on a free list for reuse.
+        n = len(lst)
+        self.values = [ None ] + list(lst)
+        self.next   = list(range(1, n + 1)) + [ 0 ]
+        self.prev   = [ n ] + list(range(0, n))
+        self.free   = [ ]
+        self.size   = n
+        self.curr   = 0     # node last returned by __next__ (0 if none)
+
+    def __iter__(self):
+        return MutatingIteratorImp(self)
+
+    def __next__(self):
+        node = self.next[self.curr]
+        if node == 0:
+            raise StopIteration
+        self.curr = node
+        return self.values[node]
+
+    def __len__(self):
+        return self.size
+
+    def _link(self, val, before):
+        """Create a node holding `val` immediately before node `before`"""
+        if self.free:
+            node = self.free.pop()
+            self.values[node] = val
+        else:
+            node = len(self.values)
+            self.values.append(val)
+            self.next.append(0)
+            self.prev.append(0)
+        after = self.prev[before]
+        self.next[node]   = before
+        self.prev[node]   = after
+        self.next[after]  = node
+        self.prev[before] = node
+        self.size += 1
+
+    def _unlink(self, node):
+        """Remove `node` from the list and return the node that followed it"""
+        after, before = self.next[node], self.prev[node]
+        self.next[before] = after
+        self.prev[after]  = before
+        self.values[node] = None
+        self.free.append(node)
+        self.size -= 1
+        return after
+
+    def _nodeAt(self, index):
+        """Return the node at position `index`, walking from whichever end of
+        the list is closer.  An `index` of `len(self)` yields the sentinel."""
+        if index < 0:
+            index += self.size
+        assert(0 <= index <= self.size)
+        if index <= self.size // 2:
+            node = self.next[0]
+            for i in range(index):
+                node = self.next[node]
+        else:
+            node = 0
+            for i in range(self.size - index):
+                node = self.prev[node]
+        return node
+
+    def get_list(self):
+        """Returns a list of the elements being iterated on."""
+        result = [ ]
+        node = self.next[0]
+        while node != 0:
+            result.append(self.values[node])
+            node = self.next[node]
+        return result
+
+    def append(self, val):
+        """Appends to the *end* of the list. This call has no effect on the
+        current position. If the current position was previously at the end of
+        the list, then the next call to `__next__` will return the newly
+        inserted item."""
+        self._link(val, 0)
+
+    def insert(self, val):
+        """Inserts `val` before the current position. The newly inserted item
+        will not be iterated over."""
+        self._link(val, self.curr if self.curr else self.next[0])
+
+    def insert_after(self, val):
+        """Inserts `val` after the current position. The newly inserted item
+        will be seen next in the iteration order."""
+        self._link(val, self.next[self.curr])
+
+    def insert_at(self, index, val):
+        """Inserts `val` at the specified `index`.  If `index` is after the
+        current position, then `val` will eventually be iterated over;
+        otherwise it will not."""
+        if index < 0:
+            index = max(index + self.size, 0)
+        self._link(val, self._nodeAt(min(index, self.size)))
+
+    def remove(self, n = 1):
+        """Removes `n` elements (default 1) at the current position.
+        The current item is invalidated.  Iteration resumes after the last
+        deleted element."""
+        assert(self.curr != 0)
+        node, self.curr = self.curr, self.prev[self.curr]
+        for i in range(n):
+            assert(node != 0)
+            node = self._unlink(node)
+
+    def skip_to(self, pos):
+        """Skip to a specified position. `pos` is the index of the next
+        element to be traversed."""
+        self.curr = self.prev[self._nodeAt(pos)]
+
+    def skip(self, n = 1):
+        """Skips the next `n` elements (default 1) in the iteration
+        sequence.  If `n` is negative, then goes backwards in the iteration
+        sequence."""
+        for i in range(n):
+            self.curr = self.next[self.curr]
+            assert(self.curr != 0)
+        for i in range(-n):
+            assert(self.curr != 0)
+            self.curr = self.prev[self.curr]
+
+    def skip_rest(self):
+        """Skip the remaining elements in the iteration sequence."""
+        self.curr = self.prev[0]
+
+    def restart(self):
+        """Restart the iteration from the beginning"""
+        self.curr = 0
+
 def test():
     myList = list(range(10))
     mi = MutatingIterator(myList)
@@ -110,4 +255,25 @@ def test():
 
     print(myList)
 
+def benchmark(n = 200000):
+    """Compare the time taken by `MutatingIterator` and
+    `LinkedMutatingIterator` to iterate over `n` elements while removing
+    every other element and inserting a new element after every third."""
+    import time
+    for cls in (MutatingIterator, LinkedMutatingIterator):
+        mi = cls(list(range(n)))
+        start = time.perf_counter()
+        for v in mi:
+            if v < 0: continue
+            if v % 2:
+                mi.remove()
+            elif v % 3 == 0:
+                mi.insert_after(-v - 1)
+        elapsed = time.perf_counter() - start
+        remaining = mi.get_list()
+        print(f"{cls.__name__:>24}: {elapsed:8.4f}s, {len(remaining)} remaining")
+
 # test()
+
+if __name__ == "__main__":
+    benchmark()
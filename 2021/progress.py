@@ -0,0 +1,58 @@
+# Progress reporting module
+#
+# A throttled progress line for long searches.  The search calls `tick` once
+# per expanded state, which normally just increments a counter; the clock is
+# read only every so many ticks (calibrated so that it is read a few times per
+# update interval), and the line is redrawn at most `updatesPerSecond` times a
+# second.  The line shows the number of states expanded, the expansion rate,
+# the queue size, and the best cost so far.  If the output file is not a
+# terminal, the reporter is disabled and nothing is ever printed, so that
+# searches can skip calling `tick` altogether (see `enabled`).
+
+import sys
+import time
+
+class ProgressReporter:
+    """A progress line for a search, written to `file` (by default, stderr)
+    only if it is a terminal.  `label` starts the line and, if supplied,
+    `describe(node)` returns a description of the node being expanded, which
+    is appended to the line; it is called only when the line is redrawn."""
+
+    def __init__(self, label = "Search", describe = None, updatesPerSecond = 4,
+                 file = None):
+        self.file      = file or sys.stderr
+        self.enabled   = self.file.isatty()
+        self.label     = label
+        self.describe  = describe
+        self.interval  = 1 / updatesPerSecond
+        self.count     = 0                    # States expanded so far
+        self.nextCheck = 1                    # Count at which to read the clock
+        self.startTime = time.perf_counter()
+        self.nextDraw  = self.startTime + self.interval
+        self.width     = 0                    # Length of the line last drawn
+
+    def tick(self, queueSize, cost, node = None):
+        """Record the expansion of one state, `node`, having the specified
+        `cost`, leaving `queueSize` states queued, and redraw the progress line
+        if it is due"""
+        self.count += 1
+        if self.count < self.nextCheck: return
+        now = time.perf_counter()
+        rate = self.count / max(now - self.startTime, 1e-9)
+        self.nextCheck = self.count + max(1, int(rate * self.interval / 4))
+        if now < self.nextDraw: return
+        self.nextDraw = now + self.interval
+        line = (f"{self.label}: {self.count} expanded ({rate:.0f}/s), "
+                f"queue {queueSize}, cost {cost}")
+        if self.describe and node is not None:
+            line += f", {self.describe(node)}"
+        self._draw(line)
+
+    def done(self):
+        """Erase the progress line"""
+        if self.width: self._draw("")
+
+    def _draw(self, line):
+        print("\r" + line.ljust(self.width), end = "", file = self.file, flush = True)
+        if not line: print("\r", end = "", file = self.file, flush = True)
+        self.width = len(line)
@@ -2,14 +2,21 @@
 # Print the number of times the value of the input sequence increases over the
 # previous value.
 
-infile = open("puzzle1_input.txt", "r"); # Input sequence, one number per line
-sum = 0
-prev = int(infile.readline()) # First value
+def parse(infile):
+    """Return the list of numbers in `infile`, one number per line"""
+    return [ int(line) for line in infile ]
 
-for line in infile:
-    curr = int(line)
-    if curr > prev:
-        sum += 1
-    prev = curr
+def part1(depths):
+    sum = 0
+    prev = depths[0] # First value
 
-print(sum)
+    for curr in depths[1:]:
+        if curr > prev:
+            sum += 1
+        prev = curr
+
+    return sum
+
+if __name__ == "__main__":
+    infile = open("puzzle1_input.txt", "r"); # Input sequence, one number per line
+    print(part1(parse(infile)))
@@ -7,16 +7,13 @@
 # chunk-ending character.
 chunkDelimiters = "()[]{}<>"
 
-stack = [ ]  # Parse stack
-
-# Clear the stack.
+# Return a new, clear parse stack.
 def clearStack():
-    global stack
-    stack = [ 'x' ]  # Never empty. Popping the 'x' will result in a parse error
+    return [ 'x' ]  # Never empty. Popping the 'x' will result in a parse error
 
-# Consume the specified character. Return True if success, False on syntax error
-def consume(c):
-    global stack
+# Consume the specified character, using the parse `stack`. Return True if
+# success, False on syntax error
+def consume(stack, c):
     delimiterPos = chunkDelimiters.find(c)
     if delimiterPos < 0:
         return False
@@ -35,17 +32,30 @@ delimiterPoints = {
     '>' : 25137
     }
 
-infile = open("puzzle10_input.txt", "r")
-
-corrupt = 0
-points = 0
-for line in infile:
-    clearStack()
-    for c in line.rstrip():
-        if not consume(c):
-            # Corrupt line
-            corrupt += 1
-            points += delimiterPoints[c]
-            break
-
-print("Found {} corrupt lines totalling {} points".format(corrupt, points))
+# Return the list of lines in `infile`
+def parse(infile):
+    return [ line.rstrip() for line in infile ]
+
+# Return the number of corrupt lines and their total points
+def scoreCorrupt(lines):
+    corrupt = 0
+    points = 0
+    for line in lines:
+        stack = clearStack()
+        for c in line:
+            if not consume(stack, c):
+                # Corrupt line
+                corrupt += 1
+                points += delimiterPoints[c]
+                break
+    return (corrupt, points)
+
+def part1(lines):
+    corrupt, points = scoreCorrupt(lines)
+    return points
+
+if __name__ == "__main__":
+    infile = open("puzzle10_input.txt", "r")
+    corrupt, points = scoreCorrupt(parse(infile))
+
+    print("Found {} corrupt lines totalling {} points".format(corrupt, points))
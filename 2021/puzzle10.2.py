@@ -7,16 +7,13 @@
 # chunk-ending character.
 chunkDelimiters = "()[]{}<>"
 
-stack = [ ]  # Parse stack
-
-# Clear the stack.
+# Return a new, clear parse stack.
 def clearStack():
-    global stack
-    stack = [ 'x' ]  # Never empty. Popping the 'x' will result in a parse error
+    return [ 'x' ]  # Never empty. Popping the 'x' will result in a parse error
 
-# Consume the specified character. Return True if success, False on syntax error
-def consume(c):
-    global stack
+# Consume the specified character, using the parse `stack`. Return True if
+# success, False on syntax error
+def consume(stack, c):
     delimiterPos = chunkDelimiters.find(c)
     if delimiterPos < 0:
         return False
@@ -35,33 +32,47 @@ autocompletePoints = {
     '<' : 4
     }
 
-# Return the autocomplete score for the current line by popping the stack.
-def autocomplete():
+# Return the autocomplete score for the current line by popping the `stack`.
+def autocomplete(stack):
     score = 0
     while len(stack) > 1:
         c = stack.pop()
         score = score * 5 + autocompletePoints[c]
     return score
 
-infile = open("puzzle10_input.txt", "r")
+# Return the list of lines in `infile`
+def parse(infile):
+    return [ line.rstrip() for line in infile ]
+
+# Return the number of incomplete lines and the median of their autocomplete
+# scores
+def scoreIncomplete(lines):
+    corrupt = 0
+    incomplete = 0
+    points = [ ]
+    for line in lines:
+        stack = clearStack()
+        for c in line:
+            if not consume(stack, c):
+                # Corrupt line
+                corrupt += 1
+                stack = clearStack()
+                break
+        if len(stack) > 1:
+            incomplete += 1
+            points.append(autocomplete(stack))
+
+    assert(len(points) & 1)
+    points.sort()
+    med = points[len(points) >> 1]
+    return (incomplete, med)
 
-corrupt = 0
-incomplete = 0
-points = [ ]
-for line in infile:
-    clearStack()
-    for c in line.rstrip():
-        if not consume(c):
-            # Corrupt line
-            corrupt += 1
-            clearStack()
-            break
-    if len(stack) > 1:
-        incomplete += 1
-        points.append(autocomplete())
+def part2(lines):
+    incomplete, med = scoreIncomplete(lines)
+    return med
 
-assert(len(points) & 1)
-points.sort()
-med = points[len(points) >> 1]
+if __name__ == "__main__":
+    infile = open("puzzle10_input.txt", "r")
+    incomplete, med = scoreIncomplete(parse(infile))
 
-print("Found {} incomplete lines with median {} points".format(incomplete, med))
+    print("Found {} incomplete lines with median {} points".format(incomplete, med))
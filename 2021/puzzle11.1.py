@@ -1,19 +1,15 @@
 # Advent of Code day 11, part 1
 # How many octipus flashes
 
-grid = []
-
-# Increment every value in the grid
-def incrementValues():
-    global grid
+# Increment every value in the `grid`
+def incrementValues(grid):
     for row in grid:
         for j in range(len(row)):
             row[j] += 1
 
 # Increment every value surrounding `grid[i][j]`.  Do not increment values of
 # zero (which have already flashed this turn).
-def incrementSurrounding(i, j):
-    global grid
+def incrementSurrounding(grid, i, j):
     for x, y in [
             (i-1, j-1), (i-1, j  ), (i-1, j+1),
             (i  , j-1),             (i  , j+1),
@@ -24,22 +20,24 @@ def incrementSurrounding(i, j):
             grid[x][y] += 1
 
 # Flash cell at `(i, j)` and return number of cells flashed (i.e., 1)
-def flash(i, j):
+def flash(grid, i, j):
     grid[i][j] = 0
-    incrementSurrounding(i, j)
+    incrementSurrounding(grid, i, j)
     return 1
 
-infile = open("puzzle11_input.txt", "r")
-
-for line in infile:
-    grid.append(list(map(int, line.rstrip())))
-
-totalFlashes = 0
+# Return the grid of energy levels in `infile`
+def parse(infile):
+    grid = []
+    for line in infile:
+        grid.append(list(map(int, line.rstrip())))
+    return grid
 
-for step in range(100):
+# Run one step on `grid` and return the number of flashes
+def step(grid):
+    stepFlashes = 0
 
     # Phase a: Increment all of the values
-    incrementValues()
+    incrementValues(grid)
 
     # Phases b and c: Flash any values > 9 and set values to 0
     # Repeat so long as new flashes were detected
@@ -49,7 +47,20 @@ for step in range(100):
         for i in range(len(grid)):
             for j in range(len(grid[i])):
                 if grid[i][j] > 9:
-                    totalFlashes += flash(i, j)
+                    stepFlashes += flash(grid, i, j)
                     newFlashes = True
 
-print("Total flashes", totalFlashes)
+    return stepFlashes
+
+def part1(grid):
+    grid = [ list(row) for row in grid ]
+    totalFlashes = 0
+    for i in range(100):
+        totalFlashes += step(grid)
+    return totalFlashes
+
+if __name__ == "__main__":
+    infile = open("puzzle11_input.txt", "r")
+    totalFlashes = part1(parse(infile))
+
+    print("Total flashes", totalFlashes)
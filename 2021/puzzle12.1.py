@@ -63,7 +63,7 @@ class Path:
 # Read a graph, where each line represents an edge in the form 'cave1-cave2'.
 # The graph is represented as a dictionary mapping a cave name (the key) to a
 # list of adjacent caves (the value) reachable from that cave in one step.
-def readGraph(infile):
+def parse(infile):
     graph = { }
     for edge in infile:
         cave1, cave2 = edge.rstrip().split('-')
@@ -81,9 +81,9 @@ def readGraph(infile):
 
 # Recursively visit all caves reachable from `path` using the rules for cave
 # traversal.  Return the number of paths found that terminate at the the "end"
-# cave.
+# cave.  If `showPaths` is true, print each complete path as it is found.
 depth=0
-def visitPaths(graph, path):
+def visitPaths(graph, path, showPaths=False):
     global depth
     depth += 1
     if depth > 20:
@@ -96,18 +96,22 @@ def visitPaths(graph, path):
         if adjacent == "end":
             endCount += 1
             path = Path(adjacent, path)
-            print("Found path: ", path)
+            if showPaths: print("Found path: ", path)
         # Large caves have upper-case names; small caves have lowercase names.
         # Large cave; visit even if visited before on this path
         # Small cave; visit only if not visited before on this path
         elif adjacent.isupper() or not path.hasValue(adjacent):
-            endCount += visitPaths(graph, Path(adjacent, path))
+            endCount += visitPaths(graph, Path(adjacent, path), showPaths)
     depth -= 1
     return endCount
 
-infile = open("puzzle12_input.txt", "r")
+def part1(graph):
+    return visitPaths(graph, Path("start"))
 
-graph = readGraph(infile)
-count = visitPaths(graph, Path("start"))
+if __name__ == "__main__":
+    infile = open("puzzle12_input.txt", "r")
 
-print("Found {} paths".format(count))
+    graph = parse(infile)
+    count = visitPaths(graph, Path("start"), showPaths=True)
+
+    print("Found {} paths".format(count))
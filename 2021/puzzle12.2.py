@@ -8,6 +8,8 @@
 # If this implementation seems like overkill, it's because I was experimenting
 # with both iterators and linked lists in Python.
 
+from search_stats import SearchStats
+
 # Representation of a path (or partial path) through the graph.
 class Path:
     # Representation is a linked list. The `node` member is a tuple, `(val,
@@ -63,7 +65,7 @@ class Path:
 # Read a graph, where each line represents an edge in the form 'cave1-cave2'.
 # The graph is represented as a dictionary mapping a cave name (the key) to a
 # list of adjacent caves (the value) reachable from that cave in one step.
-def readGraph(infile):
+def parse(infile):
     graph = { }
     for edge in infile:
         cave1, cave2 = edge.rstrip().split('-')
@@ -82,10 +84,14 @@ def readGraph(infile):
 # Recursively visit all caves reachable from `path` using the rules for cave
 # traversal.  Return the number of paths found that terminate at the the "end"
 # cave.  `revisitSmall` is true if you are allowed to visit a small cave again.
+# If `stats` is a `SearchStats`, record the work done by the search in it.
 depth=0
-def visitPaths(graph, path, revisitSmall=True):
+def visitPaths(graph, path, revisitSmall=True, stats=None):
     global depth
     depth += 1
+    if stats:
+        stats.expanded += 1
+        stats.frontier(depth)
     if depth > 20:
         print("recursion exceeds 20 for path: ", path)
         print("Graph = ", graph)
@@ -93,27 +99,36 @@ def visitPaths(graph, path, revisitSmall=True):
     endCount = 0  # Number of complete paths found
     cave = path.lastValue()
     for adjacent in graph[cave]:
+        if stats: stats.generated += 1
         if adjacent == "end":
             endCount += 1
             path = Path(adjacent, path)
             # print("Found path: ", path)
         elif adjacent == "start":
-            pass
+            if stats: stats.pruned += 1
         # Large caves have upper-case names; small caves have lowercase names.
         # Large cave; visit even if visited before on this path
         # Small cave; visit only if not visited before on this path and
         # `revisitSmall` is True (meaning that a small cave was already visited
         # twice).
         elif adjacent.isupper() or not path.hasValue(adjacent):
-            endCount += visitPaths(graph, Path(adjacent, path), revisitSmall)
+            endCount += visitPaths(graph, Path(adjacent, path), revisitSmall, stats)
         elif revisitSmall:
-            endCount += visitPaths(graph, Path(adjacent, path), False)
+            endCount += visitPaths(graph, Path(adjacent, path), False, stats)
+        elif stats:
+            stats.pruned += 1
     depth -= 1
     return endCount
 
-infile = open("puzzle12_input.txt", "r")
+def part2(graph):
+    return visitPaths(graph, Path("start"))
+
+if __name__ == "__main__":
+    infile = open("puzzle12_input.txt", "r")
 
-graph = readGraph(infile)
-count = visitPaths(graph, Path("start"))
+    graph = parse(infile)
+    stats = SearchStats()
+    count = visitPaths(graph, Path("start"), stats=stats)
 
-print("Found {} paths".format(count))
+    print("Found {} paths".format(count))
+    stats.report()
@@ -45,14 +45,23 @@ def parseFold(line):
     assert(axis == 'x' or axis == 'y')
     return ( axis, int(val) )
 
-infile = open("puzzle13_input.txt", "r")
+# Read the dots and the fold instructions from `infile`.  Return the set of
+# dots and the list of folds.
+def parse(infile):
+    dots = readDots(infile)
+    folds = [ parseFold(line) for line in infile ]
+    return (dots, folds)
 
-# Set of dots on the sheet
-dots = readDots(infile)
+def part1(data):
+    dots, folds = data
 
-# Execute only the first fold
-line = infile.readline()
-axis, foldpos = parseFold(line)
-dots = fold(dots, axis, foldpos)
+    # Execute only the first fold
+    axis, foldpos = folds[0]
+    dots = fold(dots, axis, foldpos)
+    return len(dots)
 
-print("Unique dots = ", len(dots))
+if __name__ == "__main__":
+    infile = open("puzzle13_input.txt", "r")
+    uniqueDots = part1(parse(infile))
+
+    print("Unique dots = ", uniqueDots)
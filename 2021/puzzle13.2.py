@@ -45,33 +45,43 @@ def parseFold(line):
     assert(axis == 'x' or axis == 'y')
     return ( axis, int(val) )
 
-infile = open("puzzle13_input.txt", "r")
+# Read the dots and the fold instructions from `infile`.  Return the set of
+# dots and the list of folds.
+def parse(infile):
+    dots = readDots(infile)
+    folds = [ parseFold(line) for line in infile ]
+    return (dots, folds)
 
-# Set of dots on the sheet
-dots = readDots(infile)
+# Execute all the folds and return the rows of the resulting grid, as a
+# string.  A pattern of letters should emerge.
+def part2(data):
+    dots, folds = data
 
-# Execute all the folds
-for line in infile:
-    axis, foldpos = parseFold(line)
-    # print("fold along {}={}".format(axis, foldpos))
-    dots = fold(dots, axis, foldpos)
-    if axis == 'x':
-        maxX = foldpos
-    else:
-        maxY = foldpos
+    # Execute all the folds
+    for axis, foldpos in folds:
+        # print("fold along {}={}".format(axis, foldpos))
+        dots = fold(dots, axis, foldpos)
+        if axis == 'x':
+            maxX = foldpos
+        else:
+            maxY = foldpos
+
+    # print("maxX = {}, maxY = {}".format(maxX, maxY))
+
+    # Create a grid big enough to hold the folded paper.
+    # Fill it with space characters.
+    grid = [ ]
+    for y in range(maxY):
+        grid.append(list(map(lambda x : ' ', range(maxX))))
 
-# print("maxX = {}, maxY = {}".format(maxX, maxY))
+    # Mark every grid position that has a dot
+    for x, y in dots:
+        grid[y][x] = '#'
 
-# Create a grid big enough to hold the folded paper.
-# Fill it with space characters.
-grid = [ ]
-for y in range(maxY):
-    grid.append(list(map(lambda x : ' ', range(maxX))))
+    return "\n".join("".join(row) for row in grid)
 
-# Mark every grid position that has a dot
-for x, y in dots:
-    grid[y][x] = '#'
+if __name__ == "__main__":
+    infile = open("puzzle13_input.txt", "r")
 
-# Print the resulting grid.  A pattern of letters should emerge.
-for row in grid:
-    print("".join(row))
+    # Print the resulting grid.
+    print(part2(parse(infile)))
@@ -1,17 +1,17 @@
 # Advent of Code day 14, part 1
 # Quantities of polymer elements
 
-# Map an element pair to the element to insert between them.
-pairInsertions  = { }
-
+# Return a map of an element pair to the element to insert between them.
 def readPairInsertions(infile):
+    pairInsertions  = { }
     for line in infile:
         pair, inelem = line.rstrip().split(" -> ")
         pairInsertions[pair] = inelem
+    return pairInsertions
 
 # Insert new element between the elements of each overlapping pair in `polymer`
-# and return the result.
-def insertElements(polymer):
+# using the rules in `pairInsertions` and return the result.
+def insertElements(pairInsertions, polymer):
     result = polymer[0]
     for i in range(0, len(polymer) - 1):
         pair = polymer[i:i+2]
@@ -19,27 +19,40 @@ def insertElements(polymer):
         result += inelem + pair[1]
     return result
 
-infile = open("puzzle14_input.txt", "r")
-
-template = infile.readline().rstrip()
-assert('\n' == infile.readline())  # Consume blank like
-readPairInsertions(infile)
-
-# Apply pair insertion 10 times
-polymer = template
-for i in range(10):
-    polymer = insertElements(polymer)
-    # print("After set {}: {} ".format(i + 1, polymer))
-
-# Count min and max
-elements = set(iter(polymer))
-minCount = len(polymer)
-maxCount = 0
-for element in elements:
-    count = polymer.count(element)
-    print("count of '{}' = {}".format(element, count))
-    if count < minCount: minCount = count
-    if count > maxCount: maxCount = count
-
-print("length = {}, min count = {}, max count = {}".format(len(polymer), minCount, maxCount))
-print("maxCount - minCount = ", maxCount - minCount)
+# Return the template and the pair insertions in `infile`
+def parse(infile):
+    template = infile.readline().rstrip()
+    assert('\n' == infile.readline())  # Consume blank like
+    return (template, readPairInsertions(infile))
+
+# Return the polymer after applying pair insertion 10 times
+def grow(template, pairInsertions):
+    polymer = template
+    for i in range(10):
+        polymer = insertElements(pairInsertions, polymer)
+        # print("After set {}: {} ".format(i + 1, polymer))
+    return polymer
+
+# Return a list of (element, count) for the elements in `polymer`
+def countElements(polymer):
+    elements = set(iter(polymer))
+    return [ (element, polymer.count(element)) for element in elements ]
+
+def part1(data):
+    counts = [ count for element, count in countElements(grow(*data)) ]
+    return max(counts) - min(counts)
+
+if __name__ == "__main__":
+    infile = open("puzzle14_input.txt", "r")
+    polymer = grow(*parse(infile))
+
+    # Count min and max
+    minCount = len(polymer)
+    maxCount = 0
+    for element, count in countElements(polymer):
+        print("count of '{}' = {}".format(element, count))
+        if count < minCount: minCount = count
+        if count > maxCount: maxCount = count
+
+    print("length = {}, min count = {}, max count = {}".format(len(polymer), minCount, maxCount))
+    print("maxCount - minCount = ", maxCount - minCount)
@@ -2,13 +2,13 @@
 # Quantities of polymer elements after 40 steps
 
 # Given an insertion rule `AB -> C`, map the initial pair to two pairs:
-# `AB -> [ AC, CB ]`
-pairSplits = { }
-
+# `AB -> [ AC, CB ]`.  Return the map of these splits.
 def readPairSplits(infile):
+    pairSplits = { }
     for line in infile:
         pair, inelem = line.rstrip().split(" -> ")
         pairSplits[pair] = [ pair[0] + inelem, inelem + pair[1] ]
+    return pairSplits
 
 # Increment `dict[key]` by `incr`.  If `dict[key]` doesn't already exist, set
 # it to `0` before incrementing it.
@@ -17,8 +17,8 @@ def incrementKey(dict, key, incr=1):
 
 # Logically insert a new element between the elements of each overlapping pair
 # in `pairFrequencies`, which maps each letter pair to the frequency it occurs
-# in the polymer. Return the result.
-def insertElements(pairFrequencies):
+# in the polymer, using the splits in `pairSplits`. Return the result.
+def insertElements(pairSplits, pairFrequencies):
     result = { }
     for pair, freq in pairFrequencies.items():
         split1, split2 = pairSplits[pair]
@@ -40,30 +40,42 @@ def countFrequencies(pairFrequencies, template):
         result[letter] >>= 1
     return result
 
-infile = open("puzzle14_input.txt", "r")
+# Return the template and the pair splits in `infile`
+def parse(infile):
+    template = infile.readline().rstrip()
+    assert('\n' == infile.readline())  # Consume blank like
+    return (template, readPairSplits(infile))
+
+# Return a map of single letters to frequencies after applying pair insertion
+# 40 times
+def grow(template, pairSplits):
+    pairFrequencies = { }
+    for i in range(len(template) - 1):
+        pair = template[i : i + 2]
+        incrementKey(pairFrequencies, pair)
+    # print("initial pair frequencies = ", pairFrequencies)
+
+    # Apply pair insertion 40 times
+    for i in range(40):
+        pairFrequencies = insertElements(pairSplits, pairFrequencies)
+        # print("After set {}: {} ".format(i + 1, pairFrequencies))
 
-template = infile.readline().rstrip()
-assert('\n' == infile.readline())  # Consume blank like
-readPairSplits(infile)
+    return countFrequencies(pairFrequencies, template)
 
-pairFrequencies = { }
-for i in range(len(template) - 1):
-    pair = template[i : i + 2]
-    incrementKey(pairFrequencies, pair)
-# print("initial pair frequencies = ", pairFrequencies)
+def part2(data):
+    counts = grow(*data).values()
+    return max(counts) - min(counts)
 
-# Apply pair insertion 40 times
-for i in range(40):
-    pairFrequencies = insertElements(pairFrequencies)
-    # print("After set {}: {} ".format(i + 1, pairFrequencies))
+if __name__ == "__main__":
+    infile = open("puzzle14_input.txt", "r")
 
-# Count min and max
-minCount = 0
-maxCount = 0
-for element, count in countFrequencies(pairFrequencies, template).items():
-    print("count of '{}' = {}".format(element, count))
-    if minCount == 0 or count < minCount: minCount = count
-    if count > maxCount: maxCount = count
+    # Count min and max
+    minCount = 0
+    maxCount = 0
+    for element, count in grow(*parse(infile)).items():
+        print("count of '{}' = {}".format(element, count))
+        if minCount == 0 or count < minCount: minCount = count
+        if count > maxCount: maxCount = count
 
-print("min count = {}, max count = {}".format(minCount, maxCount))
-print("maxCount - minCount = ", maxCount - minCount)
+    print("min count = {}, max count = {}".format(minCount, maxCount))
+    print("maxCount - minCount = ", maxCount - minCount)
@@ -3,16 +3,12 @@
 
 import sys
 
-riskLevels = [ ]
-
-# Lowest risk for any path found for a specific grid square
-lowestRiskGrid = [ ]
-
 # Read a 2-D array of risk levels, each in the range 0-9 and return the array.
-def readRiskLevels(infile):
+def parse(infile):
+    riskLevels = [ ]
     for rowStr in infile:
         riskLevels.append(list(map(int, iter(rowStr.rstrip()))))
-        lowestRiskGrid.append(list(map(lambda x : sys.maxsize, riskLevels[0])))
+    return riskLevels
 
 # Representation of a path (or partial path) through the cave along with the
 # risk so far.
@@ -42,7 +38,8 @@ class Path:
                 self.path = self.path.link
                 return coord
 
-    def __init__(self, x, y, link=None):
+    # `riskLevels` is the 2-D array of risk levels of the cave
+    def __init__(self, riskLevels, x, y, link=None):
         self.x    = x
         self.y    = y
         self.risk = link.risk + riskLevels[x][y] if link else 0
@@ -66,15 +63,10 @@ class Path:
     def lastCoord(self):
         return (self.x, self.y)
 
-# List of paths to be explored. The main loop will pop the least-risky path off
-# this queue and traverse another level.
-workQueue = [ ]
-
 # If path leads to the exit cell, then stop and return True.
-# Otherwise, push all possible next steps onto `workQueue`
-def advancePath(path):
-    global workQueue
-    global lowestRiskGrid
+# Otherwise, push all possible next steps onto `workQueue`.  `lowestRiskGrid`
+# holds the lowest risk for any path found for each grid square.
+def advancePath(riskLevels, lowestRiskGrid, workQueue, path):
     # print("advancePath({})".format(path))
     maxX = len(riskLevels) - 1
     maxY = len(riskLevels[0]) - 1
@@ -90,31 +82,46 @@ def advancePath(path):
         if x1 < 0 or maxX < x1 or y1 < 0 or maxY < y1:
             continue
         else:
-            newPath = Path(x1, y1, path)
+            newPath = Path(riskLevels, x1, y1, path)
             workQueue.append(newPath)
     return False
 
-infile = open("puzzle15_input.txt", "r")
-
-readRiskLevels(infile)
-infile.close()
-# print(riskLevels)
-
-# pathsFound = 0
-bestPath = None
-workQueue = [ Path(0, 0) ]
-while workQueue:
-    # Sort work queue so that the least risky path so far will be popped first.
-    # That way, we are always exploring the frontier of the least-risky paths.
-    workQueue.sort(key = lambda p : p.risk, reverse = True)
-    # Depth-first search, descend down one path
-    nextPath = workQueue.pop()
-    if advancePath(nextPath):
-        bestPath = nextPath
-        # pathsFound += 1
-        # print("\rPaths = {}, risk = {}  ".format(pathsFound, bestPath.risk), end='')
-        # print("Found path {}, with risk {}".format(bestPath, bestPath.risk))
-        break
-
-print("\nBest path =", bestPath)
-print("Lowest risk =", bestPath.risk)
+# Return the least risky path from the top-left to the bottom-right corner of
+# the cave
+def findBestPath(riskLevels):
+    # Lowest risk for any path found for a specific grid square
+    lowestRiskGrid = [ [ sys.maxsize ] * len(row) for row in riskLevels ]
+
+    # List of paths to be explored. The main loop will pop the least-risky
+    # path off this queue and traverse another level.
+    # pathsFound = 0
+    bestPath = None
+    workQueue = [ Path(riskLevels, 0, 0) ]
+    while workQueue:
+        # Sort work queue so that the least risky path so far will be popped first.
+        # That way, we are always exploring the frontier of the least-risky paths.
+        workQueue.sort(key = lambda p : p.risk, reverse = True)
+        # Depth-first search, descend down one path
+        nextPath = workQueue.pop()
+        if advancePath(riskLevels, lowestRiskGrid, workQueue, nextPath):
+            bestPath = nextPath
+            # pathsFound += 1
+            # print("\rPaths = {}, risk = {}  ".format(pathsFound, bestPath.risk), end='')
+            # print("Found path {}, with risk {}".format(bestPath, bestPath.risk))
+            break
+    return bestPath
+
+def part1(riskLevels):
+    return findBestPath(riskLevels).risk
+
+if __name__ == "__main__":
+    infile = open("puzzle15_input.txt", "r")
+
+    riskLevels = parse(infile)
+    infile.close()
+    # print(riskLevels)
+
+    bestPath = findBestPath(riskLevels)
+
+    print("\nBest path =", bestPath)
+    print("Lowest risk =", bestPath.risk)
@@ -2,141 +2,147 @@
 # Least risky path through tiled cave
 
 import sys
-
-tile = [ ]
-tileRows = 1
-tileCols = 1
-caveRows = 0
-caveCols = 0
-
-# Lowest known risk for any path found for a specific grid square
-lowestKnownRisk = [ ]
-
-# Return risk for cave cell (x, y)
-def getRisk(x, y):
-    risk = tile[x % tileRows][y % tileCols]
-    risk += int(x / tileRows) + int(y / tileCols)
-    return (risk - 1) % 9 + 1
+import shortest_path
+from progress import ProgressReporter
+from search_stats import SearchStats
+
+# Caves with more cells than this are searched with `LazyRiskGrid` and
+# `shortest_path.BlockArray` rather than with flat arrays of the whole cave.
+denseCellLimit = 2**24
+
+# A cave made of `tiles` x `tiles` copies of a tile of risk levels.  The risk
+# levels increase by one (wrapping from 9 back to 1) for each tile to the
+# right or down.
+class Cave:
+    def __init__(self, tile, tiles):
+        self.tile     = tile
+        self.tileRows = len(tile)
+        self.tileCols = len(tile[0])
+        self.caveRows = self.tileRows * tiles
+        self.caveCols = self.tileCols * tiles
+
+    # Return risk for cave cell (x, y)
+    def getRisk(self, x, y):
+        risk = self.tile[x % self.tileRows][y % self.tileCols]
+        risk += int(x / self.tileRows) + int(y / self.tileCols)
+        return (risk - 1) % 9 + 1
+
+    # Return the cells adjacent to cell (x, y) along with the risk of entering each
+    def neighbors(self, cell):
+        x, y = cell
+        for x1, y1 in [ (x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1) ]:
+            if 0 <= x1 < self.caveRows and 0 <= y1 < self.caveCols:
+                yield ((x1, y1), self.getRisk(x1, y1))
+
+    # Lower bound on the risk from cell (x, y) to the exit cell: every step costs
+    # at least 1.
+    def minRiskToExit(self, cell):
+        x, y = cell
+        return (self.caveRows - 1 - x) + (self.caveCols - 1 - y)
+
+    # Return the risk levels of the whole cave as a flat `bytes` object, in
+    # which the risk of cell (x, y) is at index `x * caveCols + y`.  Each row
+    # is built by joining the possible increments of its tile row, of which
+    # there are 9 at most (only 1 for a single tile).
+    def riskGrid(self):
+        tiles = self.caveCols // self.tileCols
+        increments = min(9, 2 * tiles - 1)
+        shifted = [ [ bytes((risk + k - 1) % 9 + 1 for risk in tileRow)
+                      for k in range(increments) ] for tileRow in self.tile ]
+        rows = [ ]
+        for x in range(self.caveRows):
+            increments = shifted[x % self.tileRows]
+            tileDown = x // self.tileRows
+            rows.append(b"".join(increments[(tileDown + j) % 9] for j in range(tiles)))
+        return b"".join(rows)
+
+    # Return the lowest total risk of any path from the top-left to the
+    # bottom-right corner of the cave, and the path itself if `wantPath` is
+    # true (else `None`).  By default, the search is Dial's algorithm over the
+    # flat risk grid or, if the cave has more than `denseCellLimit` cells (or
+    # `lazy` is true), over a `LazyRiskGrid`, with the search state allocated
+    # in blocks only where the search goes.  If `method` is "astar", the
+    # search is A* over `neighbors`.  If `verbose` is true, the progress of
+    # the search is shown on the terminal.  If `stats` is a
+    # `SearchStats`, record the work done by the search in it.
+    def bestPath(self, verbose = False, stats = None, method = "dial", wantPath = True,
+                 lazy = None):
+        reporter = ProgressReporter("Searching") if verbose else None
+        if method == "dial":
+            exitCell = self.caveRows * self.caveCols - 1
+            if lazy is None: lazy = exitCell + 1 > denseCellLimit
+            if lazy:
+                risks, store = LazyRiskGrid(self), shortest_path.BlockArray
+            else:
+                risks, store = self.riskGrid(), shortest_path.denseArray
+            lowestRisk, predecessor = shortest_path.gridShortestPath(
+                risks, self.caveCols, 0, exitCell, stats = stats, store = store,
+                progress = reporter, wantPath = wantPath)
+            bestPath = None
+            if wantPath:
+                bestPath = shortest_path.gridPath(predecessor, self.caveCols, exitCell)
+            return (lowestRisk, bestPath)
+
+        assert(method == "astar")
+        exitCell = (self.caveRows - 1, self.caveCols - 1)
+        _, lowestRisk, bestPath = shortest_path.shortestPath((0, 0),
+                                                             lambda cell : cell == exitCell,
+                                                             self.neighbors,
+                                                             self.minRiskToExit,
+                                                             wantPath = wantPath,
+                                                             progress = reporter,
+                                                             stats = stats)
+        return (lowestRisk, bestPath)
+
+# The risk levels of a `Cave`, indexed like `Cave.riskGrid()` by
+# `x * caveCols + y`, but computed on demand from the 9 possible increments of
+# the base tile, so that no memory is used for the cave as a whole.
+class LazyRiskGrid:
+    def __init__(self, cave):
+        self.tileRows = cave.tileRows
+        self.tileCols = cave.tileCols
+        self.caveCols = cave.caveCols
+        self.cells    = cave.caveRows * cave.caveCols
+        self.tiles    = [ bytes((risk + k - 1) % 9 + 1 for row in cave.tile for risk in row)
+                          for k in range(9) ]
+
+    def __len__(self):
+        return self.cells
+
+    def __getitem__(self, cell):
+        x, y = divmod(cell, self.caveCols)
+        tileDown, r = divmod(x, self.tileRows)
+        tileRight, c = divmod(y, self.tileCols)
+        return self.tiles[(tileDown + tileRight) % 9][r * self.tileCols + c]
 
 # Read a 2-D array of risk levels, each in the range 0-9 and return the array.
-def readRiskLevels(infile):
-    global tileRows, tileCols, caveRows, caveCols, tile, lowestKnownRisk
+def parse(infile):
+    tile = [ ]
     for rowStr in infile:
         tile.append(list(map(int, iter(rowStr.rstrip()))))
-    tileRows = len(tile)
-    tileCols = len(tile[0])
-    caveRows = tileRows * 5
-    caveCols = tileCols * 5
-    # Fill `lowestKnownRisk` with `sys.maxsize` values.
-    maxsizeRow = list(map(lambda x : sys.maxsize, range(caveCols)))
-    lowestKnownRisk = list(map(lambda x : maxsizeRow.copy(), range(caveRows)))
-    assert(len(lowestKnownRisk) == caveRows)
-    assert(len(lowestKnownRisk[0]) == caveCols)
-
-# Representation of a path (or partial path) through the cave along with the
-# risk so far.
-class Path:
-    # Representation is a linked list from the end of the path to the beginning.
-    x     : 0    # x coordinate of last cell in path
-    y     : 0    # y coordinate of last cell in path
-    risk  : 0    # Total risk of path so far
-    link  : None # Link to rest of path
-
-    # Iterate (in reverse order) over the values in the path
-    class Iterator:
-
-        path : None
-
-        def __init__(self, path):
-            self.path = path
-
-        def __iter__(self):
-            return self
-
-        def __next__(self):
-            if self.path == None:
-                raise StopIteration
-            else:
-                coord = self.path.lastCoord()
-                self.path = self.path.link
-                return coord
-
-    def __init__(self, x, y, link=None):
-        self.x    = x
-        self.y    = y
-        self.risk = link.risk + getRisk(x, y) if link else 0
-        self.link = link
-
-    def __iter__(self):
-        return Path.Iterator(self)
-
-    # Represent the path as a list (in forward order) of coordinates
-    def __repr__(self):
-        return str(list(reversed(list(iter(self)))))
-
-    # Return `True` if `(x, y)` exists in this path; else `False`
-    def hasCoord(self, x, y):
-        for c in self:
-            if c == (x, y):
-                return True
-        return False
-
-    # Return the last coordinate in the path
-    def lastCoord(self):
-        return (self.x, self.y)
-
-# List of paths to be explored. The main loop will pop the least-risky path off
-# this queue and traverse another level.
-workQueue = [ ]
-
-# If path leads to the exit cell, then stop and return True.
-# Otherwise, push all possible next steps onto `workQueue`
-def advancePath(path):
-    # print("advancePath({})".format(path))
-    global lowestKnownRisk
-    x = path.x
-    y = path.y
-    if path.risk < lowestKnownRisk[x][y]:
-        lowestKnownRisk[x][y] = path.risk
-    else:
-        return False  # Stop searching this path; riskier than best path so far
-    if x == caveRows - 1 and y == caveCols - 1:
-        return True
-    for x1, y1 in [ (x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1) ]:
-        if x1 < 0 or caveRows <= x1 or y1 < 0 or caveCols <= y1:
-            continue
-        else:
-            newPath = Path(x1, y1, path)
-            workQueue.append(newPath)
-    return False
-
-infile = open("puzzle15_input.txt", "r")
-readRiskLevels(infile)
-infile.close()
-# print(tile)
-
-print("caveRows = {}, caveCols = {}".format(caveRows, caveCols))
-
-# pathsFound = 0
-bestPath = None
-workQueue = [ Path(0, 0) ]
-oldFrontier = (0, 0)
-while workQueue:
-    # Sort work queue so that the least risky path so far will be popped first.
-    # That way, we are always exploring the frontier of the least-risky paths.
-    workQueue.sort(key = lambda p : p.risk, reverse = True)
-    # Depth-first search, descend down one path
-    nextPath = workQueue.pop()
-    if nextPath.x + nextPath.y > oldFrontier[0] + oldFrontier[1]:
-        # Display progress when the New York distance from origin increases
-        print("\rFrontier = ({}, {})      ".format(nextPath.x, nextPath.y), end='')
-        oldFrontier = (nextPath.x, nextPath.y)
-    if advancePath(nextPath):
-        bestPath = nextPath
-        # pathsFound += 1
-        # print("\rPaths = {}, risk = {}  ".format(pathsFound, bestPath.risk), end='')
-        # print("Found path {}, with risk {}".format(bestPath, bestPath.risk))
-        break
-
-print("\nBest path =", bestPath)
-print("Lowest risk =", bestPath.risk)
+    return tile
+
+def part2(tile):
+    lowestRisk, bestPath = Cave(tile, 5).bestPath(wantPath = False)
+    return lowestRisk
+
+if __name__ == "__main__":
+    # Optional argument: the number of tiles across and down (default 5)
+    tiles = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    infile = open("puzzle15_input.txt", "r")
+    tile = parse(infile)
+    infile.close()
+    # print(tile)
+
+    cave = Cave(tile, tiles)
+    print("caveRows = {}, caveCols = {}".format(cave.caveRows, cave.caveCols))
+
+    # The path through a very large cave is too long to be worth printing
+    wantPath = cave.caveRows * cave.caveCols <= denseCellLimit
+    stats = SearchStats()
+    lowestRisk, bestPath = cave.bestPath(verbose = True, stats = stats, wantPath = wantPath)
+
+    if bestPath: print("\nBest path =", bestPath)
+    print("Lowest risk =", lowestRisk)
+    stats.report()
@@ -90,11 +90,20 @@ def recursivelyAddVersions(packet):
             sum += recursivelyAddVersions(subpacket)
     return sum
 
-infile = open("puzzle16_input.txt", "r")
-
-for hexstr in infile:
-    print(hexstr, end='')
-    bs = BitStream(hexstr.rstrip())
-    packet = Packet(bs)
-    print(packet)
-    print("versions =", recursivelyAddVersions(packet))
+# Return the list of hex strings in `infile`, one packet per line
+def parse(infile):
+    return [ hexstr.rstrip() for hexstr in infile ]
+
+def part1(hexstrings):
+    return [ recursivelyAddVersions(Packet(BitStream(hexstr)))
+             for hexstr in hexstrings ]
+
+if __name__ == "__main__":
+    infile = open("puzzle16_input.txt", "r")
+
+    for hexstr in parse(infile):
+        print(hexstr)
+        bs = BitStream(hexstr)
+        packet = Packet(bs)
+        print(packet)
+        print("versions =", recursivelyAddVersions(packet))
@@ -104,11 +104,19 @@ class Packet:
             ret = op(ret, v.eval())
         return ret
 
-infile = open("puzzle16_input.txt", "r")
-
-for hexstr in infile:
-    print(hexstr, end='')
-    bs = BitStream(hexstr.rstrip())
-    packet = Packet(bs)
-    print(packet)
-    print("Evaluate to", packet.eval())
+# Return the list of hex strings in `infile`, one packet per line
+def parse(infile):
+    return [ hexstr.rstrip() for hexstr in infile ]
+
+def part2(hexstrings):
+    return [ Packet(BitStream(hexstr)).eval() for hexstr in hexstrings ]
+
+if __name__ == "__main__":
+    infile = open("puzzle16_input.txt", "r")
+
+    for hexstr in parse(infile):
+        print(hexstr)
+        bs = BitStream(hexstr)
+        packet = Packet(bs)
+        print(packet)
+        print("Evaluate to", packet.eval())
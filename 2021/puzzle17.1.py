@@ -48,27 +48,43 @@ def testComputePos(xi, yi):
 
 
 
+# Parse a target area of the form "target area: x=20..30, y=-10..-5" from
+# `infile` and return it as a tuple (xmin, xmax, ymin, ymax).  There is no
+# input file for this puzzle; the main program uses the hard-coded `real_target`.
+def parse(infile):
+    xrange, yrange = infile.read().strip()[len("target area: "):].split(", ")
+    xmin, xmax = map(int, xrange[len("x="):].split(".."))
+    ymin, ymax = map(int, yrange[len("y="):].split(".."))
+    return (xmin, xmax, ymin, ymax)
+
 # Target is a tuple (xmin, xmax, ymin, ymax)
 test_target = (20, 30, -10, -5)
 real_target = (253, 280, -73, -46)
 
-target = real_target
-
-# Assume that for any positive y velocity yi, the probe will reach a
-# velocity of -yi just as it reaches the starting height, then go down another
-# yi + 1 below zero.  Therefore, the maximum for yi should be -ymin-1,
-# reaching apogy after step -ymin-1, and hitting the target after step
-# -2*ymin + 2. Test around those limits:
-
-expYi = -target[2]-1
-expApogy = expYi
-expTarget = 2*expYi + 2
-for yi in range(-target[2]-2,-target[2]+1):
-    apogySteps = yi
-    targetSteps = 2*yi + 2
-    for steps in range(apogySteps-1, apogySteps+3):
-        print('*' if yi == expYi and steps == expApogy else ' ', end='')
-        print("yi = {}, steps = {}, result = {}".format(yi, steps, computePos(0, yi, steps)))
-    for steps in range(targetSteps-2, targetSteps+3):
-        print('*' if yi == expYi and steps == expTarget else ' ', end='')
-        print("yi = {}, steps = {}, result = {}".format(yi, steps, computePos(0, yi, steps)))
+# Return the highest y position reachable by a probe that hits `target`
+def part1(target):
+    # See the analysis in the main program, below
+    expYi = -target[2]-1
+    return computePos(0, expYi, expYi)[1]
+
+if __name__ == "__main__":
+    target = real_target
+
+    # Assume that for any positive y velocity yi, the probe will reach a
+    # velocity of -yi just as it reaches the starting height, then go down another
+    # yi + 1 below zero.  Therefore, the maximum for yi should be -ymin-1,
+    # reaching apogy after step -ymin-1, and hitting the target after step
+    # -2*ymin + 2. Test around those limits:
+
+    expYi = -target[2]-1
+    expApogy = expYi
+    expTarget = 2*expYi + 2
+    for yi in range(-target[2]-2,-target[2]+1):
+        apogySteps = yi
+        targetSteps = 2*yi + 2
+        for steps in range(apogySteps-1, apogySteps+3):
+            print('*' if yi == expYi and steps == expApogy else ' ', end='')
+            print("yi = {}, steps = {}, result = {}".format(yi, steps, computePos(0, yi, steps)))
+        for steps in range(targetSteps-2, targetSteps+3):
+            print('*' if yi == expYi and steps == expTarget else ' ', end='')
+            print("yi = {}, steps = {}, result = {}".format(yi, steps, computePos(0, yi, steps)))
@@ -50,53 +50,71 @@ def testComputePos(xi, yi):
 
 
 
+# Parse a target area of the form "target area: x=20..30, y=-10..-5" from
+# `infile` and return it as a tuple (xmin, xmax, ymin, ymax).  There is no
+# input file for this puzzle; the main program uses the hard-coded `real_target`.
+def parse(infile):
+    xrange, yrange = infile.read().strip()[len("target area: "):].split(", ")
+    xmin, xmax = map(int, xrange[len("x="):].split(".."))
+    ymin, ymax = map(int, yrange[len("y="):].split(".."))
+    return (xmin, xmax, ymin, ymax)
+
 # Target is a tuple (xmin, xmax, ymin, ymax)
 test_target = (20, 30, -10, -5)
 real_target = (253, 280, -73, -46)
 
-target = real_target
-
-# Assume that for any positive y velocity yi, the probe will reach a
-# velocity of -yi just as it reaches the starting height, then go down another
-# yi + 1 below zero.  Therefore, the maximum for yi should be -ymin-1,
-# reaching apogy after step -ymin-1, and hitting the target after step
-# -2*ymin + 2. Test around those limits:
-
-(targXmin, targXmax, targYmin, targYmax) = target
-solutions = set()
-minYi = -targYmax
-minXi = int(math.sqrt(targXmin * 2 + 2))
-maxXi = targXmax
-for yi in range(targYmin, 1):
-    for steps in range(1, -targYmin):
-        (checkX, checkY) = computePos(0, yi, steps)
-        if checkY > targYmax:
-            continue
-        elif checkY < targYmin:
-            break
-        else:
-            # Found a working `yi` and `steps`, now find working `xi` values
-            for xi in range(minXi, maxXi + 1):
-                (checkX, checkY) = computePos(xi, yi, steps)
-                if checkX < targXmin:
-                    continue
-                elif checkX > targXmax:
-                    break
-                else:
-                    solutions.add((xi, yi))
-
-            # For each working `yi`, `-yi-1` will also work, increasing
-            # `steps` by `-2*yi-1` as well.
-            yi2 = -yi-1
-            steps2 = steps + 2*yi2 + 1
-            for xi in range(minXi, maxXi + 1):
-                (checkX, checkY) = computePos(xi, yi2, steps2)
-                if checkX < targXmin:
-                    continue
-                elif checkX > targXmax:
-                    break
-                else:
-                    solutions.add((xi, yi2))
-
-# print("solutions =", solutions)
-print("num solutions =", len(solutions))
+# Return the set of initial velocities, `(xi, yi)`, that hit `target`
+def findSolutions(target):
+    # Assume that for any positive y velocity yi, the probe will reach a
+    # velocity of -yi just as it reaches the starting height, then go down another
+    # yi + 1 below zero.  Therefore, the maximum for yi should be -ymin-1,
+    # reaching apogy after step -ymin-1, and hitting the target after step
+    # -2*ymin + 2. Test around those limits:
+
+    (targXmin, targXmax, targYmin, targYmax) = target
+    solutions = set()
+    minYi = -targYmax
+    minXi = int(math.sqrt(targXmin * 2 + 2))
+    maxXi = targXmax
+    for yi in range(targYmin, 1):
+        for steps in range(1, -targYmin):
+            (checkX, checkY) = computePos(0, yi, steps)
+            if checkY > targYmax:
+                continue
+            elif checkY < targYmin:
+                break
+            else:
+                # Found a working `yi` and `steps`, now find working `xi` values
+                for xi in range(minXi, maxXi + 1):
+                    (checkX, checkY) = computePos(xi, yi, steps)
+                    if checkX < targXmin:
+                        continue
+                    elif checkX > targXmax:
+                        break
+                    else:
+                        solutions.add((xi, yi))
+
+                # For each working `yi`, `-yi-1` will also work, increasing
+                # `steps` by `-2*yi-1` as well.
+                yi2 = -yi-1
+                steps2 = steps + 2*yi2 + 1
+                for xi in range(minXi, maxXi + 1):
+                    (checkX, checkY) = computePos(xi, yi2, steps2)
+                    if checkX < targXmin:
+                        continue
+                    elif checkX > targXmax:
+                        break
+                    else:
+                        solutions.add((xi, yi2))
+
+    return solutions
+
+def part2(target):
+    return len(findSolutions(target))
+
+if __name__ == "__main__":
+    target = real_target
+    solutions = findSolutions(target)
+
+    # print("solutions =", solutions)
+    print("num solutions =", len(solutions))
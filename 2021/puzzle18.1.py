@@ -137,20 +137,32 @@ def parseSnailfishNumber(string):
 # print(reduce(((3,(2,(1,(7,3)))),(6,(5,(4,(3,2)))))))
 # print(reduce((((((4,3),4),4),(7,((8,4),9))),(1,1))))
 
-infile = open("puzzle18_input.txt", "r")
+def parse(infile):
+    """Return the groups of snailfish numbers in `infile`.  Groups are
+    separated by blank lines; the real input has only one group."""
+    groups = [ [ ] ]
+    for line in infile:
+        if line == '\n':
+            groups.append([ ])
+            continue
+        groups[-1].append(parseSnailfishNumber(line))
+    return groups
 
-sum = None
-for line in infile:
-    if line == '\n':
-        print("sum =", sum)
-        print("magnitude =", magnitude(sum))
-        sum = None
-        continue
+def addAll(sfnumbers):
+    """Return the sum of the list of snailfish numbers"""
+    sum = None
+    for sfnum in sfnumbers:
+        # print(sfnum)
+        sum = add(sum, sfnum) if sum else sfnum
+    return sum
 
-    sfnum = parseSnailfishNumber(line)
-    # print(sfnum)
+def part1(groups):
+    return [ magnitude(addAll(sfnumbers)) for sfnumbers in groups ]
 
-    sum = add(sum, sfnum) if sum else sfnum
+if __name__ == "__main__":
+    infile = open("puzzle18_input.txt", "r")
 
-print("sum =", sum)
-print("magnitude =", magnitude(sum))
+    for sfnumbers in parse(infile):
+        sum = addAll(sfnumbers)
+        print("sum =", sum)
+        print("magnitude =", magnitude(sum))
@@ -137,9 +137,20 @@ def parseSnailfishNumber(string):
 # print(reduce(((3,(2,(1,(7,3)))),(6,(5,(4,(3,2)))))))
 # print(reduce((((((4,3),4),4),(7,((8,4),9))),(1,1))))
 
-infile = open("puzzle18_input.txt", "r")
+def parse(infile):
+    """Return the groups of snailfish numbers in `infile`.  Groups are
+    separated by blank lines; the real input has only one group."""
+    groups = [ [ ] ]
+    for line in infile:
+        if line == '\n':
+            groups.append([ ])
+            continue
+        groups[-1].append(parseSnailfishNumber(line))
+    return groups
 
-def printMax(sfnumbers):
+def maxMagnitude(sfnumbers):
+    """Return the largest magnitude of the sum of any two different numbers in
+    `sfnumbers`"""
     max = 0
     for i in range(len(sfnumbers)):
         for j in range(i+1, len(sfnumbers)):
@@ -147,14 +158,13 @@ def printMax(sfnumbers):
             if mag > max: max = mag
             mag = magnitude(add(sfnumbers[j], sfnumbers[i]))
             if mag > max: max = mag
-    print("max pairwise magnitude =", max)
+    return max
+
+def part2(groups):
+    return [ maxMagnitude(sfnumbers) for sfnumbers in groups ]
 
-sfnumbers = [ ]
-for line in infile:
-    if line == '\n':
-        printMax(sfnumbers)
-        sfnumbers = [ ]
-        continue
-    sfnumbers.append(parseSnailfishNumber(line))
+if __name__ == "__main__":
+    infile = open("puzzle18_input.txt", "r")
 
-printMax(sfnumbers)
+    for sfnumbers in parse(infile):
+        print("max pairwise magnitude =", maxMagnitude(sfnumbers))
@@ -117,39 +117,58 @@ class Scanner:
                         return translatedOther
         return None
 
-infile = open("puzzle19_input.test.txt", "r")
-
-scanners = []
-for line in infile:
-    # `line` is "--- scanner # ---\n"
-    # print('\n', line)
-    scanners.append(Scanner.read(infile))
-infile.close()
-print("Read {} scanners".format(len(scanners)))
-
-numScanners = len(scanners)
-matched = [ scanners.pop(0) ]
-unmatched = scanners
-
-# Can't use a `for` loop because `len(matched)` changes during iteration
-matchedIndex = 0
-while matchedIndex < len(matched):
-    known = matched[matchedIndex]
-    unmatchedIndex = 0
-    while unmatchedIndex < len(unmatched):
-        overlapper = known.overlapsWith(unmatched[unmatchedIndex])
-        if overlapper:
-            matched.append(overlapper)
-            unmatched.pop(unmatchedIndex)
-            print("Found match {} of {}".format(len(matched), numScanners))
-        else:
-            unmatchedIndex += 1
-    matchedIndex += 1
-
-assert(len(unmatched) == 0)
-
-allBeacons = set()
-for scanner in matched:
-    allBeacons.update(map(tuple, scanner.beacons))
-
-print("Total beacons = ", len(allBeacons))
+def parse(infile):
+    """Return the list of scanners in `infile`"""
+    scanners = []
+    for line in infile:
+        # `line` is "--- scanner # ---\n"
+        # print('\n', line)
+        scanners.append(Scanner.read(infile))
+    return scanners
+
+def matchScanners(scanners, verbose = False):
+    """Return the list of `scanners`, each rotated and translated into the
+    coordinates of the first scanner.  If `verbose` is true, report each match
+    as it is found."""
+    numScanners = len(scanners)
+    matched = [ scanners[0] ]
+    unmatched = list(scanners[1:])
+
+    # Can't use a `for` loop because `len(matched)` changes during iteration
+    matchedIndex = 0
+    while matchedIndex < len(matched):
+        known = matched[matchedIndex]
+        unmatchedIndex = 0
+        while unmatchedIndex < len(unmatched):
+            overlapper = known.overlapsWith(unmatched[unmatchedIndex])
+            if overlapper:
+                matched.append(overlapper)
+                unmatched.pop(unmatchedIndex)
+                if verbose:
+                    print("Found match {} of {}".format(len(matched), numScanners))
+            else:
+                unmatchedIndex += 1
+        matchedIndex += 1
+
+    assert(len(unmatched) == 0)
+    return matched
+
+def distinctBeacons(matched):
+    """Return the set of distinct beacons seen by the `matched` scanners"""
+    allBeacons = set()
+    for scanner in matched:
+        allBeacons.update(map(tuple, scanner.beacons))
+    return allBeacons
+
+def part1(scanners):
+    return len(distinctBeacons(matchScanners(scanners)))
+
+if __name__ == "__main__":
+    infile = open("puzzle19_input.test.txt", "r")
+    scanners = parse(infile)
+    infile.close()
+    print("Read {} scanners".format(len(scanners)))
+
+    matched = matchScanners(scanners, verbose = True)
+
+    print("Total beacons = ", len(distinctBeacons(matched)))
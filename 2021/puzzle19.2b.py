@@ -125,39 +125,60 @@ class Scanner:
                     return translatedOther
         return None
 
-infile = open("puzzle19_input.test.txt", "r")
-
-scanners = []
-for line in infile:
-    # `line` is "--- scanner # ---\n"
-    # print('\n', line)
-    scanners.append(Scanner.read(infile))
-infile.close()
-print("Read {} scanners".format(len(scanners)))
-
-numScanners = len(scanners)
-matched = [ scanners.pop(0) ]
-unmatched = scanners
-
-matchedMutator = mi.MutatingIterator(matched)
-for known in matchedMutator:
-    unmatchedMutator = mi.MutatingIterator(unmatched)
-    for unknown in unmatchedMutator:
-        overlapper = known.overlapsWith(unknown)
-        if overlapper:
-            matchedMutator.append(overlapper)
-            unmatchedMutator.remove()
-            print("Found match {} of {}".format(len(matched), numScanners))
-
-assert(len(unmatched) == 0)
-
-largestDistance = 0
-scannerCoords = list(map(lambda s : s.center, matched))
-for i in range(len(scannerCoords)):
-    for j in range(i+1, len(scannerCoords)):
-        xyzDistance = tuple(map(abs, scannerCoords[i] - scannerCoords[j]))
-        manhattanDistance = np.sum(xyzDistance)
-        if manhattanDistance > largestDistance:
-            largestDistance = manhattanDistance
-
-print("Largest distance =", largestDistance)
+def parse(infile):
+    """Return the list of scanners in `infile`"""
+    scanners = []
+    for line in infile:
+        # `line` is "--- scanner # ---\n"
+        # print('\n', line)
+        scanners.append(Scanner.read(infile))
+    return scanners
+
+def matchScanners(scanners, verbose = False):
+    """Return the list of `scanners`, each rotated and translated into the
+    coordinates of the first scanner.  If `verbose` is true, report each match
+    as it is found."""
+    numScanners = len(scanners)
+    matched = [ scanners[0] ]
+    unmatched = list(scanners[1:])
+
+    matchedMutator = mi.LinkedMutatingIterator(matched)
+    unmatchedMutator = mi.LinkedMutatingIterator(unmatched)
+    for known in matchedMutator:
+        unmatchedMutator.restart()
+        for unknown in unmatchedMutator:
+            overlapper = known.overlapsWith(unknown)
+            if overlapper:
+                matchedMutator.append(overlapper)
+                unmatchedMutator.remove()
+                if verbose:
+                    print("Found match {} of {}".format(len(matchedMutator), numScanners))
+
+    assert(len(unmatchedMutator) == 0)
+    return matchedMutator.get_list()
+
+def maxScannerDistance(matched):
+    """Return the largest Manhattan distance between any two of the `matched`
+    scanners"""
+    largestDistance = 0
+    scannerCoords = list(map(lambda s : s.center, matched))
+    for i in range(len(scannerCoords)):
+        for j in range(i+1, len(scannerCoords)):
+            xyzDistance = tuple(map(abs, scannerCoords[i] - scannerCoords[j]))
+            manhattanDistance = np.sum(xyzDistance)
+            if manhattanDistance > largestDistance:
+                largestDistance = manhattanDistance
+    return largestDistance
+
+def part2(scanners):
+    return maxScannerDistance(matchScanners(scanners))
+
+if __name__ == "__main__":
+    infile = open("puzzle19_input.test.txt", "r")
+    scanners = parse(infile)
+    infile.close()
+    print("Read {} scanners".format(len(scanners)))
+
+    matched = matchScanners(scanners, verbose = True)
+
+    print("Largest distance =", maxScannerDistance(matched))
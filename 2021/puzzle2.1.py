@@ -1,22 +1,38 @@
 # Advent of Code day 2, part 1
 # Move the submarine according to the input instructions
 
-infile = open("puzzle2_input.txt", "r")   # Input: One instruction per line
+def parse(infile):
+    """Return the list of (command, value) instructions in `infile`"""
+    instructions = [ ]
+    for instruction in infile:
+        [command, strval] = instruction.split()
+        instructions.append((command, int(strval)))
+    return instructions
 
-horizontal = 0  # Initial horizontal position
-depth      = 0  # Initial depth
+def navigate(instructions):
+    """Return the final horizontal position and depth of the submarine"""
+    horizontal = 0  # Initial horizontal position
+    depth      = 0  # Initial depth
 
-for instruction in infile:
-    [command, strval] = instruction.split()
-    value = int(strval)
-    if command == "forward":
-        horizontal += value
-    elif command == "down":
-        depth += value
-    elif command == "up":
-        depth -= value
-    else:
-        print("Invalid command: {}".format(command))
+    for command, value in instructions:
+        if command == "forward":
+            horizontal += value
+        elif command == "down":
+            depth += value
+        elif command == "up":
+            depth -= value
+        else:
+            print("Invalid command: {}".format(command))
 
-print("Position = {}, depth = {}, product = {}".format(horizontal, depth, \
-                                                       horizontal*depth))
+    return (horizontal, depth)
+
+def part1(instructions):
+    horizontal, depth = navigate(instructions)
+    return horizontal * depth
+
+if __name__ == "__main__":
+    infile = open("puzzle2_input.txt", "r")   # Input: One instruction per line
+    horizontal, depth = navigate(parse(infile))
+
+    print("Position = {}, depth = {}, product = {}".format(horizontal, depth, \
+                                                           horizontal*depth))
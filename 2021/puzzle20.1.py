@@ -38,30 +38,40 @@ def hashDotsToBinary(hashDots):
     integer values, respectively."""
     return tuple(map(lambda c : 1 if c == '#' else 0, hashDots.rstrip()))
 
-infile = open("puzzle20_input.txt", "r")
+def parse(infile):
+    """Return the enhancement algorithm and the input image in `infile`"""
+    inIter = iter(infile)
+    algorithm = hashDotsToBinary(next(inIter))
+    # print("algorithm =", algorithm)
 
-inIter = iter(infile)
-algorithm = hashDotsToBinary(next(inIter))
-# print("algorithm =", algorithm)
+    assert('\n' == next(inIter))  # Skip blank line
 
-assert('\n' == next(inIter))  # Skip blank line
+    image = np.array( [ hashDotsToBinary(next(inIter)) ]) # Read first row of image
 
-image = np.array( [ hashDotsToBinary(next(inIter)) ]) # Read first row of image
+    # Read rest of image, adding a row for each line
+    for line in inIter:
+        image = np.vstack((image, hashDotsToBinary(line)))
 
-# Read rest of image, adding a row for each line
-for line in inIter:
-    image = np.vstack((image, hashDotsToBinary(line)))
+    # print("input image = \n", image)
+    return (algorithm, image)
 
-# print("input image = \n", image)
+def part1(data):
+    algorithm, image = data
 
-padVal = 0
-image = enhance(algorithm, pad(image, padVal))
-#print("pass 1 out = \n", image)
+    padVal = 0
+    image = enhance(algorithm, pad(image, padVal))
+    #print("pass 1 out = \n", image)
 
-padVal = algorithm[0]  # Infinite image must compute values for zero area
-image = enhance(algorithm, pad(image, padVal))
-#print("pass 2 out = \n", image)
+    padVal = algorithm[0]  # Infinite image must compute values for zero area
+    image = enhance(algorithm, pad(image, padVal))
+    #print("pass 2 out = \n", image)
 
-# padVal = algorithm[0 if padVal == 0 else 511]
+    # padVal = algorithm[0 if padVal == 0 else 511]
 
-print("\nTotal lit pixels =", image.sum())
+    return image.sum()
+
+if __name__ == "__main__":
+    infile = open("puzzle20_input.txt", "r")
+    litPixels = part1(parse(infile))
+
+    print("\nTotal lit pixels =", litPixels)
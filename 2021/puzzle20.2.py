@@ -2,62 +2,58 @@
 # Image enhancement algorithm run 50 times
 
 import numpy as np
+import loadGrid
+from automaton import Automaton
 
-# Placevalues for 9 binary digits
-placeValues = np.array([ 256, 128, 64, 32, 16, 8, 4, 2, 1 ])
-
-def pad(image, padVal):
-    ### Surround image with two rows and columns of `padVal`:
-    (rows, cols) = image.shape
-    padRow = np.array([ padVal ] * cols)
-    paddedImage = np.vstack((padRow, padRow, image, padRow, padRow))
-    rows += 4
-    padCol = np.array( [ [ padVal ] ] * rows  )
-    paddedImage = np.hstack((padCol, padCol, paddedImage, padCol, padCol))
-    return paddedImage
-
-# `algorithm` is a 1-D np array of 0 and 1.
-# `image` is a 2-D np array of 0 and 1.
 def enhance(algorithm, image):
-    """Return enhanced image"""
-
-    outrows, outcols = image.shape
-    outrows -= 2
-    outcols -= 2
-    result = np.ndarray(shape = (outrows, outcols), dtype = int)
-    for x in range(outrows):
-        for y in range(outcols):
-            bits9 = image[x:x+3, y:y+3].reshape((9,))
-            windowVal = (bits9 * placeValues).sum()
-            result[x, y] = algorithm[windowVal]
-
-    return result
+    """Return the enhanced `image`, which is one pixel larger on each side.
+    The outermost ring of `image` is the background, which extends to
+    infinity, so `image` is padded by repeating its edges.  Each output pixel
+    is looked up in `algorithm` (a 1-D np array of 0 and 1) by the 9-bit
+    number formed by the 3x3 window around it, computed for every pixel at
+    once by shifting the padded image."""
+    padded = np.pad(image, 2, mode = "edge")
+    rows, cols = image.shape[0] + 2, image.shape[1] + 2
+    index = np.zeros((rows, cols), dtype = np.int16)
+    for dr in range(3):
+        for dc in range(3):
+            index = (index << 1) | padded[dr:dr + rows, dc:dc + cols]
+    return algorithm[index]
 
 def hashDotsToBinary(hashDots):
     """Convert a string of '#' and '.' characters into a tuple of 1 and 0
     integer values, respectively."""
     return tuple(map(lambda c : 1 if c == '#' else 0, hashDots.rstrip()))
 
-infile = open("puzzle20_input.txt", "r")
+def parse(infile):
+    """Return the enhancement algorithm and the input image in `infile`"""
+    inIter = iter(infile)
+    algorithm = hashDotsToBinary(next(inIter))
+    # print("algorithm =", algorithm)
 
-inIter = iter(infile)
-algorithm = hashDotsToBinary(next(inIter))
-# print("algorithm =", algorithm)
+    assert('\n' == next(inIter))  # Skip blank line
 
-assert('\n' == next(inIter))  # Skip blank line
+    # Read rest of file as the image
+    image = loadGrid.loadGrid(infile, { '#' : 1, '.' : 0 })
 
-image = np.array( [ hashDotsToBinary(next(inIter)) ]) # Read first row of image
+    # print("input image = \n", image)
+    return (algorithm, image)
 
-# Read rest of image, adding a row for each line
-for line in inIter:
-    image = np.vstack((image, hashDotsToBinary(line)))
+def enhanceRepeatedly(algorithm, image, reps, verbose = False):
+    """Return the image after enhancing it `reps` times"""
+    algorithm = np.array(algorithm, dtype = image.dtype)
+    images = Automaton(np.pad(image, 1), lambda image: enhance(algorithm, image),
+                       detectCycles = False)  # The image grows every step
+    images.run(reps)
+    if verbose: images.report()
+    return images.state[1:-1, 1:-1]  # Remove the background ring
 
-# print("input image = \n", image)
+def part2(data):
+    return enhanceRepeatedly(*data, 50).sum()
 
-padVal = 0
-for rep in range(50):
-    image = enhance(algorithm, pad(image, padVal))
-    padVal = algorithm[0 if padVal == 0 else 511]
+if __name__ == "__main__":
+    infile = open("puzzle20_input.txt", "r")
+    image = enhanceRepeatedly(*parse(infile), 50, verbose = True)
 
-print("Final image size =", image.shape)
-print("Total lit pixels =", image.sum())
+    print("Final image size =", image.shape)
+    print("Total lit pixels =", image.sum())
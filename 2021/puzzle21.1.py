@@ -24,34 +24,52 @@ class Player:
         self.score    += self.position + 1
         return self.score >= 1000
 
+def parse(infile):
+    """Return the tuple of starting positions in `infile`, which has lines of
+    the form "Player 1 starting position: 4".  There is no input file for this
+    puzzle; the main program uses the hard-coded `startpos_real`."""
+    return tuple(int(line.rstrip().split(": ")[1]) for line in infile if line.strip())
+
+def playGame(startpos):
+    """Play the game from the tuple of starting positions.  Return the winning
+    player, the losing player, and the die."""
+    player1 = Player(1, startpos[0])
+    player2 = Player(2, startpos[1])
+
+    winner = None
+    loser  = None
+
+    die = Die()
+
+    while not winner:
+        roll = die.roll() + die.roll() + die.roll()
+        if player1.advance(roll):
+            winner = player1
+            loser  = player2
+            break
+        roll = die.roll() + die.roll() + die.roll()
+        if player2.advance(roll):
+            winner = player2
+            loser  = player1
+            break
+
+    return (winner, loser, die)
+
+def part1(startpos):
+    winner, loser, die = playGame(startpos)
+    return die.numRolls * loser.score
+
 startpos_test = (4, 8)
 startpos_real = (8, 5)
 
-startpos = startpos_real
-
-player1 = Player(1, startpos[0])
-player2 = Player(2, startpos[1])
-
-winner = None
-loser  = None
-
-die = Die()
-
-while not winner:
-    roll = die.roll() + die.roll() + die.roll()
-    if player1.advance(roll):
-        winner = player1
-        loser  = player2
-        break
-    roll = die.roll() + die.roll() + die.roll()
-    if player2.advance(roll):
-        winner = player2
-        loser  = player1
-        break
-
-print("winner = player{}, score = {}".
-      format(winner.playerNum, winner.score))
-print("loser  = player{},  score = {}".
-      format(loser.playerNum, loser.score))
-print("rolls = {}, loser score * rolls = {}".
-      format(die.numRolls, die.numRolls*loser.score))
+if __name__ == "__main__":
+    startpos = startpos_real
+
+    winner, loser, die = playGame(startpos)
+
+    print("winner = player{}, score = {}".
+          format(winner.playerNum, winner.score))
+    print("loser  = player{},  score = {}".
+          format(loser.playerNum, loser.score))
+    print("rolls = {}, loser score * rolls = {}".
+          format(die.numRolls, die.numRolls*loser.score))
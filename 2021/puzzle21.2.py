@@ -14,8 +14,6 @@ DiceUniverses = [ 0, 0, 0, 1, 3, 6, 7, 6, 3, 1 ]
 startpos_test = (4, 8)
 startpos_real = (8, 5)
 
-startpos = startpos_real
-
 winningScore = 21
 
 def advance(playerState, roll):
@@ -29,9 +27,9 @@ def addToStateMap(stateMap, thisPlayer, otherPlayer, universes):
     universes += stateMap.get(key, 0)
     stateMap[key] = universes
 
-winningUniverses = [ 0, 0 ]
-def playturn(playerId, gameStateMap):
-    global winningUniverses
+# Play one turn for `playerId`, adding the universes in which that player wins
+# to `winningUniverses`.  Return the new map of game states.
+def playturn(playerId, gameStateMap, winningUniverses):
     otherPlayerId = 1 - playerId
     newStateMap = { }
     for playerStates, universes in gameStateMap.items():
@@ -45,17 +43,35 @@ def playturn(playerId, gameStateMap):
                 addToStateMap(newStateMap, otherPlayer, nextState, nextUniverses)
     return newStateMap
 
-def play(startPos):
+# Play the game from the tuple of starting positions.  Return the number of
+# universes in which each player wins.  If `verbose` is true, report the number
+# of game states after each turn.
+def play(startPos, verbose = False):
+    winningUniverses = [ 0, 0 ]
     gameStateMap = { ((startPos[0], 0), (startPos[1], 0)) : 1 }
     whoseTurn = 0
     turn = 1
     while gameStateMap:
-        gameStateMap = playturn(whoseTurn, gameStateMap)
-        print("turn {}, {} states".format(turn, len(gameStateMap)))
+        gameStateMap = playturn(whoseTurn, gameStateMap, winningUniverses)
+        if verbose:
+            print("turn {}, {} states".format(turn, len(gameStateMap)))
         turn += 1
         whoseTurn = 1 - whoseTurn
+    return winningUniverses
+
+def parse(infile):
+    """Return the tuple of starting positions in `infile`, which has lines of
+    the form "Player 1 starting position: 4".  There is no input file for this
+    puzzle; the main program uses the hard-coded `startpos_real`."""
+    return tuple(int(line.rstrip().split(": ")[1]) for line in infile if line.strip())
+
+def part2(startpos):
+    return max(play(startpos))
+
+if __name__ == "__main__":
+    startpos = startpos_real
 
-play(startpos)
+    winningUniverses = play(startpos, verbose = True)
 
-print("Player 0 wins in {} universes".format(winningUniverses[0]))
-print("Player 1 wins in {} universes".format(winningUniverses[1]))
+    print("Player 0 wins in {} universes".format(winningUniverses[0]))
+    print("Player 1 wins in {} universes".format(winningUniverses[1]))
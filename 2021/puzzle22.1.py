@@ -2,7 +2,6 @@
 # Reactor reboot
 
 import copy
-import numpy as np
 
 class Cuboid:
     
@@ -114,32 +113,40 @@ def totalFromArray(cuboidMap):
                 if cuboidMap[x, y, z] : arrayTotal += 1
     return arrayTotal
 
-infile = open("puzzle22_input.txt", "r")
-
-cuboidMap = np.ndarray(shape=(101, 101, 101), dtype=bool)
-frame = Cuboid([-50, -50, -50], [50, 50, 50])
-cuboids = []
-for stepline in infile:
-    onoffStr, coords = stepline.rstrip().split(' ')
-    cuboid = Cuboid.fromString(coords)
-    cuboid = cuboid.intersection(frame)
-    if cuboid:
-        # print("processing {} {}".format(onoffStr, cuboid))
-        cuboids = rebootStep(cuboids, onoffStr == 'on', cuboid)
-        # rebootStepArray(cuboidMap, onoffStr == 'on', cuboid)
-        # if totalFromList(cuboids) != totalFromArray(cuboidMap):
-        #     for cuboid in cuboids:
-        #         for x in range(cuboid.minCoord[0] + 50, cuboid.maxCoord[0] + 51):
-        #             for y in range(cuboid.minCoord[1] + 50, cuboid.maxCoord[1] + 51):
-        #                 for z in range(cuboid.minCoord[2] + 50, cuboid.maxCoord[2] + 51):
-        #                     if not cuboidMap[x, y, z]:
-        #                         print("incorrect on: ({}, {}, {}) in cuboid {}".format(x - 50, y - 50, z - 50, cuboid))
-        #                         assert(False)
-
-
-total = totalFromList(cuboids)
-arrayTotal = totalFromArray(cuboidMap)
-
-# print(cuboids)
-print("total on = ", total)
-# print("array total = ", arrayTotal)
\ No newline at end of file
+def parse(infile):
+    """Return the list of reboot steps in `infile`, each a tuple `(turnon,
+    cuboid)`"""
+    steps = []
+    for stepline in infile:
+        onoffStr, coords = stepline.rstrip().split(' ')
+        steps.append((onoffStr == 'on', Cuboid.fromString(coords)))
+    return steps
+
+def part1(steps):
+    # cuboidMap = np.ndarray(shape=(101, 101, 101), dtype=bool)
+    frame = Cuboid([-50, -50, -50], [50, 50, 50])
+    cuboids = []
+    for turnon, cuboid in steps:
+        cuboid = cuboid.intersection(frame)
+        if cuboid:
+            # print("processing {} {}".format(turnon, cuboid))
+            cuboids = rebootStep(cuboids, turnon, cuboid)
+            # rebootStepArray(cuboidMap, turnon, cuboid)
+            # if totalFromList(cuboids) != totalFromArray(cuboidMap):
+            #     for cuboid in cuboids:
+            #         for x in range(cuboid.minCoord[0] + 50, cuboid.maxCoord[0] + 51):
+            #             for y in range(cuboid.minCoord[1] + 50, cuboid.maxCoord[1] + 51):
+            #                 for z in range(cuboid.minCoord[2] + 50, cuboid.maxCoord[2] + 51):
+            #                     if not cuboidMap[x, y, z]:
+            #                         print("incorrect on: ({}, {}, {}) in cuboid {}".format(x - 50, y - 50, z - 50, cuboid))
+            #                         assert(False)
+
+    # print(cuboids)
+    # print("array total = ", totalFromArray(cuboidMap))
+    return totalFromList(cuboids)
+
+if __name__ == "__main__":
+    infile = open("puzzle22_input.txt", "r")
+    total = part1(parse(infile))
+
+    print("total on = ", total)
@@ -105,17 +105,25 @@ def totalFromList(cuboids):
         total += cuboid.volume()
     return total
 
-infile = open("puzzle22_input.txt", "r")
+def parse(infile):
+    """Return the list of reboot steps in `infile`, each a tuple `(turnon,
+    cuboid)`"""
+    steps = []
+    for stepline in infile:
+        onoffStr, coords = stepline.rstrip().split(' ')
+        steps.append((onoffStr == 'on', Cuboid.fromString(coords)))
+    return steps
 
-cuboids = []
-for stepline in infile:
-    onoffStr, coords = stepline.rstrip().split(' ')
-    cuboid = Cuboid.fromString(coords)
-    cuboids = rebootStep(cuboids, onoffStr == 'on', cuboid)
+def part2(steps):
+    cuboids = []
+    for turnon, cuboid in steps:
+        cuboids = rebootStep(cuboids, turnon, cuboid)
 
+    # print(cuboids)
+    return totalFromList(cuboids)
 
-total = totalFromList(cuboids)
+if __name__ == "__main__":
+    infile = open("puzzle22_input.txt", "r")
+    total = part2(parse(infile))
 
-# print(cuboids)
-print("total on = ", total)
-# print("array total = ", arrayTotal)
\ No newline at end of file
+    print("total on = ", total)
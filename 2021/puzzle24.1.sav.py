@@ -327,18 +327,6 @@ def solve(operation, val = 0):
     setRange(operation, [val, val])
     rangeSolve(operation, oldResultRange)
 
-infile = open("puzzle24_input.txt", "r")
-
-registers = {
-    'w' : 0,
-    'x' : 0,
-    'y' : 0,
-    'z' : 0
-    }
-
-for instrStr in infile:
-    processInstr(registers, instrStr)
-
 def depth(x, d = 0):
     assert(d < 1000)
 #    print("\rDepth so far ", d, "   ", end='')
@@ -348,9 +336,39 @@ def depth(x, d = 0):
             maxDepth = max((maxDepth, depth(y, d + 1)))
     return maxDepth
 
-print('Input processed, solving...')
-solve(registers['z'], 0)
-#for reg in "wxyz":
-#    print(f"depth at {reg} = {depth(registers[reg])}")
-#     print(f"reg {reg} = {registers[reg]}")
-# print(registers['z'])
+def parse(infile):
+    """Return the list of instruction strings in `infile`"""
+    return [ instrStr.rstrip() for instrStr in infile ]
+
+def processInstructions(instructions):
+    """Process the `instructions` and return the registers"""
+    global input
+    input = 0
+    registers = {
+        'w' : 0,
+        'x' : 0,
+        'y' : 0,
+        'z' : 0
+        }
+
+    for instrStr in instructions:
+        processInstr(registers, instrStr)
+    return registers
+
+def part1(instructions):
+    """Return the input ranges for which the `z` register is zero"""
+    global inputRanges
+    inputRanges = [None] + [[1, 9]] * 14
+    solve(processInstructions(instructions)['z'], 0)
+    return inputRanges[1:]
+
+if __name__ == "__main__":
+    infile = open("puzzle24_input.txt", "r")
+    registers = processInstructions(parse(infile))
+
+    print('Input processed, solving...')
+    solve(registers['z'], 0)
+    #for reg in "wxyz":
+    #    print(f"depth at {reg} = {depth(registers[reg])}")
+    #     print(f"reg {reg} = {registers[reg]}")
+    # print(registers['z'])
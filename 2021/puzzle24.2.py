@@ -196,13 +196,11 @@ operations = {
     'not' : opNot
 }
 
-inputCount = 0
-
-def processInstr(registers, instrStr):
+def processInstr(registers, instrStr, inputCount):
     """Process the specified instruction, modifying the registers. Processing
     involves updating the instruction tree for a register.  No I/O actually
-    occurs."""
-    global inputCount
+    occurs.  `inputCount` is the number of input instructions processed so far.
+    Return the updated `inputCount`."""
     opcode, *operands = instrStr.rstrip().split(' ')
     target = operands[0]
     arg1 = registers[target]
@@ -221,6 +219,7 @@ def processInstr(registers, instrStr):
     operation = operations[opcode]
     result = operation(opTuple)
     registers[target] = result
+    return inputCount
 
 def simplify(expression):
     """Recursively simplify `expression` and return the simplification"""
@@ -242,11 +241,12 @@ def simplify(expression):
     operation = operations[opcode]
     return operation((opcode, range, *simplifiedOps))
 
-def solve(expression, inputPrefix = [None]):
+def solve(expression, inputPrefix = [None], verbose = False):
     """Try to find a solution where `expression` evaluates to zero using the
     initial sequence of inputs specified in `inputPrefix`.  If successful,
     returns the complete list of 14 inputs that solves the expression.  If
-    unsuccessful, returns `None`."""
+    unsuccessful, returns `None`.  If `verbose` is true, show the partial
+    solutions as they are tried."""
     global inputRanges
     if len(inputPrefix) > 14:
         return inputPrefix  # Solved!
@@ -258,27 +258,43 @@ def solve(expression, inputPrefix = [None]):
         minE, maxE = getRange(simplifiedExpr)
         if minE <= 0 and 0 <= maxE:
             # Found partial solution.  Recurse down another level.
-            if len(inputPrefix) < 8:
+            if verbose and len(inputPrefix) < 8:
                 print("\rPartial = %-15s" % ''.join(map(lambda x : str(x[0]), tryInputList[1:])), end='')
-            solution = solve(simplifiedExpr, tryInputList)
-            if solution: return solution  # Solved!
+            solution = solve(simplifiedExpr, tryInputList, verbose)
+            if solution:
+                inputRanges = inputPrefix  # Pop list
+                return solution  # Solved!
 
     inputRanges = inputPrefix  # Pop list
     return None
 
-infile = open("puzzle24_input.txt", "r")
-
-registers = {
-    'w' : 0,
-    'x' : 0,
-    'y' : 0,
-    'z' : 0
-    }
-
-for instrStr in infile:
-    processInstr(registers, instrStr)
-
-print('Input processed, solving...')
-
-solution = solve(registers['z'])
-print("\nSolution =", ''.join(map(lambda x : str(x[0]), solution[1:])))
+def parse(infile):
+    """Return the list of instruction strings in `infile`"""
+    return [ instrStr.rstrip() for instrStr in infile ]
+
+def buildExpression(instructions):
+    """Process the `instructions` and return the expression tree for the `z`
+    register"""
+    registers = {
+        'w' : 0,
+        'x' : 0,
+        'y' : 0,
+        'z' : 0
+        }
+
+    inputCount = 0
+    for instrStr in instructions:
+        inputCount = processInstr(registers, instrStr, inputCount)
+    return registers['z']
+
+def part2(instructions):
+    solution = solve(buildExpression(instructions))
+    return int(''.join(map(lambda x : str(x[0]), solution[1:])))
+
+if __name__ == "__main__":
+    infile = open("puzzle24_input.txt", "r")
+    expression = buildExpression(parse(infile))
+
+    print('Input processed, solving...')
+    solution = solve(expression, verbose = True)
+    print("\nSolution =", ''.join(map(lambda x : str(x[0]), solution[1:])))
@@ -121,18 +121,15 @@ operations = {
     'eql' : OpEql
 }
 
-inputCount = 0  # Number of input instructions parsed
-
-def parseInstr(instrStr):
-    """Parse the specified instruction string and return the compiled `Op` object."""
-    global inputCount
+def parseInstr(instrStr, inputCount):
+    """Parse the specified instruction string and return the compiled `Op` object.
+    `inputCount` is the number of input instructions parsed so far."""
     opcode, *operands = instrStr.rstrip().split(' ')
     target = Register(ord(operands[0]) - ord('w'))
     source = None
     if len(operands) < 2:
         assert(opcode == 'inp')
-        inputCount += 1
-        source = inputCount
+        source = inputCount + 1
     else:
         if operands[1] in 'wxyz':
             source = Register(ord(operands[1]) - ord('w'))
@@ -153,11 +150,12 @@ def runInstructions(registers, instructions, firstInstr, inputPrefix):
         instructions[instIndex].exec(registers)
     OpInp.prefixValues = savePrefix
 
-def solve(registers, instructions, firstInstr = 0, inputPrefix = [None]):
+def solve(registers, instructions, firstInstr = 0, inputPrefix = [None], verbose = False):
     """Try to find a solution where `instructions` leaves a zero value in
     `registers[z]` by appending to the initial sequence of inputs specified in
     `inputPrefix`.  If successful, returns the complete list of 14 inputs that
-    solves the expression.  If unsuccessful, returns `None`.
+    solves the expression.  If unsuccessful, returns `None`.  If `verbose`
+    is true, show the partial solutions as they are tried.
     """
 
     if len(inputPrefix) > 14:
@@ -170,22 +168,33 @@ def solve(registers, instructions, firstInstr = 0, inputPrefix = [None]):
         minE, maxE = tryRegisters[3]  # Z register
         if minE <= 0 and 0 <= maxE:
             # Found partial solution.  Recurse down another level.
-            if len(inputPrefix) < 8:
+            if verbose and len(inputPrefix) < 8:
                 print("\rPartial = %-15s" % ''.join(map(lambda x : str(x), tryInputList[1:])), end='')
             # TBD: optimize by updating `firstInstr` and using `tryRegisters`
-            solution = solve(registers, instructions, firstInstr, tryInputList)
+            solution = solve(registers, instructions, firstInstr, tryInputList, verbose)
             if solution: return solution  # Solved!
 
     return None
 
-infile = open("puzzle24_input.txt", "r")
+def parse(infile):
+    """Return the list of compiled `Op` objects for the instructions in `infile`"""
+    instructions = [ ]
+    inputCount = 0  # Number of input instructions parsed
+    for instrStr in infile:
+        instructions.append(parseInstr(instrStr, inputCount))
+        if isinstance(instructions[-1], OpInp):
+            inputCount += 1
+    return instructions
 
-instructions = [ ]
+def part2(instructions):
+    solution = solve([ (0, 0) ] * 4, instructions)
+    return int(''.join(map(lambda x : str(x), solution[1:])))
 
-for instrStr in infile:
-    instructions.append(parseInstr(instrStr))
+if __name__ == "__main__":
+    infile = open("puzzle24_input.txt", "r")
+    instructions = parse(infile)
 
-print(f'{len(instructions)} instructions processed, solving...')
+    print(f'{len(instructions)} instructions processed, solving...')
 
-solution = solve([ (0, 0) ] * 4, instructions)
-print("\nSolution =", ''.join(map(lambda x : str(x), solution[1:])))
+    solution = solve([ (0, 0) ] * 4, instructions, verbose = True)
+    print("\nSolution =", ''.join(map(lambda x : str(x), solution[1:])))
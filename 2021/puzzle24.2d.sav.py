@@ -119,18 +119,15 @@ operations = {
     'eql' : OpEql
 }
 
-inputCount = 0  # Number of input instructions parsed
-
-def parseInstr(instrStr):
-    """Parse the specified instruction string and return the compiled `Op` object."""
-    global inputCount
+def parseInstr(instrStr, inputCount):
+    """Parse the specified instruction string and return the compiled `Op` object.
+    `inputCount` is the number of input instructions parsed so far."""
     opcode, *operands = instrStr.rstrip().split(' ')
     target = Register(ord(operands[0]) - ord('w'))
     source = None
     if len(operands) < 2:
         assert(opcode == 'inp')
-        inputCount += 1
-        source = inputCount
+        source = inputCount + 1
     else:
         if operands[1] in 'wxyz':
             source = Register(ord(operands[1]) - ord('w'))
@@ -139,11 +136,12 @@ def parseInstr(instrStr):
     operation = operations[opcode]
     return operation(target, source)
 
-def solve(registers, instructions, firstInstr = 0, inputPrefix = [None]):
+def solve(registers, instructions, firstInstr = 0, inputPrefix = [None], verbose = False):
     """Try to find a solution where `instructions` leaves a zero value in
     `registers[z]` by appending to the initial sequence of inputs specified in
     `inputPrefix`.  If successful, returns the complete list of 14 inputs that
-    solves the expression.  If unsuccessful, returns `None`.
+    solves the expression.  If unsuccessful, returns `None`.  If `verbose`
+    is true, show the partial solutions as they are tried.
     """
 
     if len(inputPrefix) > 14:
@@ -177,21 +175,32 @@ def solve(registers, instructions, firstInstr = 0, inputPrefix = [None]):
             # Found partial solution.  Recurse down another level.
             # Nested levels can start after last input, since everything up to
             # that point is fixed.
-            if len(inputPrefix) < 8:
+            if verbose and len(inputPrefix) < 8:
                 print("\rPartial = %-15s" % ''.join(map(lambda x : str(x), tryInputPrefix[1:])), end='')
-            solution = solve(regsAfterInput, instructions, lastInput + 1, tryInputPrefix)
+            solution = solve(regsAfterInput, instructions, lastInput + 1, tryInputPrefix, verbose)
             if solution: return solution  # Solved!
 
     return None
 
-infile = open("puzzle24_input.txt", "r")
+def parse(infile):
+    """Return the list of compiled `Op` objects for the instructions in `infile`"""
+    instructions = [ ]
+    inputCount = 0  # Number of input instructions parsed
+    for instrStr in infile:
+        instructions.append(parseInstr(instrStr, inputCount))
+        if isinstance(instructions[-1], OpInp):
+            inputCount += 1
+    return instructions
 
-instructions = [ ]
+def part2(instructions):
+    solution = solve([ Range(0, 0) ] * 4, instructions)
+    return int(''.join(map(lambda x : str(x), solution[1:])))
 
-for instrStr in infile:
-    instructions.append(parseInstr(instrStr))
+if __name__ == "__main__":
+    infile = open("puzzle24_input.txt", "r")
+    instructions = parse(infile)
 
-print(f'{len(instructions)} instructions processed, solving...')
+    print(f'{len(instructions)} instructions processed, solving...')
 
-solution = solve([ Range(0, 0) ] * 4, instructions)
-print("\nSolution =", ''.join(map(lambda x : str(x), solution[1:])))
+    solution = solve([ Range(0, 0) ] * 4, instructions, verbose = True)
+    print("\nSolution =", ''.join(map(lambda x : str(x), solution[1:])))
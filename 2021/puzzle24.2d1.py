@@ -0,0 +1,173 @@
+# Advent of code day 24, part 2
+# Find smallest MONAD model number
+#
+# The interpreted, vectorized version of puzzle24.2d.py: the instructions are
+# executed as `Op` objects on `IntervalArray` registers, so that the bounds for
+# all nine candidates for a digit are computed in one pass.  Kept for
+# comparison with the compiled blocks of puzzle24.2d.py, which are about 17
+# times faster.
+
+import numpy as np
+from interval import Interval, IntervalArray
+from search_stats import SearchStats
+
+# Each register holds an `IntervalArray` with one element for each candidate
+# value of the input digit currently being solved for.
+candidates = np.arange(1, 10)
+
+class Register:
+    def __init__(self, index):
+        assert(isinstance(index, int))
+        self.index = index
+
+    def getRange(self, registers):
+        return registers[self.index]
+
+    def setRange(self, registers, range):
+        registers[self.index] = range
+
+class Op:
+    def __init__(self, target, source):
+        self.target = target
+        self.source = source
+
+    def exec(self, registers):
+        a = self.target.getRange(registers)
+        source = self.source
+        b = source.getRange(registers) if isinstance(source, Register) \
+            else source
+        self.target.setRange(registers, self.execImp(a, b))
+
+class OpInp(Op):
+
+    prefixValues = [None] # A list of known input values
+
+    def execImp(self, a, inputNum):
+        if inputNum < len(OpInp.prefixValues):
+            return IntervalArray.full(len(a), Interval(OpInp.prefixValues[inputNum]))
+        elif inputNum == len(OpInp.prefixValues):
+            return IntervalArray(candidates)
+        else:
+            return IntervalArray.full(len(a), Interval(1, 9))
+
+class OpAdd(Op):
+
+    def execImp(self, a, b):
+        return a.add(b)
+
+class OpMul(Op):
+
+    def execImp(self, a, b):
+        return a.mul(b)
+
+class OpDiv(Op):
+
+    def execImp(self, a, b):
+        return a.div(b)
+
+class OpMod(Op):
+
+    def execImp(self, a, b):
+        return a.mod(b)
+
+class OpEql(Op):
+
+    def execImp(self, a, b):
+        return a.eql(b)
+
+operations = {
+    'inp' : OpInp,
+    'add' : OpAdd,
+    'mul' : OpMul,
+    'div' : OpDiv,
+    'mod' : OpMod,
+    'eql' : OpEql
+}
+
+def parseInstr(instrStr, inputCount):
+    """Parse the specified instruction string and return the compiled `Op` object.
+    `inputCount` is the number of input instructions parsed so far."""
+    opcode, *operands = instrStr.rstrip().split(' ')
+    target = Register(ord(operands[0]) - ord('w'))
+    operation = operations[opcode]
+    if operation is OpInp:
+        assert(len(operands) < 2)
+        return OpInp(target, inputCount + 1)
+    elif operands[1] in 'wxyz':
+        return operation(target, Register(ord(operands[1]) - ord('w')))
+    else:
+        return operation(target, int(operands[1]))
+
+def solve(startRegisters, instructions, startInstr = 0, startInpPrefix = [None],
+          stats = None):
+    """Try to find a solution where `instructions` leaves a zero value in
+    `startRegisters[z]` by appending to the initial sequence of inputs specified in
+    `startInpPrefix`.  If successful, returns the complete list of 14 inputs that
+    solves the expression.  If unsuccessful, returns `None`.  All of the
+    `candidates` for the next input are evaluated at once.  If `stats` is a
+    `SearchStats`, the work done by the search is recorded in it.
+    """
+
+    if len(startInpPrefix) > 14:
+        return startInpPrefix  # Solved!
+    if stats:
+        stats.expanded += 1
+        stats.generated += len(candidates)
+        stats.frontier(len(startInpPrefix))
+
+    OpInp.prefixValues = startInpPrefix
+    registers = [ IntervalArray.full(len(candidates), r) for r in startRegisters ]
+    nextGroupInstr = len(instructions)
+    nextGroupRegs  = [ ]
+    # Execute instructions up to and including an `OpInp` instruction
+    for instIndex in range(startInstr, len(instructions)):
+        instruction = instructions[instIndex]
+        instruction.exec(registers)
+        if isinstance(instruction, OpInp):
+            # Take snapshot after `OpInp` instruction
+            assert(instruction.source == len(startInpPrefix))
+            nextGroupInstr = instIndex + 1
+            nextGroupRegs  = registers.copy()
+            break
+    # Execute the remaining instructions
+    for instIndex in range(nextGroupInstr, len(instructions)):
+        instruction = instructions[instIndex]
+        instruction.exec(registers)
+
+    # Recurse down another level for each candidate for which the z register
+    # could be zero.  Nested levels can start after last input, since
+    # everything up to that point is fixed.
+    feasible = np.flatnonzero(registers[3].contains(0))
+    if stats: stats.pruned += len(candidates) - len(feasible)
+    for i in feasible:
+        solution = solve([ r[i] for r in nextGroupRegs ], instructions,
+                         nextGroupInstr, startInpPrefix + [ int(candidates[i]) ],
+                         stats)
+        if solution: return solution  # Solved!
+
+    return None
+
+def parse(infile):
+    """Return the list of compiled `Op` objects for the instructions in `infile`"""
+    instructions = [ ]
+    inputCount = 0  # Number of input instructions parsed
+    for instrStr in infile:
+        instructions.append(parseInstr(instrStr, inputCount))
+        if isinstance(instructions[-1], OpInp):
+            inputCount += 1
+    return instructions
+
+def part2(instructions):
+    solution = solve([ Interval(0) ] * 4, instructions)
+    return int(''.join(map(lambda x : str(x), solution[1:])))
+
+if __name__ == "__main__":
+    infile = open("puzzle24_input.txt", "r")
+    instructions = parse(infile)
+
+    print(f'{len(instructions)} instructions processed, solving...')
+
+    stats = SearchStats()
+    solution = solve([ Interval(0) ] * 4, instructions, stats = stats)
+    print("\nSolution =", ''.join(map(lambda x : str(x), solution[1:])))
+    stats.report()
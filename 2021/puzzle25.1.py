@@ -2,6 +2,7 @@
 # How many steps before the sea cucumbers top moving
 
 import numpy as np
+from automaton import Automaton
 
 # Constants
 class SeaMap:
@@ -33,38 +34,40 @@ class SeaMap:
         for line in infile:
             row = list(map(lambda x : self.symbolToInt[x], line.rstrip()))
             maplist.append(row)
-        self.maparray = np.array(maplist)
+        self.maparray = np.array(maplist, dtype = np.int8)
 
-    def moveEast(self):
-        """Move east when possible. Return True on success False if no moves"""
-        destMask = self.maparray == self.Empty
-        srcMask  = self.maparray == self.East
-        shiftedMask = np.concatenate((destMask[:,1:], destMask[:,0:1]), axis=1)
-        srcMask  = srcMask & shiftedMask
-        destMask = np.concatenate((srcMask[:,-1:], srcMask[:,0:-1]), axis=1)
-        self.maparray[srcMask]  = self.Empty
-        self.maparray[destMask] = self.East
-        return srcMask.any()  # True if anything moved
+def moveHerd(maparray, herd, axis):
+    """Return `maparray` after every sea cucumber of `herd` whose next cell
+    along `axis` (wrapping around) is empty has moved into it"""
+    movers = (maparray == herd) & np.roll(maparray == SeaMap.Empty, -1, axis)
+    result = maparray.copy()
+    result[movers] = SeaMap.Empty
+    result[np.roll(movers, 1, axis)] = herd
+    return result
 
-    def moveSouth(self):
-        """Move east when possible. Return True on success False if no moves"""
-        destMask = self.maparray == self.Empty
-        srcMask  = self.maparray == self.South
-        shiftedMask = np.concatenate((destMask[1:,:], destMask[0:1,:]), axis=0)
-        srcMask  = srcMask & shiftedMask
-        destMask = np.concatenate((srcMask[-1:,:], srcMask[0:-1,:]), axis=0)
-        self.maparray[srcMask]  = self.Empty
-        self.maparray[destMask] = self.South
-        return srcMask.any()  # True if anything moved
+def step(maparray):
+    """Return the map after one step: the east-facing herd moves, then the
+    south-facing herd"""
+    return moveHerd(moveHerd(maparray, SeaMap.East, 1), SeaMap.South, 0)
 
-infile = open("puzzle25_input.txt", "r")
+def parse(infile):
+    m = SeaMap()
+    m.read(infile)
+    return m
 
-m = SeaMap()
-m.read(infile)
-steps = 0
-while m.moveEast() | m.moveSouth():
-    steps += 1
+def part1(seaMap, verbose = False):
+    """Return the first step on which no sea cucumber moves, i.e., the
+    generation at which the automaton reaches a fixed point"""
+    herds = Automaton(seaMap.maparray, step)
+    herds.run()
+    if verbose: herds.report()
+    assert(herds.period == 1)
+    return herds.generation
 
-# print(f"After {steps} steps")
-# print(m)
-print(f"First failed step = {steps + 1}")
+if __name__ == "__main__":
+    infile = open("puzzle25_input.txt", "r")
+
+    m = parse(infile)
+
+    # print(m)
+    print(f"First failed step = {part1(m, verbose = True)}")
@@ -1,32 +1,45 @@
 # Advent of Code day 3, part 1
 # Compute the gamma and epsilon rate from a diagnostic report
 
-infile = open("puzzle3_input.txt", "r")   # Input: five bits per line
-
-zeros = [ ]
-ones  = [ ]
-
-for str in infile:
-    str = str.strip(" \n")
-    while len(str) > len(zeros):
-        zeros.append(0)
-        ones.append(0)
-    for pos in range(len(str)):
-        if str[pos] == '0':
-            zeros[pos] += 1
+def parse(infile):
+    """Return the list of bit strings in `infile`"""
+    return [ str.strip(" \n") for str in infile ]
+
+def rates(data):
+    """Return the gamma and epsilon rates for the bit strings in `data`"""
+    zeros = [ ]
+    ones  = [ ]
+
+    for str in data:
+        while len(str) > len(zeros):
+            zeros.append(0)
+            ones.append(0)
+        for pos in range(len(str)):
+            if str[pos] == '0':
+                zeros[pos] += 1
+            else:
+                ones[pos] += 1
+
+    gammaRate    = 0
+    epsilonRate  = 0
+
+    for pos in range(len(zeros)):
+        gammaRate *= 2
+        epsilonRate *= 2
+        if ones[pos] > zeros[pos]:
+            gammaRate += 1
         else:
-            ones[pos] += 1
+            epsilonRate += 1
+
+    return (gammaRate, epsilonRate)
 
-gammaRate    = 0
-epsilonRate  = 0
+def part1(data):
+    gammaRate, epsilonRate = rates(data)
+    return gammaRate * epsilonRate
 
-for pos in range(len(zeros)):
-    gammaRate *= 2
-    epsilonRate *= 2
-    if ones[pos] > zeros[pos]:
-        gammaRate += 1
-    else:
-        epsilonRate += 1
+if __name__ == "__main__":
+    infile = open("puzzle3_input.txt", "r")   # Input: five bits per line
+    gammaRate, epsilonRate = rates(parse(infile))
 
-print("Gamma = {}, Epsilon = {}, product = {}".format(gammaRate, epsilonRate, \
-                                                      gammaRate*epsilonRate))
+    print("Gamma = {}, Epsilon = {}, product = {}".format(gammaRate, epsilonRate, \
+                                                          gammaRate*epsilonRate))
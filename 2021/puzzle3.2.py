@@ -1,8 +1,6 @@
 # Advent of Code day 3, part 2
 # Compute the oxygen generator and CO2 scrubber ratings from diagnostic input
 
-infile = open("puzzle3_input.txt", "r")   # Input: five bits per line
-
 # Examine the `pos` digit of each string in `data` and partition it into two
 # arrays: where the specified digit is 1 and where the specified digit is 0. If
 # `keepMost` is `True`, return the larger partition, otherwise return the
@@ -49,10 +47,22 @@ def bitstringToInt(str):
     return result
 
 # Read the data file into an array of strings, one string per entry.
-testdata = infile.read().split("\n")
+def parse(infile):
+    return infile.read().split("\n")
+
+# Return the oxygen generator and CO2 scrubber ratings for `data`
+def ratings(data):
+    oxygenGen   = bitstringToInt(findBest(data, True))
+    CO2Scrubber = bitstringToInt(findBest(data, False))
+    return (oxygenGen, CO2Scrubber)
+
+def part2(data):
+    oxygenGen, CO2Scrubber = ratings(data)
+    return oxygenGen * CO2Scrubber
 
-oxygenGen   = bitstringToInt(findBest(testdata, True))
-CO2Scrubber = bitstringToInt(findBest(testdata, False))
+if __name__ == "__main__":
+    infile = open("puzzle3_input.txt", "r")   # Input: five bits per line
+    oxygenGen, CO2Scrubber = ratings(parse(infile))
 
-print("O2 = {}, CO2 = {}, life support = {}".format(oxygenGen, CO2Scrubber,
-                                                    oxygenGen*CO2Scrubber))
+    print("O2 = {}, CO2 = {}, life support = {}".format(oxygenGen, CO2Scrubber,
+                                                        oxygenGen*CO2Scrubber))
@@ -37,6 +37,16 @@ class Board:
                 return True  # Bingo!
         return False
 
+    # Return a copy of this board, so that it can be marked without changing
+    # the original
+    def copy(self):
+        board = Board()
+        board.__dict__.update(self.__dict__)
+        board.squares  = list(self.squares)
+        board.rowMarks = list(self.rowMarks)
+        board.colMarks = list(self.colMarks)
+        return board
+
     # Given the last number matched, return the score for this board
     def score(self, lastnum):
         accum = 0
@@ -65,29 +75,42 @@ def blankLine(infile):
     assert line == "\n"
     return True
 
-# Read data file
-infile = open("puzzle4_input.txt", "r")
+# Read data file.  Return the sequence of random numbers and the list of
+# boards.
+def parse(infile):
+    randomSeq = [ ]
+    for ranStr in infile.readline().split(','):
+        randomSeq.append(int(ranStr))
+
+    boards = [ ]
+    while blankLine(infile):
+        boards.append(Board().read(infile))
+    return (randomSeq, boards)
 
-randomSeq = [ ]
-for ranStr in infile.readline().split(','):
-    randomSeq.append(int(ranStr))
+# Play bingo on copies of `boards`.  Return the first board to win and the
+# number that made it win, or `(None, None)` if no board wins.
+def playBingo(randomSeq, boards):
+    boards = [ board.copy() for board in boards ]
+    for ran in randomSeq:
+        for board in boards:
+            if board.mark(ran):
+                return (board, ran)
+    return (None, None)
 
-boards = [ ]
-while blankLine(infile):
-    boards.append(Board().read(infile))
-infile.close()
+def part1(data):
+    board, ran = playBingo(*data)
+    return board.score(ran)
 
-for board in boards:
-    board.print()
+if __name__ == "__main__":
+    infile = open("puzzle4_input.txt", "r")
+    randomSeq, boards = parse(infile)
+    infile.close()
 
-done = False
-for ran in randomSeq:
     for board in boards:
-        if board.mark(ran):
-            print("Bingo on {}!".format(ran))
-            board.print()
-            print("Score = {}".format(board.score(ran)))
-            done = True
-            break
-    if done:
-        break
+        board.print()
+
+    board, ran = playBingo(randomSeq, boards)
+    if board:
+        print("Bingo on {}!".format(ran))
+        board.print()
+        print("Score = {}".format(board.score(ran)))
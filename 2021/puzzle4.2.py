@@ -38,6 +38,16 @@ class Board:
                 return True
         return False
 
+    # Return a copy of this board, so that it can be marked without changing
+    # the original
+    def copy(self):
+        board = Board()
+        board.__dict__.update(self.__dict__)
+        board.squares  = list(self.squares)
+        board.rowMarks = list(self.rowMarks)
+        board.colMarks = list(self.colMarks)
+        return board
+
     # Given the last number matched, return the score for this board
     def score(self, lastnum):
         accum = 0
@@ -66,31 +76,45 @@ def blankLine(infile):
     assert line == "\n"
     return True
 
-# Read data file
-infile = open("puzzle4_input.txt", "r")
+# Read data file.  Return the sequence of random numbers and the list of
+# boards.
+def parse(infile):
+    randomSeq = [ ]
+    for ranStr in infile.readline().split(','):
+        randomSeq.append(int(ranStr))
+
+    boards = [ ]
+    while blankLine(infile):
+        boards.append(Board().read(infile))
+    return (randomSeq, boards)
 
-randomSeq = [ ]
-for ranStr in infile.readline().split(','):
-    randomSeq.append(int(ranStr))
+# Play bingo on copies of `boards` and find the *last* board to win.  Return
+# that board and the number that made it win.
+def lastToWin(randomSeq, boards):
+    boards = [ board.copy() for board in boards ]
+    lastwin = ''
+    lastcall = -1
+    for call in randomSeq:
+        for board in boards:
+            if not board.bingo and board.mark(call):
+                lastwin = board
+                lastcall = call
+    return (lastwin, lastcall)
 
-boards = [ ]
-while blankLine(infile):
-    boards.append(Board().read(infile))
-infile.close()
+def part2(data):
+    lastwin, lastcall = lastToWin(*data)
+    return lastwin.score(lastcall)
 
-# for board in boards:
-#     board.print()
+if __name__ == "__main__":
+    infile = open("puzzle4_input.txt", "r")
+    randomSeq, boards = parse(infile)
+    infile.close()
 
-# Find the *last* board to win
-lastwin = ''
-lastcall = -1
-for call in randomSeq:
-    for board in boards:
-        if not board.bingo and board.mark(call):
-            lastwin = board
-            lastcall = call
+    # for board in boards:
+    #     board.print()
 
+    lastwin, lastcall = lastToWin(randomSeq, boards)
 
-print("Final bingo on {}!".format(lastcall))
-lastwin.print()
-print("Score = {}".format(lastwin.score(lastcall)))
+    print("Final bingo on {}!".format(lastcall))
+    lastwin.print()
+    print("Score = {}".format(lastwin.score(lastcall)))
@@ -3,16 +3,11 @@
 
 import re
 
-ventMap = { }  # Dictionary containing one entry per integer coordinate
-               # containing at least one vent.
-
-totalIntersections = 0
-
-# Add entries to the map for the specified line.
-# Keep track of intersections of at least two lines.
-def markLine(x1, y1, x2, y2):
-    global ventMap
-    global totalIntersections
+# Add entries to `ventMap` for the specified line.  `ventMap` is a dictionary
+# containing one entry per integer coordinate containing at least one vent.
+# Return the number of new intersections of at least two lines.
+def markLine(ventMap, x1, y1, x2, y2):
+    newIntersections = 0
 
     xstep = 0
     if x1 < x2:
@@ -27,7 +22,7 @@ def markLine(x1, y1, x2, y2):
         ystep = -1
 
     if xstep != 0 and ystep != 0:
-        return # Skip diagonals
+        return 0 # Skip diagonals
 
     x = x1
     y = y1
@@ -36,16 +31,30 @@ def markLine(x1, y1, x2, y2):
         count = ventMap.get(coordStr, 0) + 1
         ventMap[coordStr] = count
         if count == 2:
-            totalIntersections += 1
+            newIntersections += 1
         x += xstep
         y += ystep
-
-infile = open("puzzle5_input.txt", "r")
-
-for lineStr in infile:
-    [lineStartStr, lineEndStr] = re.split(" *-> *", lineStr)
-    [x1Str, y1Str] = lineStartStr.split(',')
-    [x2Str, y2Str] = lineEndStr.split(',')
-    markLine(int(x1Str), int(y1Str), int(x2Str), int(y2Str))
-
-print("Total intersections = {}".format(totalIntersections))
+    return newIntersections
+
+# Return the list of lines, (x1, y1, x2, y2), in `infile`
+def parse(infile):
+    lines = [ ]
+    for lineStr in infile:
+        [lineStartStr, lineEndStr] = re.split(" *-> *", lineStr)
+        [x1Str, y1Str] = lineStartStr.split(',')
+        [x2Str, y2Str] = lineEndStr.split(',')
+        lines.append((int(x1Str), int(y1Str), int(x2Str), int(y2Str)))
+    return lines
+
+def part1(lines):
+    ventMap = { }
+    totalIntersections = 0
+    for x1, y1, x2, y2 in lines:
+        totalIntersections += markLine(ventMap, x1, y1, x2, y2)
+    return totalIntersections
+
+if __name__ == "__main__":
+    infile = open("puzzle5_input.txt", "r")
+    totalIntersections = part1(parse(infile))
+
+    print("Total intersections = {}".format(totalIntersections))
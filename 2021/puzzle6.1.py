@@ -1,22 +1,30 @@
 # Advent of Code day 6, part 1
 # lanternfish population after 80 days
 
-counterPopulations = [ 0, 0, 0, 0, 0, 0, 0, 0, 0 ]
+# Return the list of initial counters in `infile`
+def parse(infile):
+    return [ int(counterStr) for counterStr in infile.read().split(',') ]
 
-infile = open("puzzle6_input.txt", "r")
+def part1(counters):
+    counterPopulations = [ 0, 0, 0, 0, 0, 0, 0, 0, 0 ]
 
-for counterStr in infile.read().split(','):
-    counter = int(counterStr)
-    counterPopulations[counter] += 1
+    for counter in counters:
+        counterPopulations[counter] += 1
 
-for day in range(80):
-    spawn = counterPopulations[0]
-    counterPopulations.pop(0)
-    counterPopulations.append(spawn)
-    counterPopulations[6] += spawn
+    for day in range(80):
+        spawn = counterPopulations[0]
+        counterPopulations.pop(0)
+        counterPopulations.append(spawn)
+        counterPopulations[6] += spawn
 
-population = 0
-for counter in counterPopulations:
-    population += counter
+    population = 0
+    for counter in counterPopulations:
+        population += counter
 
-print("Population after 80 days = ", population)
+    return population
+
+if __name__ == "__main__":
+    infile = open("puzzle6_input.txt", "r")
+    population = part1(parse(infile))
+
+    print("Population after 80 days = ", population)
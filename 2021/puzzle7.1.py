@@ -12,27 +12,35 @@ def fuelUse(positions, x):
             ret += pos - x
     return ret
 
-infile = open("puzzle7_input.txt", "r")
+# Return the sorted list of crab positions in `infile`
+def parse(infile):
+    positions = [ ]
+    for str in infile.read().split(','):
+        positions.append(int(str))
 
-positions = [ ]
-for str in infile.read().split(','):
-    positions.append(int(str))
+    positions.sort()
+    return positions
 
-positions.sort()
+def part1(positions):
+    # Compute fuel use for every position, choosing the smallest.
+    # Because the positions are sorted, if the fuel use goes up, then we've already
+    # seen the minimum.
+    #
+    # Note that there is probably a more efficient way to do this than to compute
+    # the fuel use for every position using trial and error, but I'm too tired
+    # today to figure out the algorithm.
+    bestSoFar = fuelUse(positions, 0)
+    for x in range(1, len(positions)):
+        fuel = fuelUse(positions, x)
+        if (fuel > bestSoFar):
+            break
+        else:
+            bestSoFar = fuel
+
+    return bestSoFar
 
-# Compute fuel use for every position, choosing the smallest.
-# Because the positions are sorted, if the fuel use goes up, then we've already
-# seen the minimum.
-#
-# Note that there is probably a more efficient way to do this than to compute
-# the fuel use for every position using trial and error, but I'm too tired
-# today to figure out the algorithm.
-bestSoFar = fuelUse(positions, 0)
-for x in range(1, len(positions)):
-    fuel = fuelUse(positions, x)
-    if (fuel > bestSoFar):
-        break
-    else:
-        bestSoFar = fuel
+if __name__ == "__main__":
+    infile = open("puzzle7_input.txt", "r")
+    bestSoFar = part1(parse(infile))
 
-print("Optimal fuel use = ", bestSoFar)
+    print("Optimal fuel use = ", bestSoFar)
@@ -8,17 +8,28 @@ numSegsToDigit = {
     7 : 8
     }
 
-infile = open("puzzle8_input.txt", "r")
+# Return the list of (patterns, outputs) in `infile`
+def parse(infile):
+    entries = [ ]
+    for line in infile:
+        # patternStr, outputStr = line.split('|')
+        # patterns = patternStr.split()
+        # outputs = outputStr.split()
+        patterns, outputs = [x.split() for x in line.split('|')]
+        # patterns, outputs = list(map(lambda x : x.split(), line.split('|')))
+        entries.append((patterns, outputs))
+    return entries
 
-result = 0
-for line in infile:
-    # patternStr, outputStr = line.split('|')
-    # patterns = patternStr.split()
-    # outputs = outputStr.split()
-    patterns, outputs = [x.split() for x in line.split('|')]
-    # patterns, outputs = list(map(lambda x : x.split(), line.split('|')))
-    for segments in outputs:
-        if numSegsToDigit.get(len(segments), False):
-            result += 1
+def part1(entries):
+    result = 0
+    for patterns, outputs in entries:
+        for segments in outputs:
+            if numSegsToDigit.get(len(segments), False):
+                result += 1
+    return result
 
-print("Count of 1, 4, 7, or 8 = ", result)
+if __name__ == "__main__":
+    infile = open("puzzle8_input.txt", "r")
+    result = part1(parse(infile))
+
+    print("Count of 1, 4, 7, or 8 = ", result)
@@ -48,11 +48,13 @@ numsegsToSegIntersect = {
     7 : digitToSegs[8]
     }
 
-infile = open("puzzle8_input.txt", "r")
-inputLines = list(infile)
+# Return the list of (patterns, outputs) in `infile`
+def parse(infile):
+    return [ [x.split() for x in line.split('|')] for line in infile ]
 
-sum = 0
-for line in inputLines:
+# Deduce the segment wiring from `patterns` and return the value displayed by
+# `outputs`
+def decode(patterns, outputs):
     # Dictionary that maps unsolved remapped segments to possible solutions
     unsolved = {
         'a' : allsegs.copy(),
@@ -67,8 +69,7 @@ for line in inputLines:
     # Dictionary that maps solves remapped segment to its correct value
     solved = { }
 
-    patterns, outputs = [x.split() for x in line.split('|')]
-    patterns.sort(key = lambda x : len(x))
+    patterns = sorted(patterns, key = lambda x : len(x))
 
     for pattern in patterns:
         for remappedSeg in pattern:
@@ -92,7 +93,19 @@ for line in inputLines:
     for output in outputs:
         resultVal *= 10
         resultVal += segsToDigit(set(map(lambda x : solved[x], output)))
-    print("result = ", resultVal)
-    sum += resultVal
+    return resultVal
 
-print("sum = ", sum)
+def part2(entries):
+    return sum(decode(patterns, outputs) for patterns, outputs in entries)
+
+if __name__ == "__main__":
+    infile = open("puzzle8_input.txt", "r")
+    inputLines = parse(infile)
+
+    total = 0
+    for patterns, outputs in inputLines:
+        resultVal = decode(patterns, outputs)
+        print("result = ", resultVal)
+        total += resultVal
+
+    print("sum = ", total)
@@ -3,10 +3,9 @@
 
 import copy
 
+# Return the size of the basin around the low point (i, j) of `heightmap`, a
 # 2-D array fo numbers 0 to 9
-heightmap = [ ]
-
-def basinSize(i, j):
+def basinSize(heightmap, i, j):
     hm = copy.deepcopy(heightmap)   # Mutate `hm` as we traverse it
     workStack = [ (i, j) ]  # Cells to process
 
@@ -31,29 +30,50 @@ def basinSize(i, j):
 
     return size
 
-infile = open("puzzle9_input.txt", "r")
-
-for line in infile:
-    heightmap.append(list(map(int, line.rstrip())))
+# Return the heightmap in `infile`
+def parse(infile):
+    heightmap = [ ]
+    for line in infile:
+        heightmap.append(list(map(int, line.rstrip())))
+    return heightmap
 
-largestBasins = [ 0, 0, 0 ]  # Three largest basins sizes
-for i, row in enumerate(heightmap):
-    for j, cell in enumerate(row):
-        if i > 0 and heightmap[i - 1][j] <= cell:
-            continue
-        elif j > 0 and row[j - 1] <= cell:
-            continue
-        elif i < len(heightmap) - 1 and heightmap[i + 1][j] <= cell:
-            continue
-        elif j < len(row) - 1 and row[j + 1] <= cell:
-            continue
+# Return the list of basins, (i, j, size), around the low points in `heightmap`
+def basins(heightmap):
+    result = [ ]
+    for i, row in enumerate(heightmap):
+        for j, cell in enumerate(row):
+            if i > 0 and heightmap[i - 1][j] <= cell:
+                continue
+            elif j > 0 and row[j - 1] <= cell:
+                continue
+            elif i < len(heightmap) - 1 and heightmap[i + 1][j] <= cell:
+                continue
+            elif j < len(row) - 1 and row[j + 1] <= cell:
+                continue
 
-        basin = basinSize(i, j)
-        print("Lowpoint = ({}, {}), basin = {}".format(i, j, basin))
+            result.append((i, j, basinSize(heightmap, i, j)))
+    return result
 
+# Return the three largest basin sizes, in ascending order
+def largest(basinList):
+    largestBasins = [ 0, 0, 0 ]  # Three largest basins sizes
+    for i, j, basin in basinList:
         if basin > largestBasins[0]:
             largestBasins[0] = basin
             largestBasins.sort()
+    return largestBasins
+
+def part2(heightmap):
+    largestBasins = largest(basins(heightmap))
+    return largestBasins[0] * largestBasins[1] * largestBasins[2]
+
+if __name__ == "__main__":
+    infile = open("puzzle9_input.txt", "r")
+    basinList = basins(parse(infile))
+
+    for i, j, basin in basinList:
+        print("Lowpoint = ({}, {}), basin = {}".format(i, j, basin))
 
-print("Largest basins = ", largestBasins, ", product = ",\
-      largestBasins[0] * largestBasins[1] * largestBasins[2])
+    largestBasins = largest(basinList)
+    print("Largest basins = ", largestBasins, ", product = ",\
+          largestBasins[0] * largestBasins[1] * largestBasins[2])
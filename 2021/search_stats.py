@@ -0,0 +1,43 @@
+# Search statistics module
+#
+# Counters describing the work done by a search, so that a change to a search
+# can be judged by whether it reduced the work or merely made each step
+# cheaper.  A search takes an optional `SearchStats` object and updates its
+# counters directly (e.g., `stats.expanded += 1`); callers that do not want
+# statistics pass `None`, and the search skips the bookkeeping.  `report`
+# prints a one-line summary of `name=value` pairs to stderr, which
+# *runpuzzles.py* parses into the benchmark history.
+
+import sys
+
+class SearchStats:
+    """Work counters for one search"""
+
+    # Counter names, in the order in which they are reported
+    counters = ('generated', 'expanded', 'duplicates', 'pruned',
+                'memoHits', 'memoMisses', 'peakFrontier')
+
+    def __init__(self):
+        self.generated    = 0  # Successor nodes produced
+        self.expanded     = 0  # Nodes whose successors were produced
+        self.duplicates   = 0  # Successors discarded as already reached as cheaply
+        self.pruned       = 0  # Branches cut off without being searched
+        self.memoHits     = 0  # Results found in a memo
+        self.memoMisses   = 0  # Results not found in a memo, so computed
+        self.peakFrontier = 0  # Largest size of the queue or recursion stack
+
+    def frontier(self, size):
+        """Record a frontier (queue or recursion stack) of `size` nodes"""
+        if size > self.peakFrontier: self.peakFrontier = size
+
+    def asDict(self):
+        return { name : getattr(self, name) for name in self.counters }
+
+    def summary(self):
+        """Return a one-line summary of the counters"""
+        return "Search stats: " + " ".join(f"{name}={getattr(self, name)}"
+                                           for name in self.counters)
+
+    def report(self, file = None):
+        """Print `summary()` to `file` (by default, stderr)"""
+        print(self.summary(), file = file or sys.stderr)
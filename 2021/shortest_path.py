@@ -0,0 +1,230 @@
+# Shortest-path search module
+#
+# A heap-backed implementation of Dijkstra's algorithm and A* search over an
+# implicit graph, described by callbacks that enumerate the neighbors of a node
+# and (for A*) estimate the remaining cost from a node to the goal.  For a grid
+# whose cells have small positive integer costs, `gridShortestPath` implements
+# Dial's algorithm, which replaces the heap with a circular array of buckets,
+# one per cost, and keeps its state in flat arrays indexed by cell number.
+
+import heapq
+import itertools
+from array import array
+
+class PriorityQueue:
+    """A priority queue of hashable items supporting decrease-key.  Each item
+    appears in the queue at most once.  Decreasing the priority of an item
+    pushes a new heap entry and leaves the old one in place; stale entries are
+    discarded lazily when they reach the top of the heap."""
+
+    def __init__(self):
+        self.heap     = [ ]                # (priority, sequence, item)
+        self.priority = { }                # Current priority of queued items
+        self.sequence = itertools.count()  # Breaks ties in FIFO order
+
+    def __len__(self):
+        return len(self.priority)
+
+    def __contains__(self, item):
+        return item in self.priority
+
+    def push(self, item, priority):
+        """Insert `item` with the specified `priority` or, if `item` is already
+        queued with a higher priority value, decrease its priority.  Return
+        `True` if the queue was changed, else `False`."""
+        old = self.priority.get(item)
+        if old is not None and old <= priority:
+            return False
+        self.priority[item] = priority
+        heapq.heappush(self.heap, (priority, next(self.sequence), item))
+        return True
+
+    def pop(self):
+        """Remove and return (as a tuple) the item having the lowest priority
+        value and its priority.  Raises `IndexError` if the queue is empty."""
+        while self.heap:
+            priority, _, item = heapq.heappop(self.heap)
+            if self.priority.get(item) == priority:
+                del self.priority[item]
+                return (item, priority)
+        raise IndexError("pop from empty PriorityQueue")
+
+def shortestPath(start, isGoal, neighbors, heuristic = None, wantPath = False,
+                 progress = None, stats = None):
+    """Search for the lowest-cost path from `start` to any node for which
+    `isGoal(node)` is true and return a tuple `(goal, cost, path)`.  Nodes may
+    be any hashable value other than `None`.  `neighbors(node)` must return an
+    iterable of `(nextNode, edgeCost)` tuples, where `edgeCost` is
+    non-negative.  If `heuristic` is supplied, the search is A* and
+    `heuristic(node)` must return a lower bound on the cost from `node` to the
+    nearest goal that never decreases by more than the cost of an edge (i.e.,
+    it is consistent); otherwise, the search is Dijkstra's algorithm.  If `wantPath` is true,
+    predecessors are recorded and `path` is the list of nodes from `start` to
+    `goal`; otherwise `path` is `None`.  If no goal is reachable, all three
+    elements of the returned tuple are `None`.  If `progress` is a
+    `progress.ProgressReporter`, it is ticked for each node expanded.  If
+    `stats` is a `search_stats.SearchStats`, its counters are updated.
+    """
+    bestCost = { start : 0 }
+    predecessor = { start : None } if wantPath else None
+    queue = PriorityQueue()
+    queue.push(start, heuristic(start) if heuristic else 0)
+    tick = progress.tick if progress and progress.enabled else None
+
+    while queue:
+        node, _ = queue.pop()
+        cost = bestCost[node]
+        if tick: tick(len(queue), cost, node)
+        if isGoal(node):
+            if progress: progress.done()
+            path = reconstructPath(predecessor, node) if wantPath else None
+            return (node, cost, path)
+        if stats: stats.expanded += 1
+        for nextNode, edgeCost in neighbors(node):
+            if stats: stats.generated += 1
+            newCost = cost + edgeCost
+            if newCost >= bestCost.get(nextNode, newCost + 1):
+                if stats: stats.duplicates += 1
+                continue
+            bestCost[nextNode] = newCost
+            if wantPath: predecessor[nextNode] = node
+            queue.push(nextNode,
+                       newCost + heuristic(nextNode) if heuristic else newCost)
+        if stats: stats.frontier(len(queue))
+
+    if progress: progress.done()
+    return (None, None, None)
+
+def reconstructPath(predecessor, node):
+    """Return the list of nodes from the start of a search to `node`, by
+    following the `predecessor` map back from `node`."""
+    path = [ ]
+    while node is not None:
+        path.append(node)
+        node = predecessor[node]
+    path.reverse()
+    return path
+
+class BlockArray:
+    """A sequence of `n` `int32` values, initially all `fill`, stored as a
+    dictionary of blocks of `2**blockBits` consecutive elements.  A block is
+    allocated when one of its elements is first set, so the memory used is
+    proportional to the part of the sequence that has been written, e.g., the
+    part of a grid that a search has reached."""
+
+    def __init__(self, n, fill, blockBits = 12):
+        self.n          = n
+        self.fill       = fill
+        self.blockBits  = blockBits
+        self.mask       = (1 << blockBits) - 1
+        self.blocks     = { }
+        self.emptyBlock = array('i', [ fill ]) * (1 << blockBits)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        block = self.blocks.get(i >> self.blockBits)
+        return self.fill if block is None else block[i & self.mask]
+
+    def __setitem__(self, i, value):
+        block = self.blocks.get(i >> self.blockBits)
+        if block is None:
+            block = self.blocks[i >> self.blockBits] = array('i', self.emptyBlock)
+        block[i & self.mask] = value
+
+    def allocated(self):
+        """Return the number of elements in the allocated blocks"""
+        return len(self.blocks) << self.blockBits
+
+def denseArray(n, fill):
+    """Return an `int32` array of `n` elements, all `fill`"""
+    return array('i', [ fill ]) * n
+
+def gridShortestPath(weights, cols, start, goal, maxWeight = 9, stats = None,
+                     store = denseArray, progress = None, wantPath = True):
+    """Return a tuple `(cost, predecessor)` for the lowest-cost path from cell
+    `start` to cell `goal` of a grid having `cols` columns, where each cell is
+    numbered `row * cols + col` and `weights[cell]`, an integer from 1 to
+    `maxWeight`, is the cost of entering it from any of its 4 neighbors.
+    `weights` is any flat sequence of integers (e.g., `bytes`).  This is
+    Dial's algorithm: a node whose cost is `c` waits in bucket `c % (maxWeight
+    + 1)`, so that finding the next node takes constant time, and the costs
+    and predecessors are kept in `int32` arrays of one element per cell.
+    `predecessor[cell]` is the cell from which `cell` was reached (-1 for the
+    start and unreached cells); pass it to `gridPath` to obtain the path.  If
+    `wantPath` is false, the predecessors are not kept and `predecessor` is
+    `None`.  If the goal is unreachable, `cost` is `None`.  If `stats` is a
+    `search_stats.SearchStats`, its counters are updated.  `store(n, fill)`
+    creates the costs and predecessors; pass `BlockArray` to allocate them only
+    where the search goes, for grids too large to hold in memory.  `weights`
+    may similarly compute the weights on demand in its `__getitem__`.  If
+    `progress` is a `progress.ProgressReporter`, it is ticked for each cell
+    expanded.
+
+    The buckets are relaxed one cell at a time by interpreted Python, so the
+    time is linear in the number of cells expanded but not small: about 1 us
+    per cell on a fast machine, so that a 2000x2000 grid takes 4 s there, but
+    23 s on a slower one.  Leaving out the predecessors saves little time.
+    """
+    n = len(weights)
+    unreached = 2**31 - 1
+    dist = store(n, unreached)
+    predecessor = store(n, -1) if wantPath else None
+    nbuckets = maxWeight + 1
+    buckets = [ [ ] for i in range(nbuckets) ]
+    dist[start] = 0
+    buckets[0].append(start)
+    queued = 1
+    expanded = generated = duplicates = peakFrontier = 0
+    tick = progress.tick if progress and progress.enabled else None
+
+    cost, found = 0, False
+    while queued and not found:
+        bucket = buckets[cost % nbuckets]
+        while bucket:  # Weights are positive, so nothing is added to `bucket`
+            cell = bucket.pop()
+            queued -= 1
+            if dist[cell] != cost: continue  # Stale; reached more cheaply since
+            if cell == goal:
+                found = True
+                break
+            expanded += 1
+            if tick: tick(queued, cost, cell)
+            col = cell % cols
+            for nextCell in (cell - cols if cell >= cols else -1,
+                             cell + cols if cell + cols < n else -1,
+                             cell - 1 if col else -1,
+                             cell + 1 if col + 1 < cols else -1):
+                if nextCell < 0: continue
+                generated += 1
+                nextCost = cost + weights[nextCell]
+                if nextCost < dist[nextCell]:
+                    dist[nextCell] = nextCost
+                    if wantPath: predecessor[nextCell] = cell
+                    buckets[nextCost % nbuckets].append(nextCell)
+                    queued += 1
+                else:
+                    duplicates += 1
+            if queued > peakFrontier: peakFrontier = queued
+        else:
+            cost += 1
+
+    if progress: progress.done()
+    if stats:
+        stats.expanded   += expanded
+        stats.generated  += generated
+        stats.duplicates += duplicates
+        stats.frontier(peakFrontier)
+    return (cost if found else None, predecessor)
+
+def gridPath(predecessor, cols, goal):
+    """Return the list of `(row, col)` cells from the start of a
+    `gridShortestPath` search to cell `goal`"""
+    path = [ ]
+    cell = goal
+    while cell >= 0:
+        path.append(divmod(cell, cols))
+        cell = predecessor[cell]
+    path.reverse()
+    return path
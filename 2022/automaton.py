@@ -0,0 +1,129 @@
+#! /usr/bin/python3
+
+# Cellular automaton module
+#
+# An `Automaton` holds the state of a grid automaton as a numpy array and
+# advances it by applying a rule, a function from one state array to the next
+# that is written with whole-array operations (shifts, masks, and lookup
+# tables) rather than a loop over the cells.  Each new state is hashed by its
+# bytes, so that the first repeated state is noticed as soon as it is reached:
+# a fixed point has a period of 1, and once the period is known, the state at
+# any later generation is looked up instead of being simulated.  The time spent
+# stepping is recorded so that `report` can print the steps per second.
+
+import sys
+import time
+import hashlib
+
+import numpy as np
+
+class Automaton:
+    """A cellular automaton whose initial state is the numpy array `state` and
+    whose next state is computed by `rule(state)`.  If `detectCycles` is true,
+    each state is hashed and the first repeated state sets `cycleStart` (the
+    first generation of the cycle) and `period`.  If `keepHistory` is also
+    true, every state is kept, so that `stateAt` can return earlier states and
+    later states can be found from the cycle."""
+
+    def __init__(self, state, rule, detectCycles = True, keepHistory = False):
+        self.state        = state
+        self.rule         = rule
+        self.generation   = 0
+        self.detectCycles = detectCycles
+        self.history      = [ state ] if keepHistory else None
+        self.seen         = { self._digest(state) : 0 } if detectCycles else None
+        self.cycleStart   = None
+        self.period       = None
+        self.elapsed      = 0.0  # Seconds spent in `step`
+
+    @staticmethod
+    def _digest(state):
+        h = hashlib.blake2b(state.tobytes(), digest_size = 16)
+        h.update(repr((state.shape, state.dtype.str)).encode())
+        return h.digest()
+
+    def step(self):
+        """Advance by one generation and return the new state"""
+        start = time.perf_counter()
+        self.state = self.rule(self.state)
+        self.generation += 1
+        if self.history is not None:
+            self.history.append(self.state)
+        if self.detectCycles and self.period is None:
+            digest = self._digest(self.state)
+            previous = self.seen.get(digest)
+            if previous is None:
+                self.seen[digest] = self.generation
+            else:
+                self.cycleStart = previous
+                self.period     = self.generation - previous
+        self.elapsed += time.perf_counter() - start
+        return self.state
+
+    def run(self, steps = None, until = None):
+        """Step until `until(state)` is true, `steps` generations have been
+        run, or a cycle is detected, whichever is first, and return the
+        generation at which `until` became true, or `None`.  Once a cycle is
+        detected, every future state has already been seen (and tested), so
+        running further could not change the result."""
+        if until and until(self.state): return self.generation
+        count = 0
+        while self.period is None and (steps is None or count < steps):
+            self.step()
+            count += 1
+            if until and until(self.state): return self.generation
+        return None
+
+    def stateAt(self, generation):
+        """Return the state at `generation`, stepping forward if necessary or,
+        once the period is known, mapping it into the cycle.  Requires
+        `keepHistory`."""
+        assert(self.history is not None)
+        while self.generation < generation and self.period is None:
+            self.step()
+        if self.period is not None and generation > self.cycleStart:
+            generation = self.cycleStart + (generation - self.cycleStart) % self.period
+        return self.history[generation]
+
+    def stepsPerSecond(self):
+        return self.generation / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        """Return a one-line summary of the steps run and any cycle found"""
+        line = (f"Automaton: {self.generation} steps in {self.elapsed:.3f} s "
+                f"({self.stepsPerSecond():.0f} steps/s)")
+        if self.period is not None:
+            line += f", period {self.period} from generation {self.cycleStart}"
+        return line
+
+    def report(self, file = None):
+        """Print `summary()` to `file` (by default, stderr)"""
+        print(self.summary(), file = file or sys.stderr)
+
+def shift(array, offset, axis, fill = 0):
+    """Return `array` shifted by `offset` elements along `axis`, without
+    wrapping around: the elements shifted in are `fill`.  (For a wrapping
+    shift, use `np.roll`.)"""
+    result = np.full_like(array, fill)
+    n = array.shape[axis]
+    if abs(offset) >= n: return result
+    src = [ slice(None) ] * array.ndim
+    dst = [ slice(None) ] * array.ndim
+    if offset >= 0:
+        src[axis], dst[axis] = slice(0, n - offset), slice(offset, n)
+    else:
+        src[axis], dst[axis] = slice(-offset, n), slice(0, n + offset)
+    result[tuple(dst)] = array[tuple(src)]
+    return result
+
+def neighborCount(mask):
+    """Return an array of the number of true elements of the 2-d boolean
+    array `mask` among the 8 neighbors of each element, where elements beyond
+    the edges are false"""
+    rows, cols = mask.shape
+    padded = np.pad(mask, 1).astype(np.int8)
+    counts = -padded[1:-1, 1:-1]
+    for dr in range(3):
+        for dc in range(3):
+            counts = counts + padded[dr:dr + rows, dc:dc + cols]
+    return counts
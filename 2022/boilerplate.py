@@ -11,8 +11,17 @@
 import sys
 import openInput
 
-input = openInput.openInput(sys.argv)
+def parse(input):
+    """Read the puzzle input from the file `input` and return it in the form
+    used by the `partN` functions"""
+    # Code to read input goes here
+    return None
 
-# Code to read input goes here
+def partY(data):
+    """Return the answer for the parsed input, `data`"""
+    # Code to solve the puzzle goes here
+    return None
 
-close(input)
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    print(f"Answer = {partY(parse(input))}")
@@ -0,0 +1,76 @@
+#! /usr/bin/python3
+
+def loadGrid(input, symToVal, dtype = "uint8"):
+    """Read a rectangular grid of characters, one row per line, and return it
+    as a 2-d numpy array in which each character has been replaced by its value
+    in the `symToVal` dictionary.  `input` is either the name of a file, which
+    is memory mapped, or a file object, whose remaining contents are read in a
+    single call.  The characters are viewed as a 2-d array of bytes, using the
+    length of the first line plus its line terminator as the row stride, and
+    translated through a 256-entry lookup table, so that the time to load the
+    grid is linear in its size and no per-row Python objects are created.  The
+    values in `symToVal` must fit in `dtype`.  Lines may end with LF or CR-LF
+    (but all alike), and trailing empty lines and a missing final line
+    terminator are allowed.  Raises `ValueError`, giving the row and column
+    (counting from 1), if the rows differ in length or a character is not in
+    `symToVal`.
+    """
+    import numpy as np
+
+    if isinstance(input, str):
+        raw = np.memmap(input, dtype = np.uint8, mode = "r")
+    else:
+        data = input.read()
+        if isinstance(data, str): data = data.encode()
+        raw = np.frombuffer(data, dtype = np.uint8)
+
+    # Drop trailing empty lines, then make sure that the last row has a line
+    # terminator, copying the data only if it must be appended
+    newline, cr = ord('\n'), ord('\r')
+    end = len(raw)
+    while end and raw[end - 1] in (newline, cr):
+        end -= 1
+    if end == 0:
+        return np.zeros((0, 0), dtype = dtype)
+
+    width = int(np.argmax(raw[:end] == newline))
+    if raw[width] != newline:
+        width = end                     # Single row
+    crlf = width > 0 and raw[width - 1] == cr
+    if crlf: width -= 1                 # Exclude CR of CR-LF line terminator
+    terminator = b"\r\n" if crlf else b"\n"
+    if raw[end:end + len(terminator)].tobytes() == terminator:
+        raw = raw[:end + len(terminator)]
+    else:
+        raw = np.append(raw[:end], np.frombuffer(terminator, dtype = np.uint8))
+    stride = width + len(terminator)
+
+    # Every row must be the same length, with the same line terminator
+    ends = np.flatnonzero(raw == newline)
+    starts = np.concatenate(([ 0 ], ends[:-1] + 1))
+    wrong = np.flatnonzero(ends - starts != stride - 1)
+    if len(wrong):
+        row = int(wrong[0])
+        length = int(ends[row] - starts[row])
+        if length and raw[ends[row] - 1] == cr: length -= 1
+        elif crlf and length == width:
+            raise ValueError(f"Grid row {row + 1} does not end with CR-LF like row 1")
+        raise ValueError(f"Grid row {row + 1} has {length} characters, "
+                         f"not {width} like row 1")
+    rows = raw.reshape((len(raw) // stride, stride))
+    if crlf and not (rows[:, width] == cr).all():
+        row = int(np.argmax(rows[:, width] != cr))
+        raise ValueError(f"Grid row {row + 1} does not end with CR-LF like row 1")
+
+    table = np.zeros(256, dtype = dtype)
+    valid = np.zeros(256, dtype = bool)
+    for sym, val in symToVal.items():
+        table[ord(sym)] = val
+        valid[ord(sym)] = True
+    chars = rows[:, :width]
+    invalid = ~valid[chars]
+    if invalid.any():                   # Every character must be in `symToVal`
+        row, col = (int(i) for i in np.argwhere(invalid)[0])
+        raise ValueError(f"Invalid character {chr(chars[row, col])!r} at grid row "
+                         f"{row + 1}, column {col + 1}")
+    return table[chars]
@@ -1,6 +1,79 @@
 #! /usr/bin/python3
 
-import re
+import io
+import os
+import sys
+import time
+import atexit
+
+# Modules that are needed only for caching or instrumentation (e.g., `hashlib`,
+# `pickle`, and `numpy`) are imported when first used, so that importing this
+# module, and thus starting a short puzzle program, stays fast.  Run
+# *importcost.py* to see the import cost of each puzzle program.
+
+# Parsed inputs are cached in this subdirectory of the directory containing
+# the input file.  The total size of the cache directory is kept below
+# `cacheMaxBytes` by evicting the least-recently-used entries.  Setting the
+# `AOC_INPUT_CACHE` environment variable to "0" disables the cache.
+cacheDirName  = ".inputcache"
+cacheMaxBytes = int(os.environ.get("AOC_INPUT_CACHE_MAX", 64 * 1024 * 1024))
+cacheEnabled  = os.environ.get("AOC_INPUT_CACHE", "1") != "0"
+
+# Instrumentation is turned on by command-line switches, which are removed from
+# `argv` before the input suffix is determined, or by environment variables:
+#
+#   --profile[=N]      AOC_PROFILE=N      Run cProfile, writing *puzzleXX.Y.prof*
+#                                         and a summary of the top N (default
+#                                         25) functions to *puzzleXX.Y.prof.txt*
+#   --tracemalloc[=N]  AOC_TRACEMALLOC=N  Report peak traced memory and the top
+#                                         N (default 10) allocation sites
+#   --timing           AOC_TIMING=1       Report the wall-clock time spent
+#                                         parsing versus solving
+#
+# Reports are printed to stderr when the program exits, so that the answer
+# remains the last line printed to stdout.
+instrumentSwitches = {
+    "--profile"     : ("AOC_PROFILE",     25),
+    "--tracemalloc" : ("AOC_TRACEMALLOC", 10),
+    "--timing"      : ("AOC_TIMING",      1)
+}
+instrumentation = None  # Set by the first call to `startInstrumentation`
+
+# Inputs are read through buffers of this size, which keeps the number of
+# system calls (and, for compressed inputs, decompressor calls) small when
+# iterating over the lines of a large input.
+inputBufferSize = 1024 * 1024
+
+# If the input file does not exist, a compressed sibling having one of these
+# extensions appended to its name (e.g., *puzzleXX_input.txt.gz*) is read,
+# instead.
+compressedExtensions = (".gz", ".xz", ".zst")
+
+def inputFilename(argv):
+    """Return the name of the input file for the program whose name and
+    arguments are in `argv`, following the naming convention described for
+    `openInput`, or "-" if the input is to be read from stdin."""
+    if len(argv) > 1 and argv[1] == "-":
+        return "-"
+    directory, name = os.path.split(argv[0])
+    puzzle = os.path.join(directory, name.partition(".")[0])
+    if len(argv) > 1:
+        return puzzle + '_' + argv[1] + ".txt"
+    else:
+        return puzzle + "_input.txt"
+
+def inputPath(argv):
+    """Return the path of the file from which the input for `argv` is read:
+    the file named by `inputFilename` or, if that does not exist, its first
+    existing compressed sibling (see `compressedExtensions`).  Returns "-"
+    for stdin."""
+    filename = inputFilename(argv)
+    if filename == "-" or os.path.exists(filename):
+        return filename
+    for ext in compressedExtensions:
+        if os.path.exists(filename + ext):
+            return filename + ext
+    return filename  # Let `open` report the missing file
 
 def openInput(argv):
     """Given a program name of the form *puzzleXX.Y.py*, where XX is the puzzle
@@ -11,11 +84,289 @@ def openInput(argv):
     argv[1], that is used as the suffix, instead..  Note that the input to the
     two parts of one puzzle is typically the same file, so Y does not show up
     in the default input file name.
+
+    If argv[1] is "-", the input is read from stdin.  If the input file does
+    not exist but a *.gz*, *.xz*, or *.zst* compressed copy of it does, the
+    copy is decompressed as it is read.  In every case, the returned object
+    is a buffered text file, supporting `readline`, `read`, iteration, and
+    `next()`.
     """
-    puzzle = re.sub(r'\.[^/\\]*$', "", argv[0])
-    if len(argv) > 1:
-        inputFilename = puzzle + '_' + argv[1] + ".txt"
+    startInstrumentation(argv)
+    path = inputPath(argv)
+    print(f"Reading input from {'stdin' if path == '-' else path}...")
+    input = openText(path)
+    if instrumentation and instrumentation.timing:
+        input = _TimedInput(input)
+    return input
+
+def openText(path):
+    """Open `path` (see `inputPath`) as a text file with a read buffer of
+    `inputBufferSize` bytes, decompressing it if it has one of the
+    `compressedExtensions`.  Also used by *runpuzzles.py* and *runbatch.py*,
+    which solve the inputs in-process."""
+    if path == "-":
+        return open(sys.stdin.fileno(), "r", buffering = inputBufferSize,
+                    closefd = False)
+
+    ext = os.path.splitext(path)[1]
+    if ext == ".gz":
+        import gzip
+        raw = gzip.open(path, "rb")
+    elif ext == ".xz":
+        import lzma
+        raw = lzma.open(path, "rb")
+    elif ext == ".zst":
+        raw = _openZstd(path)
+    else:
+        return open(path, "r", buffering = inputBufferSize)
+    return io.TextIOWrapper(io.BufferedReader(raw, inputBufferSize))
+
+def _openZstd(path):
+    """Open the zstd-compressed file `path` for binary reading, using the
+    standard library (Python 3.14 and later) or the *zstandard* package"""
+    try:
+        from compression import zstd
+        return zstd.open(path, "rb")
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(f"Reading {path} requires Python 3.14 or the "
+                          "zstandard package") from None
+    return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"),
+                                                      closefd = True)
+
+def loadInput(argv, parse, version = 0):
+    """Open the input file named by `argv` (see `openInput`), call
+    `parse(file)`, and return the parsed result.  The result is cached on disk
+    next to the input file, keyed on the content hash of the input file, the
+    program name, the name of `parse`, and the parser `version`.  If neither
+    the input nor the parser version has changed since the last run, the
+    cached result is returned without calling `parse`.  Bump `version`
+    whenever `parse` changes the structure it returns.  Numpy arrays are stored
+    as *.npy* files, tuples of numpy arrays as *.npz* files, and everything
+    else is pickled.  Input read from stdin is not cached.
+    """
+    startInstrumentation(argv)
+    try:
+        return _loadInput(argv, parse, version)
+    finally:
+        if instrumentation: instrumentation.endParse()
+
+def _loadInput(argv, parse, version):
+    """Implementation of `loadInput`"""
+    filename = inputPath(argv)
+    if not cacheEnabled or filename == "-":
+        with openInput(argv) as input:
+            return parse(input)
+
+    import hashlib
+    with open(filename, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+
+    cacheDir = os.path.join(os.path.dirname(filename) or ".", cacheDirName)
+    program  = os.path.basename(argv[0])
+    prefix   = f"{program}.{os.path.basename(filename)}.{parse.__name__}."
+    stem     = os.path.join(cacheDir, f"{prefix}v{version}.{digest}")
+
+    for ext in (".npy", ".npz", ".pkl"):
+        cacheFile = stem + ext
+        if not os.path.exists(cacheFile): continue
+        try:
+            result = _readCacheFile(cacheFile)
+        except Exception:
+            break  # Corrupt entry; rebuild it below
+        os.utime(cacheFile)  # Mark as recently used
+        print(f"Reading parsed input for {filename} from cache...")
+        return result
+
+    with openInput(argv) as input:
+        result = parse(input)
+
+    os.makedirs(cacheDir, exist_ok = True)
+    _removeStaleEntries(cacheDir, prefix)
+    _writeCacheFile(stem, result)
+    _evictLeastRecentlyUsed(cacheDir)
+    return result
+
+def _isArray(obj):
+    """Return `True` if `obj` is a numpy array.  Numpy is not imported unless
+    the caller has already imported it."""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(obj, np.ndarray)
+
+def _writeCacheFile(stem, result):
+    """Write `result` to a cache file whose name is `stem` plus an extension
+    chosen according to the type of `result`.  The file is written under a
+    temporary name and then renamed so that a reader never sees a partial
+    entry."""
+    if _isArray(result) and result.dtype != object:
+        import numpy as np
+        ext, save = ".npy", lambda f: np.save(f, result)
+    elif (isinstance(result, tuple) and result and
+          all(_isArray(x) and x.dtype != object for x in result)):
+        import numpy as np
+        ext, save = ".npz", lambda f: np.savez(f, *result)
     else:
-        inputFilename = puzzle + "_input.txt"
-    print(f"Reading input from {inputFilename}...")
-    return open(inputFilename, "r")
+        import pickle
+        ext, save = ".pkl", lambda f: pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+    tmpFile = f"{stem}.{os.getpid()}.tmp"
+    with open(tmpFile, "wb") as f:
+        save(f)
+    os.replace(tmpFile, stem + ext)
+
+def _readCacheFile(cacheFile):
+    """Read and return the object stored in `cacheFile`."""
+    if cacheFile.endswith(".pkl"):
+        import pickle
+        with open(cacheFile, "rb") as f:
+            return pickle.load(f)
+    import numpy as np
+    if cacheFile.endswith(".npy"):
+        return np.load(cacheFile, allow_pickle = False)
+    with np.load(cacheFile, allow_pickle = False) as npz:
+        return tuple(npz[f"arr_{i}"] for i in range(len(npz.files)))
+
+def _removeStaleEntries(cacheDir, prefix):
+    """Remove all entries in `cacheDir` for the input and parser identified by
+    `prefix`.  Called before writing a new entry, so that entries for old
+    versions of the input or parser do not accumulate."""
+    for name in os.listdir(cacheDir):
+        if name.startswith(prefix):
+            os.remove(os.path.join(cacheDir, name))
+
+def _evictLeastRecentlyUsed(cacheDir):
+    """Remove the least-recently-used entries from `cacheDir` until its total
+    size is no more than `cacheMaxBytes`."""
+    entries = [ ]
+    for name in os.listdir(cacheDir):
+        st = os.stat(os.path.join(cacheDir, name))
+        entries.append((st.st_mtime, st.st_size, name))
+    entries.sort()  # Oldest first
+    totalBytes = sum(size for _, size, _ in entries)
+    for _, size, name in entries:
+        if totalBytes <= cacheMaxBytes: break
+        os.remove(os.path.join(cacheDir, name))
+        totalBytes -= size
+
+class Instrumentation:
+    """Profiling, memory tracing, and parse/solve timing for one run of a
+    puzzle program, reported when the program exits"""
+
+    def __init__(self, program, profileTop, tracemallocTop, timing):
+        self.program        = program         # Program name without ".py"
+        self.profileTop     = profileTop      # 0 if not profiling
+        self.tracemallocTop = tracemallocTop  # 0 if not tracing allocations
+        self.timing         = timing
+        self.profiler       = None
+        self.startTime      = time.perf_counter()
+        self.parseEndTime   = None
+
+        if self.profileTop:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        if self.tracemallocTop:
+            import tracemalloc
+            tracemalloc.start()
+        atexit.register(self.report)
+
+    def endParse(self):
+        """Record the end of parsing.  Only the first call has any effect."""
+        if self.parseEndTime is None:
+            self.parseEndTime = time.perf_counter()
+
+    def report(self):
+        """Stop instrumentation and print the reports to stderr"""
+        endTime = time.perf_counter()
+        if self.profiler:
+            self.profiler.disable()
+            self._reportProfile()
+        if self.tracemallocTop:
+            self._reportTracemalloc()
+        if self.timing:
+            parseEnd = self.parseEndTime or endTime
+            print(f"Timing: parse {parseEnd - self.startTime:.3f}s, "
+                  f"solve {endTime - parseEnd:.3f}s, "
+                  f"total {endTime - self.startTime:.3f}s", file = sys.stderr)
+
+    def _reportProfile(self):
+        import io
+        import pstats
+        profFile = self.program + ".prof"
+        self.profiler.dump_stats(profFile)
+        summary = io.StringIO()
+        stats = pstats.Stats(self.profiler, stream = summary)
+        stats.sort_stats("cumulative").print_stats(self.profileTop)
+        with open(profFile + ".txt", "w") as f:
+            f.write(summary.getvalue())
+        print(f"Profile written to {profFile} and {profFile}.txt", file = sys.stderr)
+        print(summary.getvalue(), file = sys.stderr)
+
+    def _reportTracemalloc(self):
+        import tracemalloc
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        print(f"Tracemalloc: current {current / 1024:.1f} KiB, "
+              f"peak {peak / 1024:.1f} KiB", file = sys.stderr)
+        for stat in snapshot.statistics("lineno")[:self.tracemallocTop]:
+            print(f"  {stat}", file = sys.stderr)
+
+class _TimedInput:
+    """Wrapper around an input file that records the end of parsing (see
+    `Instrumentation.endParse`) when the file is closed or reaches its end"""
+
+    def __init__(self, file):
+        self.file = file
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self.file)
+        except StopIteration:
+            instrumentation.endParse()
+            raise
+
+    def readline(self, *args):
+        line = self.file.readline(*args)
+        if not line: instrumentation.endParse()
+        return line
+
+    def close(self):
+        instrumentation.endParse()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+def startInstrumentation(argv):
+    """Remove any instrumentation switches from `argv` (in place) and, the
+    first time this function is called, start the instrumentation selected by
+    those switches and the corresponding environment variables."""
+    global instrumentation
+    settings = { }
+    for switch, (envVar, default) in instrumentSwitches.items():
+        if os.environ.get(envVar):
+            settings[switch] = int(os.environ[envVar])
+    for arg in list(argv[1:]):
+        switch, eq, value = arg.partition("=")
+        if switch in instrumentSwitches:
+            settings[switch] = int(value) if eq else instrumentSwitches[switch][1]
+            argv.remove(arg)
+
+    if instrumentation is not None or not any(settings.values()): return
+    program = argv[0][:-3] if argv[0].endswith(".py") else argv[0]
+    instrumentation = Instrumentation(program,
+                                      settings.get("--profile", 0),
+                                      settings.get("--tracemalloc", 0),
+                                      bool(settings.get("--timing", 0)))
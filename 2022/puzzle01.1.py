@@ -9,38 +9,38 @@
 # in the default input file name.
 
 import sys
-import re
+import openInput
 
-# BOILERPLATE TO FIND AND OPEN INPUT FILE
-puzzle = re.sub(r'\.[^/]*$', "", sys.argv[0])
-if len(sys.argv) > 1:
-    inputFilename = puzzle + '_' + sys.argv[1] + ".txt"
-else:
-    inputFilename = puzzle + "_input.txt"
+def parse(input):
+    """Return a list of the total calories carried by each elf"""
+    elfCalories = [ ]
+    currElfCalories = 0
 
-input = open(inputFilename, "r"); # Input sequence, one number per line
-print(f"Reading input from {inputFilename}...")
-# END BOILERPlATE
+    for line in input:
+        if line == "\n":  # Empty line
+            elfCalories.append(currElfCalories)
+            currElfCalories = 0
+            continue
 
-maxElf = 0
-maxElfCalories = 0
+        currElfCalories += int(line)
 
-currElf = 1
-currElfCalories = 0
+    elfCalories.append(currElfCalories)
+    return elfCalories
 
-for line in input:
-    if line == "\n":  # Empty line
+def part1(elfCalories):
+    """Return the number (starting from 1) of the elf carrying the most
+    calories and the number of calories it carries"""
+    maxElf = 0
+    maxElfCalories = 0
+
+    for currElf, currElfCalories in enumerate(elfCalories, 1):
         if currElfCalories > maxElfCalories:
             maxElf = currElf
             maxElfCalories = currElfCalories
-        currElf += 1
-        currElfCalories = 0
-        continue
-
-    currElfCalories += int(line)
 
-if currElfCalories > maxElfCalories:
-    maxElf = currElf
-    maxElfCalories = currElfCalories
+    return (maxElf, maxElfCalories)
 
-print(f'Elf {maxElf} carries {maxElfCalories} calories')
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    maxElf, maxElfCalories = part1(parse(input))
+    print(f'Elf {maxElf} carries {maxElfCalories} calories')
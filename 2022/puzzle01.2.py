@@ -9,37 +9,30 @@
 # in the default input file name.
 
 import sys
-import re
+import openInput
 
-# BOILERPLATE TO FIND AND OPEN INPUT FILE
-puzzle = re.sub(r'\.[^/]*$', "", sys.argv[0])
-if len(sys.argv) > 1:
-    inputFilename = puzzle + '_' + sys.argv[1] + ".txt"
-else:
-    inputFilename = puzzle + "_input.txt"
+def parse(input):
+    """Return a list of the total calories carried by each elf"""
+    elfCalories = [ ]
+    currElfCalories = 0
 
-input = open(inputFilename, "r"); # Input sequence, one number per line
-print(f"Reading input from {inputFilename}...")
-# END BOILERPlATE
+    for line in input:
+        if line == "\n":  # Empty line
+            elfCalories.append(currElfCalories)
+            currElfCalories = 0
+            continue
 
-elfCalories = list()
+        currElfCalories += int(line)
 
-currElf = 1
-currElfCalories = 0
+    elfCalories.append(currElfCalories)
+    return elfCalories
 
-for line in input:
-    if line == "\n":  # Empty line
-        elfCalories.append(currElfCalories)
-        currElf += 1
-        currElfCalories = 0
-        continue
+def part2(elfCalories):
+    """Return the total calories carried by the three elves carrying the most"""
+    elfCalories = sorted(elfCalories, reverse=True)
+    return elfCalories[0] + elfCalories[1] + elfCalories[2]
 
-    currElfCalories += int(line)
-
-elfCalories.append(currElfCalories)
-
-elfCalories.sort(reverse=True)
-
-top3Calories = elfCalories[0] + elfCalories[1] + elfCalories[2]
-
-print(f'Top 3 elves carry {top3Calories} calories')
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    top3Calories = part2(parse(input))
+    print(f'Top 3 elves carry {top3Calories} calories')
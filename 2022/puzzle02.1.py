@@ -9,30 +9,25 @@
 # in the default input file name.
 
 import sys
-import re
-
-# BOILERPLATE TO FIND AND OPEN INPUT FILE
-puzzle = re.sub(r'\.[^/]*$', "", sys.argv[0])
-if len(sys.argv) > 1:
-    inputFilename = puzzle + '_' + sys.argv[1] + ".txt"
-else:
-    inputFilename = puzzle + "_input.txt"
-
-input = open(inputFilename, "r"); # Input sequence, one number per line
-print(f"Reading input from {inputFilename}...")
-# END BOILERPlATE
+import openInput
 
 choiceScore = { 'X' : 1, 'Y' : 2, 'Z' : 3 }
 roundScore  = { 'AX' : 3, 'AY' : 6, 'AZ' : 0,
                 'BX' : 0, 'BY' : 3, 'BZ' : 6,
                 'CX' : 6, 'CY' : 0, 'CZ' : 3 }
 
-totalScore = 0
-for line in input:
-    opponent = line[0]
-    me       = line[2]
-    play     = opponent + me
-    score    = choiceScore[me] + roundScore[play]
-    totalScore += score
+def parse(input):
+    """Return a list of (opponent, me) pairs of letters, one per round"""
+    return [ (line[0], line[2]) for line in input ]
+
+def part1(rounds):
+    totalScore = 0
+    for opponent, me in rounds:
+        play     = opponent + me
+        score    = choiceScore[me] + roundScore[play]
+        totalScore += score
+    return totalScore
 
-print(f"Total score = {totalScore}")
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    print(f"Total score = {part1(parse(input))}")
@@ -9,18 +9,7 @@
 # in the default input file name.
 
 import sys
-import re
-
-# BOILERPLATE TO FIND AND OPEN INPUT FILE
-puzzle = re.sub(r'\.[^/]*$', "", sys.argv[0])
-if len(sys.argv) > 1:
-    inputFilename = puzzle + '_' + sys.argv[1] + ".txt"
-else:
-    inputFilename = puzzle + "_input.txt"
-
-input = open(inputFilename, "r"); # Input sequence, one number per line
-print(f"Reading input from {inputFilename}...")
-# END BOILERPlATE
+import openInput
 
 choiceScore = { 'A' : 1, 'B' : 2, 'C' : 3 }
 myPlay      = { 'AX' : 'C', 'AY' : 'A', 'AZ' : 'B',
@@ -28,12 +17,18 @@ myPlay      = { 'AX' : 'C', 'AY' : 'A', 'AZ' : 'B',
                 'CX' : 'B', 'CY' : 'C', 'CZ' : 'A' }
 roundScore  = { 'X' : 0, 'Y' : 3, 'Z' : 6 }
 
-totalScore = 0
-for line in input:
-    opponent = line[0]
-    strategy = line[2]
-    me       = myPlay[opponent + strategy]
-    score    = choiceScore[me] + roundScore[strategy]
-    totalScore += score
+def parse(input):
+    """Return a list of (opponent, strategy) pairs of letters, one per round"""
+    return [ (line[0], line[2]) for line in input ]
+
+def part2(rounds):
+    totalScore = 0
+    for opponent, strategy in rounds:
+        me       = myPlay[opponent + strategy]
+        score    = choiceScore[me] + roundScore[strategy]
+        totalScore += score
+    return totalScore
 
-print(f"Total score = {totalScore}")
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    print(f"Total score = {part2(parse(input))}")
@@ -9,18 +9,7 @@
 # in the default input file name.
 
 import sys
-import re
-
-# BOILERPLATE TO FIND AND OPEN INPUT FILE
-puzzle = re.sub(r'\.[^/]*$', "", sys.argv[0])
-if len(sys.argv) > 1:
-    inputFilename = puzzle + '_' + sys.argv[1] + ".txt"
-else:
-    inputFilename = puzzle + "_input.txt"
-
-input = open(inputFilename, "r"); # Input sequence, one number per line
-print(f"Reading input from {inputFilename}...")
-# END BOILERPlATE
+import openInput
 
 def priority(items):
     """Returns the some of the prioritities of specified `items`"""
@@ -36,12 +25,19 @@ def priority(items):
         setPriority += priority
         return setPriority
 
-totalCommonPriority = 0
-for line in input:
-    line = line.rstrip('\n')
-    firstCompartment  = set(line[:len(line)//2])
-    secondCompartment = set(line[len(line)//2:])
-    intersection = firstCompartment.intersection(secondCompartment)
-    totalCommonPriority += priority(intersection)
+def parse(input):
+    """Return the list of rucksacks, each a string of items"""
+    return [ line.rstrip('\n') for line in input ]
+
+def part1(rucksacks):
+    totalCommonPriority = 0
+    for line in rucksacks:
+        firstCompartment  = set(line[:len(line)//2])
+        secondCompartment = set(line[len(line)//2:])
+        intersection = firstCompartment.intersection(secondCompartment)
+        totalCommonPriority += priority(intersection)
+    return totalCommonPriority
 
-print(f"Total priority = {totalCommonPriority}")
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    print(f"Total priority = {part1(parse(input))}")
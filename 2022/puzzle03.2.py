@@ -9,18 +9,7 @@
 # in the default input file name.
 
 import sys
-import re
-
-# BOILERPLATE TO FIND AND OPEN INPUT FILE
-puzzle = re.sub(r'\.[^/]*$', "", sys.argv[0])
-if len(sys.argv) > 1:
-    inputFilename = puzzle + '_' + sys.argv[1] + ".txt"
-else:
-    inputFilename = puzzle + "_input.txt"
-
-input = open(inputFilename, "r"); # Input sequence, one number per line
-print(f"Reading input from {inputFilename}...")
-# END BOILERPlATE
+import openInput
 
 def priority(items):
     """Returns the some of the prioritities of specified `items`"""
@@ -36,17 +25,25 @@ def priority(items):
         setPriority += priority
         return setPriority
 
-totalBadgePriority = 0
-elfIndex = 0
-groupSacks = [ "", "", "" ]
-for line in input:
-    groupSacks[elfIndex] = set(line.rstrip('\n'))
-    if elfIndex == 2:
-        intersection = groupSacks[0].intersection(groupSacks[1]).intersection(groupSacks[2])
-        assert(1 == len(intersection))
-        totalBadgePriority += priority(intersection)
-        elfIndex = 0
-    else:
-        elfIndex += 1
+def parse(input):
+    """Return the list of rucksacks, each a string of items"""
+    return [ line.rstrip('\n') for line in input ]
+
+def part2(rucksacks):
+    totalBadgePriority = 0
+    elfIndex = 0
+    groupSacks = [ "", "", "" ]
+    for line in rucksacks:
+        groupSacks[elfIndex] = set(line)
+        if elfIndex == 2:
+            intersection = groupSacks[0].intersection(groupSacks[1]).intersection(groupSacks[2])
+            assert(1 == len(intersection))
+            totalBadgePriority += priority(intersection)
+            elfIndex = 0
+        else:
+            elfIndex += 1
+    return totalBadgePriority
 
-print(f"Total badge priority = {totalBadgePriority}")
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    print(f"Total badge priority = {part2(parse(input))}")
@@ -12,19 +12,25 @@ import sys
 import openInput
 import re
 
-input = openInput.openInput(sys.argv)
+def parse(input):
+    """Return a list of (range1start, range1end, range2start, range2end)
+    tuples, one per pair of elves"""
+    pairs = [ ]
+    lineparse = re.compile(r'([0-9]*)-([0-9]*),([0-9]*)-([0-9]*)')
+    for line in input:
+        match = lineparse.match(line)
+        pairs.append(tuple(int(match[i]) for i in range(1, 5)))
+    return pairs
 
-overlaps = 0
-lineparse = re.compile(r'([0-9]*)-([0-9]*),([0-9]*)-([0-9]*)')
-for line in input:
-    match = lineparse.match(line)
-    range1start = int(match[1])
-    range1end   = int(match[2])
-    range2start = int(match[3])
-    range2end   = int(match[4])
-    if range1start <= range2start and range1end >= range2end:
-        overlaps += 1
-    elif range2start <= range1start and range2end >= range1end:
-        overlaps += 1
+def part1(pairs):
+    overlaps = 0
+    for range1start, range1end, range2start, range2end in pairs:
+        if range1start <= range2start and range1end >= range2end:
+            overlaps += 1
+        elif range2start <= range1start and range2end >= range1end:
+            overlaps += 1
+    return overlaps
 
-print(f"Subsumed overlaps = {overlaps}")
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    print(f"Subsumed overlaps = {part1(parse(input))}")
@@ -12,48 +12,67 @@ import sys
 import openInput
 import re
 
-input = openInput.openInput(sys.argv)
-
-# `stacks` is a list of lists.  Each list is one stack, indexed from 1
-# (`stacks[0]` is not used).  Each stack is a list of letters, each
-# representing a crate.
-stacks = [None]
-
-for line in input:
-    if line[1] == '1':
-        # Found stack indexes. Verify that we read the right number of stacks.
-        assert(len(stacks) - 1 == int(line[-4:]))
-        break
-
-    # the form "[X] [Y] [Z]", where a crate ID appears at every 4th position,
-    # starting at 1 (but where some positions are blank).
-    i = 0
-    for p in range(1, len(line) - 1, 4):
-        i += 1
-        crate = line[p]
-        if i >= len(stacks): stacks.append([])
-        if crate != ' ':     stacks[i].insert(0, crate)
-
-# Skip blank line
-blankLine = next(input)
-assert(blankLine == '\n')
-
-# Each line from here on out is in the form "move N from X to Y", where N is
-# the number of crates to move and X and Y are stack indexes.
-pattern = re.compile(r'move ([0-9]*) from ([0-9]*) to ([0-9]*)')
-for line in input:
-    match = pattern.match(line)
-    assert(match)
-    N = int(match[1])
-    X = int(match[2])
-    Y = int(match[3])
-    for i in range(0, N):
-        stacks[Y].append(stacks[X].pop())
-
-result = ""
-for stack in stacks:
-    if stack is None: continue
-    print(stack)
-    result += stack[-1]
-
-print(f'Result = "{result}"')
+def parse(input):
+    """Return a tuple `(stacks, moves)`.  `stacks` is a list of lists.  Each
+    list is one stack, indexed from 1 (`stacks[0]` is not used).  Each stack is
+    a list of letters, each representing a crate.  `moves` is a list of
+    `(N, X, Y)` tuples, where N is the number of crates to move and X and Y are
+    stack indexes."""
+    stacks = [None]
+
+    for line in input:
+        if line[1] == '1':
+            # Found stack indexes. Verify that we read the right number of stacks.
+            assert(len(stacks) - 1 == int(line[-4:]))
+            break
+
+        # the form "[X] [Y] [Z]", where a crate ID appears at every 4th position,
+        # starting at 1 (but where some positions are blank).
+        i = 0
+        for p in range(1, len(line) - 1, 4):
+            i += 1
+            crate = line[p]
+            if i >= len(stacks): stacks.append([])
+            if crate != ' ':     stacks[i].insert(0, crate)
+
+    # Skip blank line
+    blankLine = next(input)
+    assert(blankLine == '\n')
+
+    # Each line from here on out is in the form "move N from X to Y".
+    moves = [ ]
+    pattern = re.compile(r'move ([0-9]*) from ([0-9]*) to ([0-9]*)')
+    for line in input:
+        match = pattern.match(line)
+        assert(match)
+        moves.append((int(match[1]), int(match[2]), int(match[3])))
+
+    return (stacks, moves)
+
+def rearrange(stacks, moves):
+    """Return a copy of `stacks` after applying `moves`"""
+    stacks = [ None if stack is None else list(stack) for stack in stacks ]
+    for N, X, Y in moves:
+        for i in range(0, N):
+            stacks[Y].append(stacks[X].pop())
+    return stacks
+
+def topCrates(stacks):
+    """Return a string of the letters of the crate on top of each stack"""
+    result = ""
+    for stack in stacks:
+        if stack is None: continue
+        result += stack[-1]
+    return result
+
+def part1(data):
+    return topCrates(rearrange(*data))
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    stacks = rearrange(*parse(input))
+    for stack in stacks:
+        if stack is None: continue
+        print(stack)
+
+    print(f'Result = "{topCrates(stacks)}"')
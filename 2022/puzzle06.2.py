@@ -11,10 +11,13 @@
 import sys
 import openInput
 
-input = openInput.openInput(sys.argv)
+def parse(input):
+    """Return the list of datastreams, one per line"""
+    return [ line.rstrip() for line in input ]
 
-for line in input:
-    line = line.rstrip()
+def findMarker(line):
+    """Return the number of characters of `line` up to the end of the first
+    run of 14 distinct characters, or `None` if there is no such run"""
     buckets = [ 0 for n in range(0, 26) ]
     n_uniq  = 0
     for i in range(0, len(line)):
@@ -29,5 +32,15 @@ for line in input:
         buckets[c] += 1
         if buckets[c] == 1: n_uniq += 1
         if n_uniq == 14:
-            print(f"first marker ends after character {i + 1}")
-            break
+            return i + 1
+    return None
+
+def part2(lines):
+    """Return the list of marker positions, one per datastream"""
+    return [ findMarker(line) for line in lines ]
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    for marker in part2(parse(input)):
+        if marker is not None:
+            print(f"first marker ends after character {marker}")
@@ -12,8 +12,6 @@ import sys
 import openInput
 import re
 
-input = openInput.openInput(sys.argv)
-
 dir=0
 file=1
 
@@ -87,46 +85,61 @@ class FlatDirIter:
                 self.curriter = self.iterstack.pop() if self.iterstack else None
         raise StopIteration
 
-root = DirNode("/")
-path = [root]  # path to current working directory
-cwd  = root    # current working directory
-
-ls = False
-for line in input:
-    line = line.rstrip()
-    if line == "$ cd /":
-        path = [root]
-        cwd  = root
-        ls = False
-    elif line == "$ cd ..":
-        path.pop()
-        cwd = path[-1]
-        ls = False
-    elif line.startswith("$ cd "):
-        path.append(cwd.getEntry(line[5:].lstrip()))
-        cwd = path[-1]
-        ls = False
-    elif line == "$ ls":
-        ls = True
-    elif line.startswith("dir "):
-        assert(ls)
-        cwd.addEntry(DirNode(line[4:].lstrip()))
-    else:
-        assert(ls)
-        match = re.match(r'^([0-9]*) *(.*)$', line)
-        assert(match)
-        cwd.addEntry(FileNode(match[2], int(match[1])))
-
-# root.format()
+def parse(input):
+    """Return the root `DirNode` of the directory tree explored by the
+    commands and output in `input`"""
+    root = DirNode("/")
+    path = [root]  # path to current working directory
+    cwd  = root    # current working directory
+
+    ls = False
+    for line in input:
+        line = line.rstrip()
+        if line == "$ cd /":
+            path = [root]
+            cwd  = root
+            ls = False
+        elif line == "$ cd ..":
+            path.pop()
+            cwd = path[-1]
+            ls = False
+        elif line.startswith("$ cd "):
+            path.append(cwd.getEntry(line[5:].lstrip()))
+            cwd = path[-1]
+            ls = False
+        elif line == "$ ls":
+            ls = True
+        elif line.startswith("dir "):
+            assert(ls)
+            cwd.addEntry(DirNode(line[4:].lstrip()))
+        else:
+            assert(ls)
+            match = re.match(r'^([0-9]*) *(.*)$', line)
+            assert(match)
+            cwd.addEntry(FileNode(match[2], int(match[1])))
+
+    # root.format()
+    return root
 
 limit=100000
-totalWithinLimit = 0
 
-print(f"Directories no larger than {limit}")
-for entry in FlatDirIter(root):
-    if type(entry) is DirNode:
-        if entry.calcSize() <= limit:
-            totalWithinLimit += entry.calcSize()
-            print(entry)
+def smallDirectories(root):
+    """Return the list of directories no larger than `limit`"""
+    return [ entry for entry in FlatDirIter(root)
+             if type(entry) is DirNode and entry.calcSize() <= limit ]
+
+def part1(root):
+    return sum(entry.calcSize() for entry in smallDirectories(root))
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    root = parse(input)
+
+    totalWithinLimit = 0
+
+    print(f"Directories no larger than {limit}")
+    for entry in smallDirectories(root):
+        totalWithinLimit += entry.calcSize()
+        print(entry)
 
-print(f"Total = {totalWithinLimit}")
+    print(f"Total = {totalWithinLimit}")
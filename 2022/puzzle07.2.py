@@ -12,8 +12,6 @@ import sys
 import openInput
 import re
 
-input = openInput.openInput(sys.argv)
-
 dir=0
 file=1
 
@@ -87,55 +85,73 @@ class FlatDirIter:
                 self.curriter = self.iterstack.pop() if self.iterstack else None
         raise StopIteration
 
-root = DirNode("/")
-path = [root]  # path to current working directory
-cwd  = root    # current working directory
-
-ls = False
-for line in input:
-    line = line.rstrip()
-    if line == "$ cd /":
-        path = [root]
-        cwd  = root
-        ls = False
-    elif line == "$ cd ..":
-        path.pop()
-        cwd = path[-1]
-        ls = False
-    elif line.startswith("$ cd "):
-        path.append(cwd.getEntry(line[5:].lstrip()))
-        cwd = path[-1]
-        ls = False
-    elif line == "$ ls":
-        ls = True
-    elif line.startswith("dir "):
-        assert(ls)
-        cwd.addEntry(DirNode(line[4:].lstrip()))
-    else:
-        assert(ls)
-        match = re.match(r'^([0-9]*) *(.*)$', line)
-        assert(match)
-        cwd.addEntry(FileNode(match[2], int(match[1])))
-
-# root.format()
+def parse(input):
+    """Return the root `DirNode` of the directory tree explored by the
+    commands and output in `input`"""
+    root = DirNode("/")
+    path = [root]  # path to current working directory
+    cwd  = root    # current working directory
+
+    ls = False
+    for line in input:
+        line = line.rstrip()
+        if line == "$ cd /":
+            path = [root]
+            cwd  = root
+            ls = False
+        elif line == "$ cd ..":
+            path.pop()
+            cwd = path[-1]
+            ls = False
+        elif line.startswith("$ cd "):
+            path.append(cwd.getEntry(line[5:].lstrip()))
+            cwd = path[-1]
+            ls = False
+        elif line == "$ ls":
+            ls = True
+        elif line.startswith("dir "):
+            assert(ls)
+            cwd.addEntry(DirNode(line[4:].lstrip()))
+        else:
+            assert(ls)
+            match = re.match(r'^([0-9]*) *(.*)$', line)
+            assert(match)
+            cwd.addEntry(FileNode(match[2], int(match[1])))
+
+    # root.format()
+    return root
 
 totalFilesystem = 70000000
 neededForUpdate = 30000000
-unusedSpace     = totalFilesystem - root.calcSize()
-needToDelete    = neededForUpdate - unusedSpace
-bestCandidate   = root
-
-if needToDelete <= 0:
-    print("No deletions needed")
-    needToDelete = 0
-    bestCandidate = DirNode("Nothing", 0)
-
-for entry in FlatDirIter(root):
-    if (type(entry) is DirNode           and
-        entry.calcSize() >= needToDelete and
-        entry.calcSize() < bestCandidate.calcSize()):
-        bestCandidate = entry
-
-print(f"Unused space = {totalFilesystem - root.calcSize()}")
-print(f"Delete {bestCandidate}")
-print(f"New unused = {totalFilesystem - root.calcSize() + bestCandidate.calcSize()}")
+
+def part2(root):
+    """Return the smallest directory whose deletion would leave enough unused
+    space for the update, or `None` if no deletions are needed"""
+    unusedSpace     = totalFilesystem - root.calcSize()
+    needToDelete    = neededForUpdate - unusedSpace
+    bestCandidate   = root
+
+    if needToDelete <= 0:
+        return None
+
+    for entry in FlatDirIter(root):
+        if (type(entry) is DirNode           and
+            entry.calcSize() >= needToDelete and
+            entry.calcSize() < bestCandidate.calcSize()):
+            bestCandidate = entry
+
+    return bestCandidate
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    root = parse(input)
+    bestCandidate = part2(root)
+
+    if bestCandidate is None:
+        print("No deletions needed")
+        bestCandidate = DirNode("Nothing")
+        bestCandidate.size = 0
+
+    print(f"Unused space = {totalFilesystem - root.calcSize()}")
+    print(f"Delete {bestCandidate}")
+    print(f"New unused = {totalFilesystem - root.calcSize() + bestCandidate.calcSize()}")
@@ -12,22 +12,18 @@ import sys
 import openInput
 import numpy as np
 
-input = openInput.openInput(sys.argv)
-
-grid = None
-for line in input:
-    line = line.rstrip()
-    row = [ int(x) for x in line ]
-    if grid is None:
-        grid = np.array([ row ])
-    else:
-        grid = np.append(grid, [ row ], 0)
-
-nrows = grid.shape[1]
-ncols = grid.shape[0]
-
-print(f"{nrows} rows, {ncols} columns")
-print(grid)
+def parse(input):
+    """Read the grid of tree heights from `input` and return it as a 2-d numpy
+    array"""
+    grid = None
+    for line in input:
+        line = line.rstrip()
+        row = [ int(x) for x in line ]
+        if grid is None:
+            grid = np.array([ row ])
+        else:
+            grid = np.append(grid, [ row ], 0)
+    return grid
 
 def findVisible(treegridSlice, visibilitySlice):
     """For each visible tree in `treegridSlice`, set the corresponding element of
@@ -51,16 +47,35 @@ def findVisible(treegridSlice, visibilitySlice):
         if maxHeightRev == maxHeight:
             break
 
-# Bit array with a True for each visible tree
-visibilityGrid = np.zeros(grid.shape, bool)
+def visibility(grid):
+    """Return a bit array with a True for each visible tree in `grid`"""
+    nrows = grid.shape[1]
+    ncols = grid.shape[0]
+    visibilityGrid = np.zeros(grid.shape, bool)
+
+    # Traverse each row, then each column
+    for row in range(nrows):
+        findVisible(grid[row,:], visibilityGrid[row,:])
+
+    for col in range(ncols):
+        findVisible(grid[:,col], visibilityGrid[:,col])
+
+    return visibilityGrid
+
+def part1(grid):
+    return np.sum(visibility(grid))
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    grid = parse(input)
 
-# Traverse each row, then each column
-for row in range(nrows):
-    findVisible(grid[row,:], visibilityGrid[row,:])
+    nrows = grid.shape[1]
+    ncols = grid.shape[0]
 
-for col in range(ncols):
-    findVisible(grid[:,col], visibilityGrid[:,col])
+    print(f"{nrows} rows, {ncols} columns")
+    print(grid)
 
-print(visibilityGrid)
-total = np.sum(visibilityGrid)
-print(f"Num visible trees = {total}")
+    visibilityGrid = visibility(grid)
+    print(visibilityGrid)
+    total = np.sum(visibilityGrid)
+    print(f"Num visible trees = {total}")
@@ -10,24 +10,13 @@
 
 import sys
 import openInput
+import loadGrid
 import numpy as np
 
-input = openInput.openInput(sys.argv)
-
-grid = None
-for line in input:
-    line = line.rstrip()
-    row = [ int(x) for x in line ]
-    if grid is None:
-        grid = np.array([ row ])
-    else:
-        grid = np.append(grid, [ row ], 0)
-
-nrows = grid.shape[1]
-ncols = grid.shape[0]
-
-print(f"{nrows} rows, {ncols} columns")
-print(grid)
+def parse(input):
+    """Read the grid of tree heights from `input` and return it as a 2-d numpy
+    array"""
+    return loadGrid.loadGrid(input, { str(h) : h for h in range(10) })
 
 def viewingDistance(vector):
     """Compute the viewing distance along the specified `vector`, where the first
@@ -41,13 +30,26 @@ def viewingDistance(vector):
             return i
     return len(vector) - 1
 
-highestScore = 0
-for i in range(0, nrows):
-    for j in range(0, ncols):
-        score =  viewingDistance(grid[i, j::-1])  # left
-        score *= viewingDistance(grid[i, j:])     # right
-        score *= viewingDistance(grid[i::-1, j])  # up
-        score *= viewingDistance(grid[i:, j])     # down
-        highestScore = max(score, highestScore)
-
-print(f"Highest score = {highestScore}")
+def part2(grid):
+    nrows = grid.shape[1]
+    ncols = grid.shape[0]
+    highestScore = 0
+    for i in range(0, nrows):
+        for j in range(0, ncols):
+            score =  viewingDistance(grid[i, j::-1])  # left
+            score *= viewingDistance(grid[i, j:])     # right
+            score *= viewingDistance(grid[i::-1, j])  # up
+            score *= viewingDistance(grid[i:, j])     # down
+            highestScore = max(score, highestScore)
+    return highestScore
+
+if __name__ == "__main__":
+    grid = openInput.loadInput(sys.argv, parse, version = 1)
+
+    nrows = grid.shape[1]
+    ncols = grid.shape[0]
+
+    print(f"{nrows} rows, {ncols} columns")
+    print(grid)
+
+    print(f"Highest score = {part2(grid)}")
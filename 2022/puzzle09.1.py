@@ -10,13 +10,16 @@
 
 import sys
 import openInput
-import numpy as np
-
-input = openInput.openInput(sys.argv)
 
 def coord(x, y):
-    """Return a coordinate, `(x, y)` as a numpy array"""
-    return np.array((x, y))
+    """Return a coordinate, `(x, y)`.  Coordinates are plain tuples, rather
+    than numpy arrays, because numpy takes far longer to import than this
+    program takes to run."""
+    return (x, y)
+
+def addCoords(a, b):
+    """Return the sum of coordinates `a` and `b`"""
+    return (a[0] + b[0], a[1] + b[1])
 
 # Map a direction to changes in x and y
 moves = { 'L' : coord(-1,  0),
@@ -28,25 +31,32 @@ def adjustTail(head, tail):
     """Return a new tail position to adjust for the distance between the head
     and tail. The head and tail must not start out separated by more than 2
     spaces in any direction"""
-    newTail = tail.copy()
-    distances = head - tail
-    if abs(distances[0]) == 2:
-        newTail += distances // 2
-        newTail[1] = head[1]  # Move tail y to match head y
-    elif abs(distances[1]) == 2:
-        newTail += distances // 2
-        newTail[0] = head[0]  # Move tail x to match head x
-    return newTail
-
-head = coord(0, 0)
-tail = coord(0, 0)
-visited = set([tuple(tail)])
-for line in input:
-    direction, steps = line.split()
-    steps = int(steps)
-    for i in range(steps):
-        head = head + moves[direction]
-        tail = adjustTail(head, tail)
-        visited.add(tuple(tail))
-
-print(f"Num visited = {len(visited)}")
+    dx, dy = head[0] - tail[0], head[1] - tail[1]
+    if abs(dx) == 2:
+        return (tail[0] + dx // 2, head[1])  # Move tail y to match head y
+    elif abs(dy) == 2:
+        return (head[0], tail[1] + dy // 2)  # Move tail x to match head x
+    return tail
+
+def parse(input):
+    """Return a list of `(direction, steps)` motions of the head"""
+    motions = [ ]
+    for line in input:
+        direction, steps = line.split()
+        motions.append((direction, int(steps)))
+    return motions
+
+def part1(motions):
+    head = coord(0, 0)
+    tail = coord(0, 0)
+    visited = set([tuple(tail)])
+    for direction, steps in motions:
+        for i in range(steps):
+            head = addCoords(head, moves[direction])
+            tail = adjustTail(head, tail)
+            visited.add(tuple(tail))
+    return len(visited)
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    print(f"Num visited = {part1(parse(input))}")
@@ -10,13 +10,16 @@
 
 import sys
 import openInput
-import numpy as np
-
-input = openInput.openInput(sys.argv)
 
 def coord(x, y):
-    """Return a coordinate, `(x, y)` as a numpy array"""
-    return np.array((x, y))
+    """Return a coordinate, `(x, y)`.  Coordinates are plain tuples, rather
+    than numpy arrays, because numpy takes far longer to import than this
+    program takes to run."""
+    return (x, y)
+
+def addCoords(a, b):
+    """Return the sum of coordinates `a` and `b`"""
+    return (a[0] + b[0], a[1] + b[1])
 
 # Map a direction to changes in x and y
 moves = { 'L' : coord(-1,  0),
@@ -42,50 +45,65 @@ def printSequence(sequence):
     print(f"width = {width}, height = {height}")
     print(f"Sequence len = {len(sequence)}")
     for rope in sequence:
-        grid = np.full([height, width], 11)
+        grid = [ [ 11 ] * width for y in range(height) ]
         i = 0
-        grid[-miny,-minx] = 10  # Origin
+        grid[-miny][-minx] = 10  # Origin
         for knot in rope:
             gx = knot[0] - minx
             gy = knot[1] - miny
-            grid[gy, gx] = min(grid[gy, gx], i)
+            grid[gy][gx] = min(grid[gy][gx], i)
             i += 1
         for x in range(height - 1, -1, -1):
-            print("".join(map(lambda i : "H123456789s."[i], grid[x,:])))
+            print("".join(map(lambda i : "H123456789s."[i], grid[x])))
         print("")
 
 def adjustKnot(prevKnot, currKnot):
     """Return the new position of currKnot to adjust for the distance between
     it and prevKnot. The two knots must not start out separated by more than 2
     spaces in any direction"""
-    newCurrKnot = currKnot.copy()
-    distances = prevKnot - currKnot
-    if abs(distances[0]) == 2 and abs(distances[1]) == 2:
-        newCurrKnot += distances // 2
-    elif abs(distances[0]) == 2:
-        newCurrKnot[0] += distances[0] // 2
-        newCurrKnot[1] = prevKnot[1]            # Move currKnot y to match prevKnot y
-        assert((newCurrKnot != currKnot).any())
-    elif abs(distances[1]) == 2:
-        newCurrKnot[1] += distances[1] // 2
-        newCurrKnot[0] = prevKnot[0]
-        assert((newCurrKnot != currKnot).any())
-    return newCurrKnot
+    dx, dy = prevKnot[0] - currKnot[0], prevKnot[1] - currKnot[1]
+    if abs(dx) == 2 and abs(dy) == 2:
+        return (currKnot[0] + dx // 2, currKnot[1] + dy // 2)
+    elif abs(dx) == 2:
+        return (currKnot[0] + dx // 2, prevKnot[1])  # Move currKnot y to match prevKnot y
+    elif abs(dy) == 2:
+        return (prevKnot[0], currKnot[1] + dy // 2)  # Move currKnot x to match prevKnot x
+    return currKnot
+
+def parse(input):
+    """Return a list of `(direction, steps)` motions of the head"""
+    motions = [ ]
+    for line in input:
+        direction, steps = line.split()
+        motions.append((direction, int(steps)))
+    return motions
+
+def moveRope(motions):
+    """Move a rope of 10 knots according to `motions` and return a tuple
+    `(rope, visited, sequence)` of the final positions of the knots, the set of
+    positions visited by the tail, and the positions of the knots after each
+    motion"""
+    sequence = [ ]
+    rope = 10 * [ coord(0, 0) ]
+    visited = set([tuple(rope[-1])])
+    for direction, steps in motions:
+        for i in range(steps):
+            rope[0] = addCoords(rope[0], moves[direction])
+            for k in range(1, len(rope)):
+                rope[k] = adjustKnot(rope[k-1], rope[k])
+            # print(tuple(rope[-1]))
+            visited.add(tuple(rope[-1]))
+        sequence.append(rope.copy())
+    return (rope, visited, sequence)
+
+def part2(motions):
+    rope, visited, sequence = moveRope(motions)
+    return len(visited)
 
-sequence = [ ]
-rope = 10 * [ coord(0, 0) ]
-visited = set([tuple(rope[-1])])
-for line in input:
-    direction, steps = line.split()
-    steps = int(steps)
-    for i in range(steps):
-        rope[0] = rope[0] + moves[direction]
-        for k in range(1, len(rope)):
-            rope[k] = adjustKnot(rope[k-1], rope[k])
-        # print(tuple(rope[-1]))
-        visited.add(tuple(rope[-1]))
-    sequence.append(rope.copy())
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    rope, visited, sequence = moveRope(parse(input))
 
-# printSequence(sequence)
-print(f"Final tail position = {tuple(rope[-1])}")
-print(f"Num visited = {len(visited)}")
+    # printSequence(sequence)
+    print(f"Final tail position = {tuple(rope[-1])}")
+    print(f"Num visited = {len(visited)}")
@@ -11,8 +11,6 @@
 import sys
 import openInput
 
-input = openInput.openInput(sys.argv)
-
 class Cpu:
     """Abstraction of the simple CPU"""
 
@@ -53,28 +51,35 @@ class Cpu:
     def __str__(self):
         return f"x = {self.x} at cycle {self.cycle}"
 
-program = [ ]
-for line in input:
-    opcodestr, *operandStrs = line.split()
-    opcode = Cpu.opcodes[opcodestr]
-    if operandStrs:
-        instruction = (opcode, int(operandStrs[0]))
-    else:
-        instruction = (opcode, )
-    program.append(instruction)
+def parse(input):
+    """Return the program as a list of instructions, as expected by `Cpu`"""
+    program = [ ]
+    for line in input:
+        opcodestr, *operandStrs = line.split()
+        opcode = Cpu.opcodes[opcodestr]
+        if operandStrs:
+            instruction = (opcode, int(operandStrs[0]))
+        else:
+            instruction = (opcode, )
+        program.append(instruction)
+    return program
 
-theCpu = Cpu(program)
-signalStrengthSum = 0
-try:
-    theCpu.run(19)  # Advance from 1st to 20th cycle
-    assert(theCpu.cycle == 20)
-    signalStrengthSum += theCpu.x * theCpu.cycle
-    # print(theCpu)
-    while True:
-        theCpu.run(40)
-        # print(theCpu)
+def part1(program):
+    theCpu = Cpu(program)
+    signalStrengthSum = 0
+    try:
+        theCpu.run(19)  # Advance from 1st to 20th cycle
+        assert(theCpu.cycle == 20)
         signalStrengthSum += theCpu.x * theCpu.cycle
-except(StopIteration):
-    pass
+        # print(theCpu)
+        while True:
+            theCpu.run(40)
+            # print(theCpu)
+            signalStrengthSum += theCpu.x * theCpu.cycle
+    except(StopIteration):
+        pass
+    return signalStrengthSum
 
-print(f"Sum of signal strengths = {signalStrengthSum}")
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    print(f"Sum of signal strengths = {part1(parse(input))}")
@@ -11,8 +11,6 @@
 import sys
 import openInput
 
-input = openInput.openInput(sys.argv)
-
 class Cpu:
     """Abstraction of the simple CPU"""
 
@@ -53,25 +51,34 @@ class Cpu:
     def __str__(self):
         return f"x = {self.x} at cycle {self.cycle}"
 
-program = [ ]
-for line in input:
-    opcodestr, *operandStrs = line.split()
-    opcode = Cpu.opcodes[opcodestr]
-    if operandStrs:
-        instruction = (opcode, int(operandStrs[0]))
-    else:
-        instruction = (opcode, )
-    program.append(instruction)
+def parse(input):
+    """Return the program as a list of instructions, as expected by `Cpu`"""
+    program = [ ]
+    for line in input:
+        opcodestr, *operandStrs = line.split()
+        opcode = Cpu.opcodes[opcodestr]
+        if operandStrs:
+            instruction = (opcode, int(operandStrs[0]))
+        else:
+            instruction = (opcode, )
+        program.append(instruction)
+    return program
 
-theCpu = Cpu(program)
-pixels = ""
-try:
-    for row in range(0, 6):
-        for col in range(0, 40):
-            pixels += '#' if theCpu.x - 1 <= col and col <= theCpu.x + 1 else '.'
-            theCpu.run(1)
-except(StopIteration):
-    pass
+def part2(program):
+    """Return the string of 240 pixels drawn by the CRT"""
+    theCpu = Cpu(program)
+    pixels = ""
+    try:
+        for row in range(0, 6):
+            for col in range(0, 40):
+                pixels += '#' if theCpu.x - 1 <= col and col <= theCpu.x + 1 else '.'
+                theCpu.run(1)
+    except(StopIteration):
+        pass
+    return pixels
 
-for i in range(0, 240, 40):
-    print(pixels[i:i+40])
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    pixels = part2(parse(input))
+    for i in range(0, 240, 40):
+        print(pixels[i:i+40])
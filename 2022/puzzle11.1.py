@@ -11,8 +11,6 @@
 import sys
 import openInput
 
-input = openInput.openInput(sys.argv)
-
 class Monkey:
     """Represents one monkey's list of items and its behavior"""
 
@@ -30,6 +28,12 @@ class Monkey:
         self.recipientIfFalse = recipientIfFalse
         self.itemsInspected   = 0
 
+    def copy(self):
+        """Return a copy of this monkey, with its own list of items, that has
+        not yet inspected any items"""
+        return Monkey(list(self.items), self.operation, self.divisibleTest,
+                      self.recipientIfTrue, self.recipientIfFalse)
+
     def inspectAndThrow(self, monkeys):
         """Inspect the items, compute the new worry level, and throw according
         to the divisible test."""
@@ -84,46 +88,68 @@ fieldPrefixes = [ "Monkey ",
                   "    If true: throw to monkey ",
                   "    If false: throw to monkey " ]
 
-monkeys = []
-while True:
-    fields = [ ]
-    for prefix in fieldPrefixes:
-        line = input.readline().rstrip()
-        assert(line.startswith(prefix))
-        fields.append(line[len(prefix):])
-
-    monkeyNum        = int(fields[0].rstrip(':'))
-    startingItems    = [ int(x) for x in fields[1].split(",") ]
-    operation        = Expr(fields[2])
-    divisibleTest    = int(fields[3])
-    recipientIfTrue  = int(fields[4])
-    recipientIfFalse = int(fields[5])
-
-    assert(monkeyNum == len(monkeys))
-    monkey = Monkey(startingItems, operation, divisibleTest,
-                    recipientIfTrue, recipientIfFalse)
-    monkeys.append(monkey)
-
-    if not input.readline(): break
-
-for i in range(20):
-    for monkey in monkeys:
-        monkey.inspectAndThrow(monkeys)
-
-for i,monkey in enumerate(monkeys):
-    print(f"Monkey {i}: {monkey.items}")
-
-mostActivity       = 0
-secondMostActivity = 0
-for i,monkey in enumerate(monkeys):
-    print(f"Monkey {i} inspected items {monkey.itemsInspected} times.")
-    if monkey.itemsInspected >= mostActivity:
-        secondMostActivity = mostActivity
-        mostActivity       = monkey.itemsInspected
-    elif monkey.itemsInspected > secondMostActivity:
-        secondMostActivity = monkey.itemsInspected
-
-monkeyBusiness = mostActivity * secondMostActivity
-
-print(f"Two most active monkeys inspected {mostActivity} and {secondMostActivity} items, respectively")
-print(f"Monkey business = {monkeyBusiness}")
+def parse(input):
+    """Return the list of monkeys described by `input`"""
+    monkeys = []
+    while True:
+        fields = [ ]
+        for prefix in fieldPrefixes:
+            line = input.readline().rstrip()
+            assert(line.startswith(prefix))
+            fields.append(line[len(prefix):])
+
+        monkeyNum        = int(fields[0].rstrip(':'))
+        startingItems    = [ int(x) for x in fields[1].split(",") ]
+        operation        = Expr(fields[2])
+        divisibleTest    = int(fields[3])
+        recipientIfTrue  = int(fields[4])
+        recipientIfFalse = int(fields[5])
+
+        assert(monkeyNum == len(monkeys))
+        monkey = Monkey(startingItems, operation, divisibleTest,
+                        recipientIfTrue, recipientIfFalse)
+        monkeys.append(monkey)
+
+        if not input.readline(): break
+
+    return monkeys
+
+def mostActive(monkeys):
+    """Return the numbers of items inspected by the two most active monkeys"""
+    mostActivity       = 0
+    secondMostActivity = 0
+    for i,monkey in enumerate(monkeys):
+        if monkey.itemsInspected >= mostActivity:
+            secondMostActivity = mostActivity
+            mostActivity       = monkey.itemsInspected
+        elif monkey.itemsInspected > secondMostActivity:
+            secondMostActivity = monkey.itemsInspected
+    return (mostActivity, secondMostActivity)
+
+def part1(monkeys):
+    monkeys = [ monkey.copy() for monkey in monkeys ]
+    for i in range(20):
+        for monkey in monkeys:
+            monkey.inspectAndThrow(monkeys)
+    mostActivity, secondMostActivity = mostActive(monkeys)
+    return mostActivity * secondMostActivity
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    monkeys = parse(input)
+
+    for i in range(20):
+        for monkey in monkeys:
+            monkey.inspectAndThrow(monkeys)
+
+    for i,monkey in enumerate(monkeys):
+        print(f"Monkey {i}: {monkey.items}")
+
+    for i,monkey in enumerate(monkeys):
+        print(f"Monkey {i} inspected items {monkey.itemsInspected} times.")
+    mostActivity, secondMostActivity = mostActive(monkeys)
+
+    monkeyBusiness = mostActivity * secondMostActivity
+
+    print(f"Two most active monkeys inspected {mostActivity} and {secondMostActivity} items, respectively")
+    print(f"Monkey business = {monkeyBusiness}")
@@ -10,9 +10,7 @@
 
 import sys
 import openInput
-
-input = openInput.openInput(sys.argv)
-commonDivisor = 1  # Common divisor for all monkeys
+import math
 
 class Monkey:
     """Represents one monkey's list of items and its behavior"""
@@ -31,9 +29,16 @@ class Monkey:
         self.recipientIfFalse = recipientIfFalse
         self.itemsInspected   = 0
 
-    def inspectAndThrow(self, monkeys):
+    def copy(self):
+        """Return a copy of this monkey, with its own list of items, that has
+        not yet inspected any items"""
+        return Monkey(list(self.items), self.operation, self.divisibleTest,
+                      self.recipientIfTrue, self.recipientIfFalse)
+
+    def inspectAndThrow(self, monkeys, commonDivisor):
         """Inspect the items, compute the new worry level, and throw according
-        to the divisible test."""
+        to the divisible test.  `commonDivisor` is the product of the divisors
+        of all of the monkeys' divisible tests."""
         while self.items:
             self.itemsInspected += 1
             item = self.items.pop(0)
@@ -88,50 +93,76 @@ fieldPrefixes = [ "Monkey ",
                   "    If true: throw to monkey ",
                   "    If false: throw to monkey " ]
 
-monkeys = []  # Barrel of monkeys :-)
-while True:
-    fields = [ ]
-    for prefix in fieldPrefixes:
-        line = input.readline().rstrip()
-        assert(line.startswith(prefix))
-        fields.append(line[len(prefix):])
-
-    monkeyNum        = int(fields[0].rstrip(':'))
-    startingItems    = [ int(x) for x in fields[1].split(",") ]
-    operation        = Expr(fields[2])
-    divisibleTest    = int(fields[3])
-    recipientIfTrue  = int(fields[4])
-    recipientIfFalse = int(fields[5])
-    commonDivisor    *= divisibleTest
-
-    assert(monkeyNum == len(monkeys))
-    monkey = Monkey(startingItems, operation, divisibleTest,
-                    recipientIfTrue, recipientIfFalse)
-    monkeys.append(monkey)
-
-    if not input.readline(): break
-
-snapshots = { 1, 20, 1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 10000 }
-for i in range(10000):
-    for monkey in monkeys:
-        monkey.inspectAndThrow(monkeys)
-    if i + 1 in snapshots:
-        print(f"== After round {i + 1} ==")
-        for i,monkey in enumerate(monkeys):
-            print(f"Monkey {i} inspected items {monkey.itemsInspected} times.")
-        print("")
-
-mostActivity       = 0
-secondMostActivity = 0
-for i,monkey in enumerate(monkeys):
-    print(f"Monkey {i}: {monkey.items}")
-    if monkey.itemsInspected >= mostActivity:
-        secondMostActivity = mostActivity
-        mostActivity       = monkey.itemsInspected
-    elif monkey.itemsInspected > secondMostActivity:
-        secondMostActivity = monkey.itemsInspected
-
-monkeyBusiness = mostActivity * secondMostActivity
-
-print(f"Two most active monkeys inspected {mostActivity} and {secondMostActivity} items, respectively")
-print(f"Monkey business = {monkeyBusiness}")
+def parse(input):
+    """Return the list of monkeys described by `input`"""
+    monkeys = []  # Barrel of monkeys :-)
+    while True:
+        fields = [ ]
+        for prefix in fieldPrefixes:
+            line = input.readline().rstrip()
+            assert(line.startswith(prefix))
+            fields.append(line[len(prefix):])
+
+        monkeyNum        = int(fields[0].rstrip(':'))
+        startingItems    = [ int(x) for x in fields[1].split(",") ]
+        operation        = Expr(fields[2])
+        divisibleTest    = int(fields[3])
+        recipientIfTrue  = int(fields[4])
+        recipientIfFalse = int(fields[5])
+
+        assert(monkeyNum == len(monkeys))
+        monkey = Monkey(startingItems, operation, divisibleTest,
+                        recipientIfTrue, recipientIfFalse)
+        monkeys.append(monkey)
+
+        if not input.readline(): break
+
+    return monkeys
+
+def mostActive(monkeys):
+    """Return the numbers of items inspected by the two most active monkeys"""
+    mostActivity       = 0
+    secondMostActivity = 0
+    for i,monkey in enumerate(monkeys):
+        if monkey.itemsInspected >= mostActivity:
+            secondMostActivity = mostActivity
+            mostActivity       = monkey.itemsInspected
+        elif monkey.itemsInspected > secondMostActivity:
+            secondMostActivity = monkey.itemsInspected
+    return (mostActivity, secondMostActivity)
+
+def playRounds(monkeys, rounds, snapshots = ()):
+    """Play the specified number of `rounds` of keep-away with `monkeys`,
+    printing the number of items each monkey has inspected after each round
+    in `snapshots`"""
+    commonDivisor = math.prod(monkey.divisibleTest for monkey in monkeys)
+    for i in range(rounds):
+        for monkey in monkeys:
+            monkey.inspectAndThrow(monkeys, commonDivisor)
+        if i + 1 in snapshots:
+            print(f"== After round {i + 1} ==")
+            for i,monkey in enumerate(monkeys):
+                print(f"Monkey {i} inspected items {monkey.itemsInspected} times.")
+            print("")
+
+def part2(monkeys):
+    monkeys = [ monkey.copy() for monkey in monkeys ]
+    playRounds(monkeys, 10000)
+    mostActivity, secondMostActivity = mostActive(monkeys)
+    return mostActivity * secondMostActivity
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    monkeys = parse(input)
+
+    snapshots = { 1, 20, 1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 10000 }
+    playRounds(monkeys, 10000, snapshots)
+
+    for i,monkey in enumerate(monkeys):
+        print(f"Monkey {i}: {monkey.items}")
+    mostActivity, secondMostActivity = mostActive(monkeys)
+
+    monkeyBusiness = mostActivity * secondMostActivity
+
+    print(f"Two most active monkeys inspected {mostActivity} and {secondMostActivity} items, respectively")
+    print(f"Monkey business = {monkeyBusiness}")
@@ -12,8 +12,6 @@ import sys
 import openInput
 import numpy as np
 
-input = openInput.openInput(sys.argv)
-
 def coord(x, y):
     """Return a coordinate, `(x, y)` as a numpy array"""
     return np.array((x, y))
@@ -66,23 +64,34 @@ def climbHill(start, target, grid):
             workQueue.append(((path, newpos), depth + 1))
     return maxDepth
 
-grid = None
-for line in input:
-    line = line.rstrip()
-    row = [ ord(c) - ord('a') for c in line ]  # Row of values 0 to 25
-    if grid is None:
-        grid = np.array([ row ])
-    else:
-        grid = np.append(grid, [ row ], 0)
-    S = line.find('S')
-    if S >= 0:
-        start = coord( grid.shape[0] - 1, S )
-        setElem(grid, start, 0)
-    E = line.find('E')
-    if E >= 0:
-        target = coord( grid.shape[0] - 1, E )
-        setElem(grid, target, 25)
+def parse(input):
+    """Read the height map from `input` and return a tuple `(grid, start,
+    target)`, where `grid` is a 2-d numpy array of heights in the range 0 to 25
+    and `start` and `target` are the coordinates of the 'S' and 'E' squares"""
+    grid = None
+    for line in input:
+        line = line.rstrip()
+        row = [ ord(c) - ord('a') for c in line ]  # Row of values 0 to 25
+        if grid is None:
+            grid = np.array([ row ])
+        else:
+            grid = np.append(grid, [ row ], 0)
+        S = line.find('S')
+        if S >= 0:
+            start = coord( grid.shape[0] - 1, S )
+            setElem(grid, start, 0)
+        E = line.find('E')
+        if E >= 0:
+            target = coord( grid.shape[0] - 1, E )
+            setElem(grid, target, 25)
+    return (grid, start, target)
+
+def part1(data):
+    grid, start, target = data
+    return climbHill(start, target, grid)
 
-steps = climbHill(start, target, grid)
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    steps = part1(parse(input))
 
-print(f"Result = {steps}")
+    print(f"Result = {steps}")
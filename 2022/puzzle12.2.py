@@ -10,10 +10,9 @@
 
 import sys
 import openInput
+import loadGrid
 import numpy as np
 
-input = openInput.openInput(sys.argv)
-
 def coord(x, y):
     """Return a coordinate, `(x, y)` as a numpy array"""
     return np.array((x, y))
@@ -67,23 +66,27 @@ def findBestStart(target, grid):
             workQueue.append(((newpos, path), depth + 1))
     return maxDepth
 
-grid = None
-for line in input:
-    line = line.rstrip()
-    row = [ ord(c) - ord('a') for c in line ]  # Row of values 0 to 25
-    if grid is None:
-        grid = np.array([ row ])
-    else:
-        grid = np.append(grid, [ row ], 0)
-    S = line.find('S')
-    if S >= 0:
-        start = coord( grid.shape[0] - 1, S )
-        setElem(grid, start, 0)
-    E = line.find('E')
-    if E >= 0:
-        target = coord( grid.shape[0] - 1, E )
-        setElem(grid, target, 25)
+def parse(input):
+    """Read the height map from `input` and return a tuple `(grid, start,
+    target)`, where `grid` is a 2-d numpy array of heights in the range 0 to 25
+    and `start` and `target` are the coordinates of the 'S' and 'E' squares"""
+    START, TARGET = 26, 27  # Temporary values for 'S' and 'E'
+    symToVal = { chr(ord('a') + h) : h for h in range(26) }
+    symToVal['S'] = START
+    symToVal['E'] = TARGET
+    grid = loadGrid.loadGrid(input, symToVal, dtype = "int8")  # Signed for subtraction
+    start  = np.argwhere(grid == START)[0]
+    target = np.argwhere(grid == TARGET)[0]
+    setElem(grid, start, 0)
+    setElem(grid, target, 25)
+    return (grid, start, target)
+
+def part2(data):
+    grid, start, target = data
+    return findBestStart(target, grid)
 
-steps = findBestStart(target, grid)
+if __name__ == "__main__":
+    data = openInput.loadInput(sys.argv, parse, version = 1)
+    steps = part2(data)
 
-print(f"Result = {steps}")
+    print(f"Result = {steps}")
@@ -11,8 +11,6 @@
 import sys
 import openInput
 
-input = openInput.openInput(sys.argv)
-
 class RereadIter:
     """Iterator to traverse an iterator, enabling re-reading of the
     most-recently visited item.
@@ -118,25 +116,29 @@ def compare(item1, item2):
     else:
         return compare(item1, [ item2 ])
 
-packet1 = None
-packet2 = None
-pairIndex = 0
-sum = 0
-for line in input:
-    if line == '\n':
-        pairIndex += 1
-        if compare(packet1, packet2) < 0:
-            print(f"pair {pairIndex} is in right order")
-            sum += pairIndex
-        continue
-    iterator = RereadIter(line)
-    next(iterator)
-    packet1 = packet2
-    packet2 = parseList(iterator)
-
-pairIndex += 1
-if compare(packet1, packet2) < 0:
-    print(f"pair {pairIndex} is in right order")
-    sum += pairIndex
-
-print(f"Sum = {sum}")
+def parse(input):
+    """Return the list of packets in `input`"""
+    packets = []
+    for line in input:
+        if line == '\n': continue
+        iterator = RereadIter(line)
+        next(iterator)
+        packets.append(parseList(iterator))
+    return packets
+
+def rightOrderPairs(packets):
+    """Return the list of indexes (starting from 1) of the pairs of `packets`
+    that are in the right order"""
+    return [ pairIndex + 1 for pairIndex in range(len(packets) // 2)
+             if compare(packets[2 * pairIndex], packets[2 * pairIndex + 1]) < 0 ]
+
+def part1(packets):
+    return sum(rightOrderPairs(packets))
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    pairIndexes = rightOrderPairs(parse(input))
+    for pairIndex in pairIndexes:
+        print(f"pair {pairIndex} is in right order")
+
+    print(f"Sum = {sum(pairIndexes)}")
@@ -12,8 +12,6 @@ import sys
 import openInput
 import functools
 
-input = openInput.openInput(sys.argv)
-
 class RereadIter:
     """Iterator to traverse an iterator, enabling re-reading of the
     most-recently visited item.
@@ -119,22 +117,28 @@ def compare(item1, item2):
     else:
         return compare(item1, [ item2 ])
 
-packets = []
-pairIndex = 0
-sum = 0
-for line in input:
-    if line == '\n': continue
-    iterator = RereadIter(line)
-    next(iterator)
-    packets.append(parseList(iterator))
-
-packets += [ [[2]], [[6]] ]  # Dividers
-packets = sorted(packets, key=functools.cmp_to_key(compare))
-# for packet in packets:
-#     print(packet)
-
-sepIndex1 = packets.index([[2]]) + 1
-sepIndex2 = packets.index([[6]]) + 1
-decoderKey = sepIndex1 * sepIndex2
-
-print(f"Decoder key = {decoderKey}")
+def parse(input):
+    """Return the list of packets in `input`"""
+    packets = []
+    for line in input:
+        if line == '\n': continue
+        iterator = RereadIter(line)
+        next(iterator)
+        packets.append(parseList(iterator))
+    return packets
+
+def part2(packets):
+    packets = packets + [ [[2]], [[6]] ]  # Dividers
+    packets = sorted(packets, key=functools.cmp_to_key(compare))
+    # for packet in packets:
+    #     print(packet)
+
+    sepIndex1 = packets.index([[2]]) + 1
+    sepIndex2 = packets.index([[6]]) + 1
+    return sepIndex1 * sepIndex2
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    decoderKey = part2(parse(input))
+
+    print(f"Decoder key = {decoderKey}")
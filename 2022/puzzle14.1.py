@@ -12,8 +12,6 @@ import sys
 import openInput
 import numpy as np
 
-input = openInput.openInput(sys.argv)
-
 air, rock, sand = (0, 1, 2)
 caveSymbols = ".#o"
 
@@ -24,78 +22,99 @@ def printCave(cave):
         print("{0:>3} {1}".
               format(row, ''.join([ caveSymbols[v] for v in cave[row,:] ])))
 
-# The rock wall is a list of rock lines.  Each rock line consists of a
-# 4-element tuple, (x1, y1, x2, y2), where (x1, y1) is the starting point and
-# (x2, y2) is the end point, inclusive.
-rockLines = [ ]
+def parse(input):
+    """Return `(cave, sandEntrance)` for the rock paths in `input`, where
+    `cave` is a 2-d array filled with `air` and `rock` and `sandEntrance` is
+    the (row, column) at which sand enters `cave`"""
+    # The rock wall is a list of rock lines.  Each rock line consists of a
+    # 4-element tuple, (x1, y1, x2, y2), where (x1, y1) is the starting point and
+    # (x2, y2) is the end point, inclusive.
+    rockLines = [ ]
+
+    # Sand comes int at point (500, 0)
+    sandEntrance = (500, 0)
+
+    # Boundaries of the space
+    minx, miny = sandEntrance
+    maxx, maxy = minx, miny
 
-# Sand comes int at point (500, 0)
-sandEntrance = (500, 0)
+    for line in input:
+        line = line.rstrip()
+        pointStrings = line.split(" -> ")
+        x1, y1, x2, y2 = (None, None, None, None)
+        for pointString in pointStrings:
+            (x1, y1) = (x2, y2)
+            (x2, y2) = [ int(v) for v in pointString.split(',') ]
+            minx = min(x2, minx)
+            maxx = max(x2, maxx)
+            miny = min(y2, miny)
+            maxy = max(y2, maxy)
+            if x1 is None: continue
+            rockLines.append((x1, y1, x2, y2))
 
-# Boundaries of the space
-minx, miny = sandEntrance
-maxx, maxy = minx, miny
+    ncols = maxx - minx + 1
+    nrows = maxy - miny + 1
+    cave = np.full([nrows, ncols], air)
 
-for line in input:
-    line = line.rstrip()
-    pointStrings = line.split(" -> ")
-    x1, y1, x2, y2 = (None, None, None, None)
-    for pointString in pointStrings:
-        (x1, y1) = (x2, y2)
-        (x2, y2) = [ int(v) for v in pointString.split(',') ]
-        minx = min(x2, minx)
-        maxx = max(x2, maxx)
-        miny = min(y2, miny)
-        maxy = max(y2, maxy)
-        if x1 is None: continue
-        rockLines.append((x1, y1, x2, y2))
+    for x1, y1, x2, y2 in rockLines:
+        if x1 == x2:
+            if y1 > y2: y1, y2 = y2, y1   # y1 should be less or equal to than y2
+            for y in range(y1, y2 + 1):
+                cave[y - miny, x1 - minx] = rock
+        else:
+            assert(y1 == y2)  # Line must be vertical or horizontal, not diagonal
+            if x1 > x2: x1, x2 = x2, x1   # x1 should be less or equal to than x2
+            for x in range(x1, x2 + 1):
+                cave[y1 - miny, x - minx] = rock
 
-ncols = maxx - minx + 1
-nrows = maxy - miny + 1
-cave = np.full([nrows, ncols], air)
+    # Sand enters at `sandEntrance`. Since `cave` is offset so that
+    # location `(minx, miny)` is at `(0, 0)`, we similarly comput the offset column
+    # (x axis) and row (y axis) for `sandEntrance`.
+    sandEntranceCol = sandEntrance[0] - minx
+    sandEntranceRow = sandEntrance[1] - miny
+    return (cave, (sandEntranceRow, sandEntranceCol))
 
-for x1, y1, x2, y2 in rockLines:
-    if x1 == x2:
-        if y1 > y2: y1, y2 = y2, y1   # y1 should be less or equal to than y2
-        for y in range(y1, y2 + 1):
-            cave[y - miny, x1 - minx] = rock
-    else:
-        assert(y1 == y2)  # Line must be vertical or horizontal, not diagonal
-        if x1 > x2: x1, x2 = x2, x1   # x1 should be less or equal to than x2
-        for x in range(x1, x2 + 1):
-            cave[y1 - miny, x - minx] = rock
+def pourSand(cave, sandEntrance):
+    """Pour sand into a copy of `cave` at `sandEntrance` until no more sand
+    can come to rest.  Return the filled cave and the number of units of sand
+    that came to rest."""
+    cave = cave.copy()
+    nrows = cave.shape[0]
+    sandEntranceRow, sandEntranceCol = sandEntrance
+    sandUnits = 0
+    done = False
+    while not done:
+        # Process one unit of sand entering at `sandEntrance`
+        try:
+            if cave[sandEntranceRow, sandEntranceCol] != air:
+                done = True
+                break  # No room for more sand
 
-# Process sand entering at `sandEntrance`. Since `cave` is offset so that
-# location `(minx, miny)` is at `(0, 0)`, we similarly comput the offset column
-# (x axis) and row (y axis) for `sandEntrance`.
-sandEntranceCol = sandEntrance[0] - minx
-sandEntranceRow = sandEntrance[1] - miny
-sandUnits = 0
-done = False
-while not done:
-    # Process one unit of sand entering at `sandEntrance`
-    try:
-        if cave[sandEntranceRow, sandEntranceCol] != air:
+            # Trace path of sand unit downwards until the unit comes to rest.
+            # `IndexError` is raised if the sand falls off the sides or bottom of
+            # the cave, indicating that no more sand can come to a rest.
+            col = sandEntranceCol
+            for row in range(sandEntranceRow, nrows + 2):
+                if cave[row, col] == air:
+                    pass
+                elif cave[row, col - 1] == air:
+                    col -= 1
+                elif cave[row, col + 1] == air:
+                    col += 1
+                else:
+                    cave[row - 1, col] = sand  # Unit came to on previous row
+                    sandUnits += 1
+                    break
+        except(IndexError):
             done = True
-            break  # No room for more sand
+    return (cave, sandUnits)
 
-        # Trace path of sand unit downwards until the unit comes to rest.
-        # `IndexError` is raised if the sand falls off the sides or bottom of
-        # the cave, indicating that no more sand can come to a rest.
-        col = sandEntranceCol
-        for row in range(sandEntranceRow, nrows + 2):
-            if cave[row, col] == air:
-                pass
-            elif cave[row, col - 1] == air:
-                col -= 1
-            elif cave[row, col + 1] == air:
-                col += 1
-            else:
-                cave[row - 1, col] = sand  # Unit came to on previous row
-                sandUnits += 1
-                break
-    except(IndexError):
-        done = True
+def part1(data):
+    cave, sandUnits = pourSand(*data)
+    return sandUnits
 
-printCave(cave)
-print(f"Number of units = {sandUnits}")
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    cave, sandUnits = pourSand(*parse(input))
+    printCave(cave)
+    print(f"Number of units = {sandUnits}")
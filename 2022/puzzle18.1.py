@@ -11,23 +11,29 @@
 import sys
 import openInput
 
-input = openInput.openInput(sys.argv)
+def parse(input):
+    """Return the set of 1x1x1 cubes at positions (x, y, z) listed in `input`"""
+    cubes = set()
+    for line in input:
+        coord = tuple( map(lambda x : int(x), line.split(',')) )
+        cubes.add(coord)
+    return cubes
 
-# Set of 1x1x1 cubes at positions (x, y, z)
-cubes = set()
-for line in input:
-    coord = tuple( map(lambda x : int(x), line.split(',')) )
-    cubes.add(coord)
+def part1(cubes):
+    numExposedFaces = 0
+    for x, y, z in cubes:
+        # Add 6 new faces, but remove those that are adjacent to another cube
+        numExposedFaces += 6
+        if (x - 1, y, z) in cubes: numExposedFaces -= 1
+        if (x + 1, y, z) in cubes: numExposedFaces -= 1
+        if (x, y - 1, z) in cubes: numExposedFaces -= 1
+        if (x, y + 1, z) in cubes: numExposedFaces -= 1
+        if (x, y, z - 1) in cubes: numExposedFaces -= 1
+        if (x, y, z + 1) in cubes: numExposedFaces -= 1
+    return numExposedFaces
 
-numExposedFaces = 0
-for x, y, z in cubes:
-    # Add 6 new faces, but remove those that are adjacent to another cube
-    numExposedFaces += 6
-    if (x - 1, y, z) in cubes: numExposedFaces -= 1
-    if (x + 1, y, z) in cubes: numExposedFaces -= 1
-    if (x, y - 1, z) in cubes: numExposedFaces -= 1
-    if (x, y + 1, z) in cubes: numExposedFaces -= 1
-    if (x, y, z - 1) in cubes: numExposedFaces -= 1
-    if (x, y, z + 1) in cubes: numExposedFaces -= 1
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    numExposedFaces = part1(parse(input))
 
-print(f"Number of exposed faces = {numExposedFaces}")
+    print(f"Number of exposed faces = {numExposedFaces}")
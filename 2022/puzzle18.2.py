@@ -12,31 +12,19 @@ import sys
 import openInput
 import numpy as np
 
-input = openInput.openInput(sys.argv)
-
-maxx, maxy, maxz = (0, 0, 0)
-
-# list of 1x1x1 cubes at positions (x, y, z)
-cubes = [ ]
-for line in input:
-    x, y, z = tuple( map(lambda x : int(x), line.split(',')) )
-    maxx = max(maxx, x)
-    maxy = max(maxy, y)
-    maxz = max(maxz, z)
-    cubes.append((x, y, z))
-
-
 air        = 0  # Air whose trapped status is unknown
 trappedAir = 1  # Air that is known to be trapped
 openAir    = 2  # Air that is known not to be trapped
 lava       = 3  # Lave cube
 
-# Create an array for the space, filled with air
-space = np.full((maxx + 1, maxy + 1, maxz + 1), air)
-
-# Set the lava cubes within the space
-for x, y, z in cubes:
-    space[x, y, z] = lava
+def parse(input):
+    """Return the list of 1x1x1 cubes at positions (x, y, z) listed in
+    `input`"""
+    cubes = [ ]
+    for line in input:
+        x, y, z = tuple( map(lambda x : int(x), line.split(',')) )
+        cubes.append((x, y, z))
+    return cubes
 
 def cellType(space, x, y, z):
     """For a cell at `space[x, y, z]`, determine whether the cell contains trapped
@@ -86,14 +74,31 @@ def cellType(space, x, y, z):
 
     return result
 
-numExposedFaces = 0
-for x, y, z in cubes:
-    # Count faces that are exposed to open air
-    if cellType(space, x - 1, y, z) == openAir: numExposedFaces += 1
-    if cellType(space, x + 1, y, z) == openAir: numExposedFaces += 1
-    if cellType(space, x, y - 1, z) == openAir: numExposedFaces += 1
-    if cellType(space, x, y + 1, z) == openAir: numExposedFaces += 1
-    if cellType(space, x, y, z - 1) == openAir: numExposedFaces += 1
-    if cellType(space, x, y, z + 1) == openAir: numExposedFaces += 1
-
-print(f"Number of exposed faces = {numExposedFaces}")
+def part2(cubes):
+    maxx = max([ x for x, y, z in cubes ], default = 0)
+    maxy = max([ y for x, y, z in cubes ], default = 0)
+    maxz = max([ z for x, y, z in cubes ], default = 0)
+
+    # Create an array for the space, filled with air
+    space = np.full((maxx + 1, maxy + 1, maxz + 1), air)
+
+    # Set the lava cubes within the space
+    for x, y, z in cubes:
+        space[x, y, z] = lava
+
+    numExposedFaces = 0
+    for x, y, z in cubes:
+        # Count faces that are exposed to open air
+        if cellType(space, x - 1, y, z) == openAir: numExposedFaces += 1
+        if cellType(space, x + 1, y, z) == openAir: numExposedFaces += 1
+        if cellType(space, x, y - 1, z) == openAir: numExposedFaces += 1
+        if cellType(space, x, y + 1, z) == openAir: numExposedFaces += 1
+        if cellType(space, x, y, z - 1) == openAir: numExposedFaces += 1
+        if cellType(space, x, y, z + 1) == openAir: numExposedFaces += 1
+    return numExposedFaces
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    numExposedFaces = part2(parse(input))
+
+    print(f"Number of exposed faces = {numExposedFaces}")
@@ -45,32 +45,48 @@ def move(board, row, col, direction, num):
     return row, col
 
 
-input = openInput.openInput(sys.argv)
-
-board = [ line.rstrip() for line in input ]
-path = board.pop()  # Last line of input
-board.pop()         # Discard blank line at end
-
-# Direction is 'R', 'L', 'D' or 'U' for Right, Left, Down, or Up
-row, col, direction = 0, 0, RIGHT
-
-# Find first column that is not '#' or space
-col = board[row].index('.')
-print(f"Start row, col = {row}, {col}")
-
-numToMove = 0
-for c in path:
-    if c.isdigit():
-        numToMove *= 10
-        numToMove += int(c)
-    else:
-        row, col = move(board, row, col, direction, numToMove)
-        turn = 1 if c == 'R' else -1
-        direction = (direction + turn) % 4
-        numToMove = 0
-
-# Make final move
-row, col = move(board, row, col, direction, numToMove)
-
-password = (row + 1) * 1000 + (col + 1) * 4 + direction
-print(f"password is {password}")
+def parse(input):
+    """Return `(board, path)` from `input`, where `board` is a list of row
+    strings and `path` is the string of moves and turns"""
+    board = [ line.rstrip() for line in input ]
+    path = board.pop()  # Last line of input
+    board.pop()         # Discard blank line at end
+    return (board, path)
+
+def startPosition(board):
+    """Return the starting row and column on `board`"""
+    # Find first column that is not '#' or space
+    return 0, board[0].index('.')
+
+def part1(data):
+    board, path = data
+
+    # Direction is 'R', 'L', 'D' or 'U' for Right, Left, Down, or Up
+    row, col = startPosition(board)
+    direction = RIGHT
+
+    numToMove = 0
+    for c in path:
+        if c.isdigit():
+            numToMove *= 10
+            numToMove += int(c)
+        else:
+            row, col = move(board, row, col, direction, numToMove)
+            turn = 1 if c == 'R' else -1
+            direction = (direction + turn) % 4
+            numToMove = 0
+
+    # Make final move
+    row, col = move(board, row, col, direction, numToMove)
+
+    return (row + 1) * 1000 + (col + 1) * 4 + direction
+
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    data = parse(input)
+
+    row, col = startPosition(data[0])
+    print(f"Start row, col = {row}, {col}")
+
+    password = part1(data)
+    print(f"password is {password}")
@@ -473,61 +473,77 @@ def testMove():
         assert(inCol   == outCol)
         assert(inDir   == outDir)
 
-testMove()
-
 ################ main program #####################################
 
-input = openInput.openInput(sys.argv)
+def parse(input):
+    """Return `(board, path)` from `input`, where `board` is a list of row
+    strings and `path` is the string of moves and turns"""
+    board = [ line.rstrip() for line in input ]
+    path = board.pop()  # Last line of input
+    board.pop()         # Discard blank line at end
+    return (board, path)
+
+def startPosition(board, cube):
+    """Return the starting `(panel, row, col, direction)` on `board`, folded
+    into `cube`"""
+    # Find first column that is not '#' or space
+    panel = cube[FRONT_FACE]
+    row = panel.originRow
+    col = board[row].index('.', panel.originCol)
+    assert(panel.isInbounds(row, col))
+    return (panel, row, col, EAST)
+
+def followPath(board, cube, path):
+    """Follow `path` from the starting position on `board`, folded into
+    `cube`, and return the final (0-indexed) `(row, col, direction)`"""
+    panel, row, col, direction = startPosition(board, cube)
 
-board = [ line.rstrip() for line in input ]
-path = board.pop()  # Last line of input
-board.pop()         # Discard blank line at end
+    numToMove = 0
+    # Appending '#' to path forces loop to execute a final time after the last digit
+    for c in path + '#':
+        if c.isdigit():
+            numToMove *= 10
+            numToMove += int(c)
+            continue
 
-input.close()
+        panel, row, col, direction = move(board, cube, panel,
+                                          row, col, direction, numToMove)
+        numToMove = 0
+        turn = 1 if c == 'R' else -1 if c == 'L' else 0
+        direction = (direction + turn) % 4
 
-cubeSize = calcCubeSide(board)
-print(f"Cube is {cubeSize} on a side")
+    return (row, col, direction)
 
-cube = foldCube(board, cubeSize)
+def password(row, col, direction):
+    """Return the password for the (0-indexed) final position"""
+    return (row + 1) * 1000 + (col + 1) * 4 + direction
 
-for side in cube:
-    print(side)
+def part2(data):
+    board, path = data
+    cube = foldCube(board, calcCubeSide(board))
+    return password(*followPath(board, cube, path))
 
-# Find first column that is not '#' or space
-panel = cube[FRONT_FACE]
-direction = EAST
-row = panel.originRow
-col = board[row].index('.', panel.originCol)
-assert(panel.isInbounds(row, col))
+if __name__ == "__main__":
+    testMove()
 
-print(f"Start row, col = {row}, {col}")
+    input = openInput.openInput(sys.argv)
+    board, path = parse(input)
+    input.close()
 
-# wo = panel.exitEdgeOffset(1, 0, WEST)
-# print(f"exitEdgeOffset(1, 0, WEST) = {wo}")
-# wr, wc, wd = cube[LEFT_FACE].entrancePosition(panel, wo)
-# print(f"Land at ({wr}, {wc}) going {DIR_NAMES[wd]}")
+    cubeSize = calcCubeSide(board)
+    print(f"Cube is {cubeSize} on a side")
 
-# np, row, col, direction = move(board, cube, panel, 1, 0, WEST, 1)
-# print(f"Land at ({row}, {col}) going {DIR_NAMES[direction]}")
+    cube = foldCube(board, cubeSize)
 
-numToMove = 0
-# Appending '#' to path forces loop to execute a final time after the last digit
-for c in path + '#':
-    if c.isdigit():
-        numToMove *= 10
-        numToMove += int(c)
-        continue
+    for side in cube:
+        print(side)
 
-    panel, row, col, direction = move(board, cube, panel,
-                                      row, col, direction, numToMove)
-    numToMove = 0
-    turn = 1 if c == 'R' else -1 if c == 'L' else 0
-    direction = (direction + turn) % 4
+    panel, row, col, direction = startPosition(board, cube)
+    print(f"Start row, col = {row}, {col}")
+
+    row, col, direction = followPath(board, cube, path)
 
-# Change result from 0 indexed to 1 indexed
-row += 1
-col += 1
-print(f"Landed at ({row}, {col}) heading {DIR_NAMES[direction]}")
+    # Change result from 0 indexed to 1 indexed
+    print(f"Landed at ({row + 1}, {col + 1}) heading {DIR_NAMES[direction]}")
 
-password = row * 1000 + col * 4 + direction
-print(f"password is {password}")
+    print(f"password is {password(row, col, direction)}")
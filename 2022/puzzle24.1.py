@@ -12,8 +12,6 @@ import sys
 import openInput
 import numpy as np
 
-input = openInput.openInput(sys.argv)
-
 # Each cell of the map contains the bitwize AND of one or more of the following
 # values.
 EMPTY, EXPEDITION, WALL = 0, 1, 2
@@ -89,27 +87,36 @@ def moveExpedition(currMap, nextMap):
                     nextMap[nextRow][nextCol] = EXPEDITION
     return nextMap
 
-# Read map
-currMap = None
-for line in input:
-    nextRow = [ symToVal[x] for x in line.rstrip() ]
-    if currMap is None:
-        currMap = np.array(nextRow)
-    else:
-        currMap = np.vstack([ currMap, nextRow ])
+def parse(input):
+    """Read the map from `input` and return it as a 2-d numpy array"""
+    currMap = None
+    for line in input:
+        nextRow = [ symToVal[x] for x in line.rstrip() ]
+        if currMap is None:
+            currMap = np.array(nextRow)
+        else:
+            currMap = np.vstack([ currMap, nextRow ])
+    return currMap
+
+def part1(currMap):
+    # Find entrance in first row and exit in last row of map
+    entranceCol = np.where(currMap[ 0,:] == EMPTY)[0][0]
+    exitCol     = np.where(currMap[-1,:] == EMPTY)[0][0]
 
-# Find entrance in first row and exit in last row of map
-entranceCol = np.where(currMap[ 0,:] == EMPTY)[0][0]
-exitCol     = np.where(currMap[-1,:] == EMPTY)[0][0]
+    currMap = currMap.copy()
+    currMap[0, entranceCol] = EXPEDITION
+    # printMap(currMap, "Initial State")
 
-currMap[0, entranceCol] = EXPEDITION
-# printMap(currMap, "Initial State")
+    numMinutes = 0
+    while currMap[-1, exitCol] != EXPEDITION:
+        numMinutes += 1
+        nextMap = moveBlizzards(currMap)
+        currMap = moveExpedition(currMap, nextMap)
+        # printMap(currMap, f"Minute {numMinutes}")
+    return numMinutes
 
-numMinutes = 0
-while currMap[-1, exitCol] != EXPEDITION:
-    numMinutes += 1
-    nextMap = moveBlizzards(currMap)
-    currMap = moveExpedition(currMap, nextMap)
-    # printMap(currMap, f"Minute {numMinutes}")
+if __name__ == "__main__":
+    input = openInput.openInput(sys.argv)
+    numMinutes = part1(parse(input))
 
-print(f"Finished in {numMinutes} minutes")
+    print(f"Finished in {numMinutes} minutes")
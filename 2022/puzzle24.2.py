@@ -10,9 +10,9 @@
 
 import sys
 import openInput
+import loadGrid
 import numpy as np
-
-input = openInput.openInput(sys.argv)
+from automaton import Automaton, shift
 
 # Each cell of the map contains the bitwize AND of one or more of the following
 # values.
@@ -47,94 +47,80 @@ def printMap(theMap, header = ""):
         s = "".join(map(lambda x: valToSym[x], theMap[row,:]))
         print(s)
 
-def moveBlizzards(currMap):
-    """Given the current map, create a map of the next position of all the
-    blizards"""
-    # Create a blank map containing only the walls
-    nextMap = currMap & WALL
-    lastRow = currMap.shape[0] - 2  # Exclude bottom wall
-    lastCol = currMap.shape[1] - 2  # Exlcude right wall
-    for row in range(1, lastRow + 1):
-        for col in range(1, lastCol + 1):
-            currCell = currMap[row, col]
-            # Note: check all 4 bits (do not use `elif`)
-            if currCell & BLIZZARD_RIGHT:
-                nextCol = 1 if col == lastCol else col + 1
-                nextMap[row, nextCol] |= BLIZZARD_RIGHT
-            if currCell & BLIZZARD_DOWN:
-                nextRow = 1 if row == lastRow else row + 1
-                nextMap[nextRow, col] |= BLIZZARD_DOWN
-            if currCell & BLIZZARD_LEFT:
-                nextCol = lastCol if col == 1 else col - 1
-                nextMap[row, nextCol] |= BLIZZARD_LEFT
-            if currCell & BLIZZARD_UP:
-                nextRow = lastRow if row == 1 else row - 1
-                nextMap[nextRow, col] |= BLIZZARD_UP
-    return nextMap
-
-def moveExpedition(currMap, nextMap):
-    """Return a map with an expedition bit set in each cell where the
-    expedition could be next. The nextMap argument has the next position of
-    all of the blizzards and is upated"""
-    lastRow = currMap.shape[0] - 1  # Include bottom wall
-    lastCol = currMap.shape[1] - 2  # Exlcude right wall
-    for row in range(0, lastRow + 1):
-        for col in (currMap[row,:] == EXPEDITION).nonzero()[0]:
-            # Try each of the 4 directions as well as standing still
-            for drow, dcol in ( (0, 0), (0, 1), (1, 0), (0, -1), (-1, 0) ):
-                nextRow = row + drow
-                nextCol = col + dcol
-                if nextRow < 0 or lastRow < nextRow: continue
-                if nextMap[nextRow][nextCol] == EMPTY:
-                    nextMap[nextRow][nextCol] = EXPEDITION
-    return nextMap
-
-def solve(currMap, startCoords, goalCoords):
-    """Return the number final map and the number of minutes it would take to
-    traverse the valley from the specified start to the specified goal, where
-    `currMap` is the initial state of the blizzard map.
+def moveBlizzards(blizzards):
+    """Given the blizzard planes (right, down, left, up), each a boolean array
+    covering the interior of the valley, return the planes one minute later:
+    each blizzard moves one cell in its direction, wrapping around the
+    interior"""
+    right, down, left, up = blizzards
+    return np.stack((np.roll(right, 1, 1), np.roll(down,  1, 0),
+                     np.roll(left, -1, 1), np.roll(up,   -1, 0)))
+
+def openCells(walls, blizzards, minute):
+    """Return a boolean map of the cells that are free of walls and blizzards
+    at `minute`, where `blizzards` is the blizzard `Automaton`"""
+    occupied = walls.copy()
+    occupied[1:-1, 1:-1] |= blizzards.stateAt(minute).any(axis = 0)
+    return ~occupied
+
+def solve(walls, blizzards, startMinute, startCoords, goalCoords):
+    """Return the number of minutes it would take to traverse the valley from
+    the specified start to the specified goal, setting out at `startMinute`.
+    Every cell that the expedition could occupy is tracked at once: each
+    minute, the set of cells is grown by one step in each direction and
+    intersected with the cells that are open.
     """
-
-    startRow, startCol = startCoords
-    goalRow, goalCol = goalCoords
-
-    currMap[startRow, startCol] = EXPEDITION
-    # printMap(currMap, "Initial State")
-
-    numMinutes = 0
-    while currMap[goalRow, goalCol] != EXPEDITION:
-        numMinutes += 1
-        nextMap = moveBlizzards(currMap)
-        currMap = moveExpedition(currMap, nextMap)
-        # printMap(currMap, f"Minute {numMinutes}")
-    currMap &= (0x3f - EXPEDITION)          # Remove suboptimal trails
-    currMap[goalRow, goalCol] = EXPEDITION  # Put expedition at goal
-    return (currMap, numMinutes)
-
-# Read map
-currMap = None
-for line in input:
-    nextRow = [ symToVal[x] for x in line.rstrip() ]
-    if currMap is None:
-        currMap = np.array(nextRow)
-    else:
-        currMap = np.vstack([ currMap, nextRow ])
-
-# Find entrance in first row and exit in last row of map
-entranceCoords = (0,                    np.where(currMap[ 0,:] == EMPTY)[0][0])
-exitCoords     = (currMap.shape[0] - 1, np.where(currMap[-1,:] == EMPTY)[0][0])
-
-totalMinutes = 0
-currMap, m = solve(currMap, entranceCoords, exitCoords)
-print(f"first trip to goal took {m} minutes")
-totalMinutes += m
-
-currMap, m = solve(currMap, exitCoords, entranceCoords)
-print(f"trip to back to start took {m} minutes")
-totalMinutes += m
-
-currMap, m = solve(currMap, entranceCoords, exitCoords)
-print(f"second trip to goal took {m} minutes")
-totalMinutes += m
-
-print(f"Finished in {totalMinutes} minutes")
+    reach = np.zeros(walls.shape, dtype = bool)
+    reach[startCoords] = True
+
+    minute = startMinute
+    while not reach[goalCoords]:
+        minute += 1
+        reach = (reach | shift(reach, 1, 0) | shift(reach, -1, 0) |
+                 shift(reach, 1, 1) | shift(reach, -1, 1))
+        reach &= openCells(walls, blizzards, minute)
+    return minute - startMinute
+
+def parse(input):
+    """Read the map from `input` and return it as a 2-d numpy array"""
+    return loadGrid.loadGrid(input, symToVal)
+
+def tripTimes(currMap, verbose = False):
+    """Return the number of minutes taken by each of the three trips (to the
+    goal, back to the start, and to the goal again) through the valley whose
+    initial blizzard map is `currMap`.  The blizzards are an `Automaton` whose
+    period is found when they return to their initial positions, after which
+    their positions are looked up rather than simulated."""
+    # Find entrance in first row and exit in last row of map
+    entranceCoords = (0,                    np.where(currMap[ 0,:] == EMPTY)[0][0])
+    exitCoords     = (currMap.shape[0] - 1, np.where(currMap[-1,:] == EMPTY)[0][0])
+
+    walls = (currMap & WALL) != 0
+    interior = currMap[1:-1, 1:-1]
+    blizzards = Automaton(np.stack([ (interior & b) != 0 for b in
+                                     (BLIZZARD_RIGHT, BLIZZARD_DOWN,
+                                      BLIZZARD_LEFT, BLIZZARD_UP) ]),
+                          moveBlizzards, keepHistory = True)
+    times = [ ]
+    minute = 0
+    for startCoords, goalCoords in ((entranceCoords, exitCoords),
+                                    (exitCoords, entranceCoords),
+                                    (entranceCoords, exitCoords)):
+        m = solve(walls, blizzards, minute, startCoords, goalCoords)
+        times.append(m)
+        minute += m
+    if verbose: blizzards.report()
+    return times
+
+def part2(currMap):
+    return sum(tripTimes(currMap))
+
+if __name__ == "__main__":
+    currMap = openInput.loadInput(sys.argv, parse, version = 1)
+
+    first, back, second = tripTimes(currMap, verbose = True)
+    print(f"first trip to goal took {first} minutes")
+    print(f"trip to back to start took {back} minutes")
+    print(f"second trip to goal took {second} minutes")
+
+    print(f"Finished in {first + back + second} minutes")
@@ -0,0 +1,316 @@
+#! /usr/bin/python3
+
+# Usage: benchmark.py [-n REPEAT] [--inputs SUFFIXES] [--threshold FRACTION]
+#                     [--history FILE] [--no-save] [--in-process]
+#                     [--tracemalloc[=N]] [pattern...]
+#
+# Benchmark the alternative implementations ("variants") of puzzle parts,
+# e.g., *puzzle19.1.py*, *puzzle19.1b.py*, and *puzzle19.1c.py*.  Each variant
+# is run REPEAT times on each of the selected inputs (by default, the sample
+# and the real input) and the median, minimum, maximum, and standard deviation
+# of the wall times are recorded in a JSON history file, keyed by the current
+# git commit, together with the peak resident set size (RSS) of the runs.  A
+# variant whose median time or peak RSS exceeds the best recorded for it at
+# any other commit by more than the threshold fraction is flagged as a
+# regression.  Finally, the fastest variant of each puzzle part is
+# reported, so that slower copies can be retired on evidence.
+#
+# With --tracemalloc, each variant is also run once more on each input under
+# `tracemalloc` (which slows it down, so this run is not timed), and the peak
+# traced memory and the top N allocation sites are recorded as well.  The
+# peak traced memory is checked for regressions like the peak RSS.
+#
+# Scripts that report search statistics (see *2021/search_stats.py*) have the
+# counters of their last run recorded, too, so that a change can be judged by
+# whether it reduced the work done or merely made each step cheaper.
+#
+# By default, only puzzle parts having more than one variant are benchmarked.
+# If patterns are given, they select the scripts as for *runpuzzles.py*,
+# whether or not they have other variants.
+#
+# With --in-process, each script is imported once and its `parse` and `partN`
+# functions are timed directly, without the cost of starting a Python process
+# for every run.  In-process timings are recorded under separate keys, so they
+# are never compared with the timings of whole-process runs.
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+import runpuzzles
+
+defaultHistory = os.path.join(runpuzzles.repoDir, "benchmark_history.json")
+
+def puzzlePart(script):
+    """Return the name of the puzzle part implemented by `script`, i.e., its
+    path without the variant suffix (e.g., "2021/puzzle19.1" for
+    "2021/puzzle19.1b.py")"""
+    m = runpuzzles.puzzlePattern.fullmatch(os.path.basename(script))
+    return f"{os.path.dirname(script)}/puzzle{m[1]}.{m[2]}"
+
+def groupVariants(scripts):
+    """Return a dictionary mapping each puzzle part to the list of `scripts`
+    that implement it"""
+    groups = { }
+    for script in scripts:
+        groups.setdefault(puzzlePart(script), [ ]).append(script)
+    return groups
+
+def gitCommit():
+    """Return the abbreviated hash of the current git commit, with a "+dirty"
+    suffix if the working tree has uncommitted changes, or "unknown" if git is
+    not available."""
+    def git(*args):
+        return subprocess.run([ "git", *args ], cwd = runpuzzles.repoDir,
+                              capture_output = True, text = True,
+                              check = True).stdout.strip()
+    try:
+        commit = git("rev-parse", "--short", "HEAD")
+        if git("status", "--porcelain", "--untracked-files=no"):
+            commit += "+dirty"
+        return commit
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def statsKey(script, suffix, inProcess = False):
+    """Return the key of the statistics for `script` on the input selected by
+    `suffix`, i.e., "script:suffix", or "script:suffix:in-process" for
+    in-process runs"""
+    return f"{script}:{suffix}:in-process" if inProcess else f"{script}:{suffix}"
+
+def runInProcess(scripts, suffix, modules):
+    """Solve each of `scripts` on the input selected by `suffix` in this
+    process and return a list of `RunResult`s.  `modules` maps each script to
+    its imported module, or to the `RunResult` describing why it could not be
+    imported."""
+    results = [ ]
+    for script in scripts:
+        module = modules[script]
+        if isinstance(module, runpuzzles.RunResult):
+            results.append(module)
+        else:
+            results.append(runpuzzles.solveInProcess(module, script, suffix))
+    return results
+
+def loadModules(scripts):
+    """Import each of `scripts` and return a dictionary mapping each script to
+    its module or, if it cannot be imported, to a `RunResult` with an "error"
+    status"""
+    modules = { }
+    for script in scripts:
+        try:
+            modules[script] = runpuzzles.loadPuzzle(script)
+        except Exception as e:
+            modules[script] = runpuzzles.RunResult(script, "error", 0.0, 0.0,
+                                                   f"{type(e).__name__}: {e}")
+    return modules
+
+def benchmark(scripts, suffixes, repeat, jobs = 1, inProcess = False,
+              tracemallocTop = 0):
+    """Run each of `scripts` `repeat` times on each of the inputs selected by
+    `suffixes` and return a dictionary mapping `statsKey(script, suffix,
+    inProcess)` to a dictionary of timing and memory statistics.  If
+    `inProcess` is true, the scripts are imported and solved in this process,
+    ignoring `jobs`, and the peak RSS is not recorded.  If `tracemallocTop` is
+    nonzero, each script is run once more under `tracemalloc` to record its
+    peak traced memory and top `tracemallocTop` allocation sites.  Scripts
+    whose input file does not exist are skipped."""
+    stats = { }
+    modules = loadModules(scripts) if inProcess else None
+    for suffix in suffixes:
+        present = [ s for s in scripts if os.path.exists(
+            os.path.join(runpuzzles.repoDir, runpuzzles.inputFile(s, suffix))) ]
+        runs = { s : [ ] for s in present }
+        for i in range(repeat):
+            print(f"Run {i + 1}/{repeat} on {suffix} inputs...", file = sys.stderr)
+            if inProcess:
+                results = runInProcess(present, suffix, modules)
+            else:
+                results = runpuzzles.runAll(present, suffix, jobs)
+            for result in results:
+                runs[result.script].append(result)
+        traced = { }
+        if tracemallocTop:
+            print(f"Tracing memory on {suffix} inputs...", file = sys.stderr)
+            for result in runpuzzles.runAll(present, suffix, jobs,
+                                            tracemallocTop = tracemallocTop):
+                traced[result.script] = result
+        for script, results in runs.items():
+            times = [ r.wallTime for r in results ]
+            rss   = [ r.peakRss for r in results if r.peakRss is not None ]
+            entry = {
+                "median"  : statistics.median(times),
+                "min"     : min(times),
+                "max"     : max(times),
+                "stdev"   : statistics.stdev(times) if len(times) > 1 else 0.0,
+                "peakRss" : max(rss) if rss else None,
+                "status"  : results[-1].status,
+                "answer"  : results[-1].answer
+            }
+            if results[-1].searchStats is not None:
+                entry["searchStats"] = results[-1].searchStats
+            if script in traced and traced[script].tracemallocPeak is not None:
+                entry["tracemallocPeak"] = traced[script].tracemallocPeak
+                entry["allocationSites"] = traced[script].allocationSites
+            stats[statsKey(script, suffix, inProcess)] = entry
+    return stats
+
+def loadHistory(filename):
+    """Load and return the benchmark history from `filename`, or an empty
+    history if the file does not exist."""
+    if not os.path.exists(filename): return { }
+    with open(filename, "r") as f:
+        return json.load(f)
+
+def saveHistory(filename, history):
+    """Write `history` to `filename`"""
+    with open(filename, "w") as f:
+        json.dump(history, f, indent = 1, sort_keys = True)
+        f.write("\n")
+
+# The statistics checked for regressions, and the unit in which each is
+# reported: (name, divisor, unit)
+regressionMetrics = (("median",          1,           "s"),
+                     ("peakRss",         1024 * 1024, "MiB"),
+                     ("tracemallocPeak", 1024 * 1024, "MiB"))
+
+def findRegressions(stats, history, commit, threshold):
+    """Return a list of `(key, metric, value, best, bestCommit)` tuples for
+    each statistic, `metric`, named in `regressionMetrics` of each entry in
+    `stats` whose value exceeds its best (lowest) value in `history`
+    (excluding `commit`) by more than the fraction `threshold`"""
+    regressions = [ ]
+    for key, entry in stats.items():
+        if entry["status"] != "ok": continue
+        for metric, divisor, unit in regressionMetrics:
+            if entry.get(metric) is None: continue
+            best, bestCommit = None, None
+            for otherCommit, record in history.items():
+                if otherCommit == commit: continue
+                old = record["results"].get(key)
+                if old is None or old["status"] != "ok": continue
+                if old.get(metric) is None: continue
+                if best is None or old[metric] < best:
+                    best, bestCommit = old[metric], otherCommit
+            if best is not None and entry[metric] > best * (1 + threshold):
+                regressions.append((key, metric, entry[metric], best, bestCommit))
+    return regressions
+
+def formatMemory(size):
+    """Return `size`, in bytes, formatted in MiB, or "-" if it is `None`"""
+    return "-" if size is None else f"{size / (1024 * 1024):.1f}"
+
+def printStats(stats):
+    """Print a table of the timing and memory statistics in `stats`, followed
+    by the search statistics and the top allocation sites of each entry that
+    has them, or a message if `stats` is empty (e.g., if none of the
+    selected inputs exist)"""
+    if not stats:
+        print("No benchmark results")
+        return
+    width = max(len(k) for k in stats)
+    print(f"{'Variant:input':<{width}}  {'Median':>8} {'Min':>8} {'Max':>8} {'Stdev':>8} "
+          f"{'RSS(MiB)':>9} {'Traced':>8}  Answer")
+    for key, e in stats.items():
+        print(f"{key:<{width}}  {e['median']:8.3f} {e['min']:8.3f} {e['max']:8.3f} {e['stdev']:8.3f} "
+              f"{formatMemory(e.get('peakRss')):>9} {formatMemory(e.get('tracemallocPeak')):>8}  "
+              f"{e['answer'] if e['status'] == 'ok' else e['status']}")
+    searched = [ (key, e) for key, e in stats.items() if e.get("searchStats") ]
+    if searched:
+        print("\nSearch statistics:")
+        for key, e in searched:
+            counters = " ".join(f"{name}={value}" for name, value in e["searchStats"].items())
+            print(f"  {key}: {counters}")
+    traced = [ (key, e) for key, e in stats.items() if e.get("allocationSites") ]
+    if traced:
+        print("\nTop allocation sites (still allocated at exit):")
+        for key, e in traced:
+            print(f"  {key}:")
+            for site, size, count in e["allocationSites"]:
+                print(f"    {size / 1024:10.1f} KiB {count:9} blocks  {site}")
+
+def printFastest(stats, groups, suffixes, inProcess = False):
+    """Print the fastest successful variant of each puzzle part having more
+    than one variant, for each input in `suffixes`"""
+    print("\nFastest variants:")
+    for part, variants in groups.items():
+        if len(variants) < 2: continue
+        for suffix in suffixes:
+            timed = [ (stats[statsKey(v, suffix, inProcess)]["median"], v) for v in variants
+                      if stats.get(statsKey(v, suffix, inProcess), { }).get("status") == "ok" ]
+            if not timed: continue
+            timed.sort()
+            fastest = timed[0]
+            answers = { stats[statsKey(v, suffix, inProcess)]["answer"] for _, v in timed }
+            agree = "" if len(answers) == 1 else "  (answers differ!)"
+            ratios = ", ".join(f"{os.path.basename(v)} x{t / fastest[0]:.2f}"
+                               for t, v in timed[1:])
+            print(f"  {part} on {suffix}: {os.path.basename(fastest[1])} "
+                  f"({fastest[0]:.3f}s){'; ' if ratios else ''}{ratios}{agree}")
+
+def main(argv):
+    parser = argparse.ArgumentParser(description = "Benchmark puzzle variants")
+    parser.add_argument("patterns", nargs = "*",
+                        help = "glob patterns selecting the scripts to run")
+    parser.add_argument("-n", "--repeat", type = int, default = 5,
+                        help = "number of runs of each variant (default: 5)")
+    parser.add_argument("-j", "--jobs", type = int, default = 1,
+                        help = "number of concurrent runs (default: 1)")
+    parser.add_argument("--inputs", default = "sample,input",
+                        help = "comma-separated input suffixes (default: sample,input)")
+    parser.add_argument("--threshold", type = float, default = 0.10,
+                        help = "slowdown fraction flagged as a regression (default: 0.10)")
+    parser.add_argument("--history", default = defaultHistory,
+                        help = "benchmark history file")
+    parser.add_argument("--no-save", action = "store_true",
+                        help = "do not record the results in the history file")
+    parser.add_argument("--tracemalloc", metavar = "N", type = int, nargs = "?",
+                        const = 10, default = 0,
+                        help = "also trace memory allocations, recording the top N "
+                               "allocation sites (default N: 10)")
+    parser.add_argument("--in-process", action = "store_true",
+                        help = "import each script once and time its parse and "
+                               "part functions, without starting a process per run")
+    options = parser.parse_args(argv[1:])
+
+    scripts = runpuzzles.discoverPuzzles(options.patterns)
+    groups = groupVariants(scripts)
+    if not options.patterns:
+        groups = { p : v for p, v in groups.items() if len(v) > 1 }
+        scripts = [ s for v in groups.values() for s in v ]
+    if not scripts:
+        print("No puzzle scripts found", file = sys.stderr)
+        return 1
+
+    suffixes = options.inputs.split(",")
+    stats = benchmark(scripts, suffixes, options.repeat, options.jobs,
+                      options.in_process, options.tracemalloc)
+    printStats(stats)
+    printFastest(stats, groups, suffixes, options.in_process)
+
+    commit = gitCommit()
+    history = loadHistory(options.history)
+    regressions = findRegressions(stats, history, commit, options.threshold)
+    if regressions:
+        print("\nRegressions:")
+        units = { metric : (divisor, unit) for metric, divisor, unit in regressionMetrics }
+        for key, metric, value, best, bestCommit in regressions:
+            divisor, unit = units[metric]
+            print(f"  {key} {metric}: {value / divisor:.3f}{unit} vs. best "
+                  f"{best / divisor:.3f}{unit} at {bestCommit} "
+                  f"(+{100 * (value / best - 1):.0f}%)")
+
+    if not options.no_save:
+        record = history.setdefault(commit, { "results" : { } })
+        record["date"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        record["repeat"] = options.repeat
+        record["results"].update(stats)
+        saveHistory(options.history, history)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,220 @@
+#! /usr/bin/python3
+
+# Usage: crosscheck.py [--input SUFFIX] [-n REPEAT] [--opt FLAGS] [--rebuild]
+#                      [--timeout SECONDS] [--memory-limit MIB] [pattern...]
+#
+# Build the C++ puzzle sources (*puzzleXX.Y.cpp*) with the makefile in their
+# year directory and run each one, together with the Python script of the same
+# name (e.g., *2021/puzzle24.2d.cpp* and *2021/puzzle24.2d.py*), on the same
+# input.  For each pair, check that the answers match and report the ratio of
+# the Python time to the C++ time, which shows where optimizing the Python
+# version is worth the effort.  A C++ source without a Python counterpart (all
+# of 2023) is built and timed on its own.  Each program is run REPEAT times and
+# the fastest wall time is reported.  If patterns are given, they select the
+# C++ sources as for *runpuzzles.py*.
+#
+# The makefiles default to `clang++` and `-g`; the C++ compiler is taken from
+# `$CXX`, or is `clang++` or `g++`, whichever is installed, and the sources are
+# compiled with `--opt` (default `-O2`), so that the timings compare optimized
+# C++ with Python.  `make` rebuilds a program only if its source has changed;
+# `--rebuild` rebuilds it regardless, e.g., after changing `--opt`.
+#
+# C++ programs that hard-code their input file name (as in 2021) are run like
+# the Python scripts that do so; the others (2023) are run as `bin/puzzleXX.Y.exe
+# SUFFIX` and read *input/puzzleXX_SUFFIX.txt*.
+
+import os
+import re
+import sys
+import shutil
+import fnmatch
+import argparse
+import tempfile
+import subprocess
+
+import runpuzzles
+
+cppYearDirs = ("2021", "2022", "2023")
+
+class CrossCheck:
+    """The results of running one C++ program and its Python counterpart"""
+
+    def __init__(self, source, script, cpp, python):
+        self.source = source  # C++ source, relative to `repoDir`
+        self.script = script  # Python script, relative to `repoDir`, or `None`
+        self.cpp    = cpp     # `RunResult` of the C++ program
+        self.python = python  # `RunResult` of the Python script, or `None`
+
+    def match(self):
+        """Return `True` if the answers match, `False` if they differ, or
+        `None` if there is nothing to compare"""
+        if not self.python or self.cpp.status != "ok" or self.python.status != "ok":
+            return None
+        return answerValue(self.cpp.answer) == answerValue(self.python.answer)
+
+    def ratio(self):
+        """Return the Python time divided by the C++ time, or `None`"""
+        if self.match() is None or not self.cpp.wallTime: return None
+        return self.python.wallTime / self.cpp.wallTime
+
+def answerValue(answer):
+    """Return the value of the answer line `answer` for comparison: its last
+    integer (so that "Solution = 42" and "result = 42" match), or the whole
+    line if it contains no integer"""
+    numbers = re.findall(r'-?\d+', answer)
+    return numbers[-1] if numbers else answer.strip()
+
+def discoverSources(patterns = ()):
+    """Return a sorted list of the C++ puzzle sources in the year directories,
+    relative to `repoDir`, restricted to those matching any of the glob
+    `patterns`, if any are given."""
+    sources = [ ]
+    for year in cppYearDirs:
+        directory = os.path.join(runpuzzles.repoDir, year)
+        if not os.path.isdir(directory): continue
+        for name in os.listdir(directory):
+            m = runpuzzles.sourcePattern.fullmatch(name)
+            if not m or m[4] != "cpp": continue
+            source = year + "/" + name
+            if patterns and not any(fnmatch.fnmatch(source, p) or
+                                    fnmatch.fnmatch(name, p)
+                                    for p in patterns):
+                continue
+            sources.append(source)
+    return sorted(sources, key = lambda s: runpuzzles.puzzleKey(s[:-len("cpp")] + "py"))
+
+def pythonCounterpart(source):
+    """Return the Python script with the same name as the C++ `source`, or
+    `None` if there is none"""
+    script = source[:-len("cpp")] + "py"
+    return script if os.path.exists(os.path.join(runpuzzles.repoDir, script)) else None
+
+def findCompiler():
+    """Return the C++ compiler to build with: `$CXX`, if set, else `clang++`
+    or `g++`, whichever is installed"""
+    return (os.environ.get("CXX") or shutil.which("clang++") and "clang++"
+            or "g++")
+
+def build(source, compiler, opt, rebuild = False):
+    """Build the C++ `source` with the makefile in its directory and return
+    `None` on success or the first error reported by the compiler"""
+    directory, name = os.path.split(source)
+    target = "bin/" + name[:-len(".cpp")] + ".exe"
+    argv = [ "make", "--no-print-directory", "-C", os.path.join(runpuzzles.repoDir, directory),
+             f"CXX={compiler}", f"OPT={opt}", target ]
+    if rebuild: argv.insert(1, "-B")
+    proc = subprocess.run(argv, stdin = subprocess.DEVNULL, stdout = subprocess.PIPE,
+                          stderr = subprocess.STDOUT, text = True)
+    if proc.returncode == 0: return None
+    errors = [ line for line in proc.stdout.splitlines() if "error" in line ]
+    return (errors[0] if errors else runpuzzles.lastLine(proc.stdout)
+            or f"make exited with {proc.returncode}")
+
+def runCpp(source, suffix = None, timeout = runpuzzles.defaultTimeout,
+           memoryLimit = runpuzzles.defaultMemoryLimit):
+    """Run the built C++ `source` on the input selected by `suffix` (by
+    default, its usual input) and return a `RunResult`"""
+    directory, name = os.path.split(source)
+    cwd = os.path.join(runpuzzles.repoDir, directory)
+    exe = os.path.join("bin", name[:-len(".cpp")] + ".exe")
+    limits = (timeout, memoryLimit)
+    hardCoded = runpuzzles.hardCodedInputs(source)
+    if hardCoded and suffix:
+        with tempfile.TemporaryDirectory(prefix = "crosscheck") as scratch:
+            target = os.path.join(runpuzzles.repoDir, runpuzzles.inputFile(source, suffix))
+            for inputName in hardCoded:
+                os.symlink(target, os.path.join(scratch, inputName))
+            return runpuzzles.runCommand(source, [ os.path.join(cwd, exe) ], scratch,
+                                         *limits)
+    elif hardCoded:
+        return runpuzzles.runCommand(source, [ exe ], cwd, *limits)
+    else:
+        return runpuzzles.runCommand(source, [ exe, suffix or "input" ], cwd, *limits)
+
+def fastest(run, repeat):
+    """Call `run()` up to `repeat` times and return the successful
+    `RunResult` with the least wall time, or the first unsuccessful one"""
+    best = None
+    for i in range(repeat):
+        result = run()
+        if result.status != "ok": return result
+        if best is None or result.wallTime < best.wallTime:
+            best = result
+    return best
+
+def printReport(checks, file = sys.stdout):
+    """Print a table with one row per `CrossCheck` in `checks`"""
+    width = max([ len(c.source) for c in checks ] + [ len("Puzzle") ])
+    print(f"{'Puzzle':<{width}}  {'C++(s)':>9} {'Python(s)':>9} {'Ratio':>8}  "
+          f"{'Match':<5}  Answer", file = file)
+    for c in checks:
+        cppTime = f"{c.cpp.wallTime:9.3f}" if c.cpp.status == "ok" else f"{c.cpp.status:>9}"
+        if c.python is None:
+            pyTime = f"{'-':>9}"
+        elif c.python.status == "ok":
+            pyTime = f"{c.python.wallTime:9.3f}"
+        else:
+            pyTime = f"{c.python.status:>9}"
+        ratio = c.ratio()
+        ratio = f"{ratio:7.1f}x" if ratio is not None else f"{'-':>8}"
+        match = { True : "yes", False : "NO", None : "-" }[c.match()]
+        answer = c.cpp.answer
+        if c.match() is False:
+            answer = f"C++: {c.cpp.answer} | Python: {c.python.answer}"
+        elif c.cpp.status == "ok" and c.python and c.python.status != "ok":
+            answer += f" | Python: {c.python.answer}"
+        print(f"{c.source:<{width}}  {cppTime} {pyTime} {ratio}  {match:<5}  {answer}",
+              file = file)
+
+def main(argv):
+    parser = argparse.ArgumentParser(description = "Cross-check C++ puzzle solutions "
+                                     "against the Python ones")
+    parser.add_argument("patterns", nargs = "*",
+                        help = "glob patterns selecting the C++ sources to check")
+    parser.add_argument("--input", metavar = "SUFFIX",
+                        help = "input suffix, e.g., \"sample\" (default: each puzzle's usual input)")
+    parser.add_argument("-n", "--repeat", type = int, default = 1,
+                        help = "number of runs of each program; the fastest is reported (default: 1)")
+    parser.add_argument("--opt", default = "-O2",
+                        help = "C++ optimization flags (default: -O2)")
+    parser.add_argument("--rebuild", action = "store_true",
+                        help = "rebuild the C++ programs even if they are up to date")
+    parser.add_argument("--timeout", metavar = "SECONDS", type = float,
+                        default = runpuzzles.defaultTimeout,
+                        help = f"kill a program after this many seconds; 0 for no limit "
+                               f"(default: {runpuzzles.defaultTimeout})")
+    parser.add_argument("--memory-limit", metavar = "MIB", type = int,
+                        default = runpuzzles.defaultMemoryLimit,
+                        help = f"limit the address space of each program; 0 for no limit "
+                               f"(default: {runpuzzles.defaultMemoryLimit})")
+    options = parser.parse_args(argv[1:])
+    limits = dict(timeout = options.timeout, memoryLimit = options.memory_limit)
+
+    sources = discoverSources(options.patterns)
+    if not sources:
+        print("No C++ puzzle sources found", file = sys.stderr)
+        return 1
+
+    compiler = findCompiler()
+    checks = [ ]
+    for source in sources:
+        script = pythonCounterpart(source)
+        error = build(source, compiler, options.opt, options.rebuild)
+        if error:
+            cpp = runpuzzles.RunResult(source, "build", 0.0, 0.0, error)
+            checks.append(CrossCheck(source, script, cpp, None))
+            continue
+        cpp = fastest(lambda: runCpp(source, options.input, **limits), options.repeat)
+        python = None
+        if script:
+            python = fastest(lambda: runpuzzles.runPuzzle(script, options.input, **limits),
+                             options.repeat)
+        checks.append(CrossCheck(source, script, cpp, python))
+
+    printReport(checks)
+    return 0 if all(c.cpp.status == "ok" and c.match() is not False and
+                    (c.python is None or c.python.status == "ok")
+                    for c in checks) else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
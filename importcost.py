@@ -0,0 +1,137 @@
+#! /usr/bin/python3
+
+# Usage: importcost.py [-n REPEAT] [--top N] [--sort] [pattern...]
+#
+# Report the cost of the imports made by each puzzle script, as measured by
+# Python's `-X importtime` option.  Each script is imported (without running
+# its main program) in a fresh interpreter whose current directory is the
+# script's year directory, REPEAT times, and the fastest run is reported: the
+# total time spent in the imports made by the script, including the modules
+# they import in turn, and the N most expensive of those imports.  Modules
+# imported during interpreter startup are not counted against any script, but
+# the cost of interpreter startup is reported for comparison.  If patterns are
+# given, they select the scripts as for *runpuzzles.py*.
+#
+# Note that if `PYTHONDONTWRITEBYTECODE` is set, every import includes the
+# cost of compiling the imported module.
+
+import os
+import sys
+import argparse
+import subprocess
+
+import runpuzzles
+
+# Program run by `python3 -X importtime -c` to import the script named by
+# `sys.argv[1]`.  Everything that `-X importtime` reports after the marker
+# line is attributed to the script.
+importProgram = """
+import sys, importlib.util
+sys.path.insert(0, ".")
+spec = importlib.util.spec_from_file_location("puzzle", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+print("importcost: start", file = sys.stderr, flush = True)
+spec.loader.exec_module(module)
+"""
+
+startMarker = "importcost: start"
+
+class ImportCost:
+    """The cost of the imports made by one puzzle script"""
+
+    def __init__(self, script, status, total, imports, message = ""):
+        self.script  = script   # Path relative to `repoDir`
+        self.status  = status   # "ok" or "error"
+        self.total   = total    # Total import time, in microseconds
+        self.imports = imports  # List of (module, microseconds), most expensive first
+        self.message = message  # Last line of stderr, on error
+
+def parseImportTime(stderr):
+    """Return a list of `(module, cumulative microseconds)` for the top-level
+    imports reported by `-X importtime` in `stderr` after `startMarker`, most
+    expensive first"""
+    imports = [ ]
+    started = False
+    for line in stderr.splitlines():
+        if line == startMarker:
+            started = True
+            continue
+        if not started or not line.startswith("import time:"): continue
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit(): continue  # Header
+        name = fields[2][1:]
+        if name.startswith(" "): continue  # Imported by another import
+        imports.append((name, int(fields[1])))
+    imports.sort(key = lambda x: -x[1])
+    return imports
+
+def measure(script, repeat):
+    """Import `script` (relative to `repoDir`) `repeat` times with
+    `-X importtime` and return the `ImportCost` of the fastest run"""
+    cwd = os.path.join(runpuzzles.repoDir, os.path.dirname(script))
+    best = None
+    for i in range(repeat):
+        proc = subprocess.run([ sys.executable, "-X", "importtime", "-c",
+                                importProgram, os.path.basename(script) ],
+                              cwd = cwd, stdin = subprocess.DEVNULL,
+                              stdout = subprocess.DEVNULL,
+                              stderr = subprocess.PIPE, text = True)
+        if proc.returncode != 0:
+            message = runpuzzles.lastLine(proc.stderr) or f"exit {proc.returncode}"
+            return ImportCost(script, "error", 0, [ ], message)
+        imports = parseImportTime(proc.stderr)
+        total = sum(t for _, t in imports)
+        if best is None or total < best.total:
+            best = ImportCost(script, "ok", total, imports)
+    return best
+
+def startupCost(repeat):
+    """Return the fastest total time, in microseconds, of the imports made
+    during interpreter startup"""
+    times = [ ]
+    for i in range(repeat):
+        proc = subprocess.run([ sys.executable, "-X", "importtime", "-c", "pass" ],
+                              stdin = subprocess.DEVNULL, stdout = subprocess.DEVNULL,
+                              stderr = subprocess.PIPE, text = True)
+        times.append(sum(t for _, t in parseImportTime(startMarker + "\n" + proc.stderr)))
+    return min(times)
+
+def printReport(costs, top, file = sys.stdout):
+    """Print a table with one row per `ImportCost` in `costs`, showing the
+    `top` most expensive imports of each"""
+    width = max([ len(c.script) for c in costs ] + [ len("Puzzle") ])
+    print(f"{'Puzzle':<{width}}  {'Imports(ms)':>11}  Most expensive imports (ms)",
+          file = file)
+    for c in costs:
+        if c.status == "ok":
+            heaviest = ", ".join(f"{name} {t / 1000:.1f}" for name, t in c.imports[:top])
+            print(f"{c.script:<{width}}  {c.total / 1000:11.1f}  {heaviest}", file = file)
+        else:
+            print(f"{c.script:<{width}}  {'error':>11}  {c.message}", file = file)
+
+def main(argv):
+    parser = argparse.ArgumentParser(description = "Report the import cost of puzzle scripts")
+    parser.add_argument("patterns", nargs = "*",
+                        help = "glob patterns selecting the scripts to measure")
+    parser.add_argument("-n", "--repeat", type = int, default = 3,
+                        help = "number of runs of each script; the fastest is reported (default: 3)")
+    parser.add_argument("--top", type = int, default = 3,
+                        help = "number of most expensive imports to show (default: 3)")
+    parser.add_argument("--sort", action = "store_true",
+                        help = "sort by import cost, most expensive first")
+    options = parser.parse_args(argv[1:])
+
+    scripts = runpuzzles.discoverPuzzles(options.patterns)
+    if not scripts:
+        print("No puzzle scripts found", file = sys.stderr)
+        return 1
+
+    costs = [ measure(s, options.repeat) for s in scripts ]
+    if options.sort:
+        costs.sort(key = lambda c: -c.total)
+    printReport(costs, options.top)
+    print(f"\nInterpreter startup: {startupCost(options.repeat) / 1000:.1f} ms")
+    return 0 if all(c.status == "ok" for c in costs) else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,63 @@
+# Synthetic puzzle-input generators
+#
+# Each generator writes a valid input for one puzzle, in the puzzle's exact
+# text format, at a requested scale, so that solutions can be profiled on
+# inputs much larger than the real ones.  What "scale" means is specific to
+# each puzzle (e.g., the side of a square grid or the number of input lines)
+# and is described by the generator's docstring; run
+# `python3 -m inputgen --list` to see them all.  Generation is seeded, so the
+# same (puzzle, scale, seed) always produces the same file.
+#
+# Generated files are named to plug into the existing input-naming
+# conventions, with an input suffix of "genSCALE" (or "genSCALEsSEED" for a
+# non-default seed):
+#
+#   2021/puzzleN_input.SUFFIX.txt   selected by `runpuzzles.py --input SUFFIX`
+#   2022/puzzleXX_SUFFIX.txt        selected by `puzzleXX.Y.py SUFFIX`
+
+import os
+import random
+
+repoDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Maps (year, puzzle) to (generator function, default scale)
+generators = { }
+
+def generator(year, puzzle, defaultScale):
+    """Decorator that registers a generator function for the specified
+    `puzzle` of the specified `year`.  The function is called as
+    `function(rng, scale)`, where `rng` is a `random.Random`, and must return
+    an iterable of lines, without line terminators."""
+    def register(function):
+        generators[(year, puzzle)] = (function, defaultScale)
+        return function
+    return register
+
+def defaultSuffix(scale, seed = 0):
+    """Return the input suffix used for a generated input of the specified
+    `scale` and `seed`"""
+    return f"gen{scale}" if seed == 0 else f"gen{scale}s{seed}"
+
+def outputName(year, puzzle, suffix):
+    """Return the path of the input file, relative to `repoDir`, for the
+    specified `puzzle` of the specified `year` and input `suffix`"""
+    if year == 2021:
+        return f"2021/puzzle{puzzle}_input.{suffix}.txt"
+    else:
+        return f"{year}/puzzle{puzzle:02d}_{suffix}.txt"
+
+def generate(year, puzzle, scale = None, seed = 0, suffix = None):
+    """Generate an input for the specified `puzzle` of the specified `year`
+    and write it to the file named by `outputName`.  Return the file name."""
+    function, defaultScale = generators[(year, puzzle)]
+    if scale is None: scale = defaultScale
+    if suffix is None: suffix = defaultSuffix(scale, seed)
+    rng = random.Random(f"{year}/{puzzle}/{scale}/{seed}")
+    filename = outputName(year, puzzle, suffix)
+    with open(os.path.join(repoDir, filename), "w") as f:
+        for line in function(rng, scale):
+            f.write(line)
+            f.write("\n")
+    return filename
+
+from . import year2021, year2022
@@ -0,0 +1,55 @@
+# Usage: python3 -m inputgen [--scale N] [--seed S] [--suffix SUFFIX] [--list]
+#                            [YEAR/PUZZLE...]
+#
+# Generate synthetic inputs for the specified puzzles (e.g., "2021/15" or
+# "2022/9"), or for every puzzle that has a generator if none are specified.
+# By default, each generator uses its own default scale, which approximates the
+# size of the real input.
+
+import sys
+import argparse
+
+import inputgen
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog = "inputgen",
+                                     description = "Generate synthetic puzzle inputs")
+    parser.add_argument("puzzles", nargs = "*",
+                        help = "puzzles to generate, as YEAR/PUZZLE (default: all)")
+    parser.add_argument("--scale", type = int,
+                        help = "size of the generated inputs (default: per puzzle)")
+    parser.add_argument("--seed", type = int, default = 0,
+                        help = "random seed (default: 0)")
+    parser.add_argument("--suffix",
+                        help = "input suffix of the generated files (default: genSCALE)")
+    parser.add_argument("--list", action = "store_true",
+                        help = "list the generators and the meaning of their scale")
+    options = parser.parse_args(argv[1:])
+
+    if options.list:
+        for (year, puzzle), (function, defaultScale) in sorted(inputgen.generators.items()):
+            doc = " ".join(function.__doc__.split())
+            print(f"{year}/{puzzle:<3} (default scale {defaultScale}): {doc}")
+        return 0
+
+    if options.puzzles:
+        puzzles = [ ]
+        for spec in options.puzzles:
+            try:
+                year, puzzle = map(int, spec.split("/"))
+            except ValueError:
+                parser.error(f"invalid puzzle {spec!r}; expected YEAR/PUZZLE")
+            if (year, puzzle) not in inputgen.generators:
+                parser.error(f"no generator for {spec}")
+            puzzles.append((year, puzzle))
+    else:
+        puzzles = sorted(inputgen.generators)
+
+    for year, puzzle in puzzles:
+        filename = inputgen.generate(year, puzzle, options.scale, options.seed,
+                                     options.suffix)
+        print(f"Wrote {filename}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
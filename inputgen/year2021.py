@@ -0,0 +1,423 @@
+# Input generators for the 2021 puzzles
+#
+# Puzzles 17 and 21 take their (tiny) input on the command line or in the
+# source, so they have no generators.
+
+import itertools
+
+from . import generator
+
+def _digitGrid(rng, rows, cols, digits):
+    """Return the lines of a grid of random characters chosen from `digits`"""
+    for r in range(rows):
+        yield "".join(rng.choices(digits, k = cols))
+
+@generator(2021, 1, 2000)
+def sonarSweep(rng, scale):
+    """`scale` depth measurements, as a random walk"""
+    depth = rng.randint(100, 200)
+    for i in range(scale):
+        depth = max(1, depth + rng.randint(-10, 20))
+        yield str(depth)
+
+@generator(2021, 2, 1000)
+def dive(rng, scale):
+    """`scale` submarine commands"""
+    for i in range(scale):
+        yield f"{rng.choice(('forward', 'forward', 'down', 'up'))} {rng.randint(1, 9)}"
+
+@generator(2021, 3, 1000)
+def binaryDiagnostic(rng, scale):
+    """`scale` distinct binary numbers of at least 12 bits"""
+    width = max(12, (2 * scale - 1).bit_length())
+    numbers = [ format(n, f"0{width}b") for n in rng.sample(range(1 << width), scale) ]
+
+    # The CO2 scrubber rating keeps the numbers having the less common bit in
+    # each position, which must not be an empty set.  Where all remaining
+    # numbers have the same bit, flip that bit in one of them.
+    remaining = list(range(scale))
+    for pos in range(width):
+        if len(remaining) < 2: break
+        ones = [ i for i in remaining if numbers[i][pos] == "1" ]
+        zeros = [ i for i in remaining if numbers[i][pos] == "0" ]
+        if not ones or not zeros:
+            i = rng.choice(remaining)
+            flipped = "1" if numbers[i][pos] == "0" else "0"
+            numbers[i] = numbers[i][:pos] + flipped + numbers[i][pos + 1:]
+            break
+        remaining = ones if len(zeros) > len(ones) else zeros
+    return numbers
+
+@generator(2021, 4, 100)
+def giantSquid(rng, scale):
+    """`scale` bingo boards"""
+    draws = list(range(100))
+    rng.shuffle(draws)
+    yield ",".join(map(str, draws))
+    for b in range(scale):
+        yield ""
+        board = rng.sample(range(100), 25)
+        for r in range(5):
+            yield " ".join(f"{n:2d}" for n in board[5 * r : 5 * r + 5])
+
+@generator(2021, 5, 500)
+def hydrothermalVenture(rng, scale):
+    """`scale` horizontal, vertical, and diagonal vent lines in a 1000x1000
+    field"""
+    for i in range(scale):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        kind = rng.randrange(3)
+        if kind == 0:
+            x2, y2 = rng.randrange(1000), y1
+        elif kind == 1:
+            x2, y2 = x1, rng.randrange(1000)
+        else:
+            sx, sy = rng.choice((-1, 1)), rng.choice((-1, 1))
+            length = rng.randint(0, min(999 - x1 if sx > 0 else x1,
+                                        999 - y1 if sy > 0 else y1))
+            x2, y2 = x1 + sx * length, y1 + sy * length
+        yield f"{x1},{y1} -> {x2},{y2}"
+
+@generator(2021, 6, 300)
+def lanternfish(rng, scale):
+    """`scale` lanternfish timers"""
+    yield ",".join(str(rng.randint(1, 5)) for i in range(scale))
+
+@generator(2021, 7, 1000)
+def treacheryOfWhales(rng, scale):
+    """`scale` crab positions"""
+    yield ",".join(str(int(rng.triangular(0, 2 * scale, 0))) for i in range(scale))
+
+_segments = ("abcefg", "cf", "acdeg", "acdfg", "bcdf",
+             "abdfg", "abdefg", "acf", "abcdefg", "abcdfg")
+
+@generator(2021, 8, 200)
+def sevenSegmentSearch(rng, scale):
+    """`scale` displays, each with its own scrambled segment wiring"""
+    for i in range(scale):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+        def scramble(digit):
+            return "".join(rng.sample([ wiring[s] for s in _segments[digit] ],
+                                      len(_segments[digit])))
+        patterns = [ scramble(d) for d in rng.sample(range(10), 10) ]
+        output = [ scramble(rng.randrange(10)) for j in range(4) ]
+        yield f"{' '.join(patterns)} | {' '.join(output)}"
+
+@generator(2021, 9, 100)
+def smokeBasin(rng, scale):
+    """A `scale` x `scale` height map"""
+    return _digitGrid(rng, scale, scale, "012345678999")
+
+_closers = { "(" : ")", "[" : "]", "{" : "}", "<" : ">" }
+
+@generator(2021, 10, 90)
+def syntaxScoring(rng, scale):
+    """`scale` lines of navigation subsystem, each either corrupted or
+    incomplete, with an odd number of incomplete lines"""
+    incomplete = [ rng.random() < 0.5 for i in range(scale) ]
+    if scale and sum(incomplete) % 2 == 0:
+        incomplete[-1] = not incomplete[-1]
+    for isIncomplete in incomplete:
+        length = rng.randint(80, 110)
+        line, stack = [ ], [ ]
+        corruptAt = None if isIncomplete else rng.randrange(length // 2, length)
+        while True:
+            if stack and not isIncomplete and len(line) >= corruptAt:
+                wrong = [ c for c in _closers.values() if c != stack[-1] ]
+                line.append(rng.choice(wrong))
+                break
+            if stack and isIncomplete and len(line) >= length:
+                break
+            if stack and rng.random() < 0.45:
+                line.append(stack.pop())
+            else:
+                opener = rng.choice("([{<")
+                line.append(opener)
+                stack.append(_closers[opener])
+        yield "".join(line)
+
+@generator(2021, 11, 10)
+def dumboOctopus(rng, scale):
+    """A `scale` x `scale` grid of energy levels.  Unlike the real 10x10 grid,
+    a large grid might take very many steps to flash simultaneously."""
+    return _digitGrid(rng, scale, scale, "0123456789")
+
+@generator(2021, 12, 7)
+def passagePathing(rng, scale):
+    """A cave system with `scale` small caves.  Big caves are never adjacent to
+    each other, so the number of paths is finite, but it grows explosively with
+    `scale`."""
+    small = rng.sample([ "".join(p) for p in itertools.product(
+        "abcdefghijklmnopqrstuvwxyz", repeat = 2) ], scale)
+    big = rng.sample([ "".join(p) for p in itertools.product(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZ", repeat = 2) ], max(1, scale // 3))
+    edges = set()
+    def connect(a, b):
+        if a != b and (a, b) not in edges and (b, a) not in edges:
+            edges.add((a, b) if rng.random() < 0.5 else (b, a))
+    for cave in small:
+        connect(cave, rng.choice(big))
+    for i in range(scale):
+        connect(rng.choice(small), rng.choice(small + big))
+    for end in ("start", "end"):
+        for cave in rng.sample(small + big, 2):
+            connect(end, cave)
+    edges = list(edges)
+    rng.shuffle(edges)
+    for a, b in edges:
+        yield f"{a}-{b}"
+
+@generator(2021, 13, 900)
+def transparentOrigami(rng, scale):
+    """`scale` dots on a sheet that folds exactly in half, alternately along x
+    and y, down to a 40 x 6 code area"""
+    folds = max(1, (scale // 100).bit_length() + 2)
+    xFolds, yFolds = [ 40 ], [ 6 ]
+    for i in range(folds - 1):
+        xFolds.append(2 * xFolds[-1] + 1)
+        yFolds.append(2 * yFolds[-1] + 1)
+    width, height = 2 * xFolds[-1] + 1, 2 * yFolds[-1] + 1
+
+    def onFold(v, folds):
+        # True if coordinate `v` lands on a fold line at any stage of folding
+        for f in reversed(folds):
+            if v == f: return True
+            if v > f: v = 2 * f - v
+        return False
+    def randomCoord(size, folds):
+        while True:
+            v = rng.randrange(size)
+            if not onFold(v, folds): return v
+
+    # Make the extent of the sheet visible in the dots
+    dots = { (width - 1, randomCoord(height, yFolds)),
+             (randomCoord(width, xFolds), height - 1) }
+    while len(dots) < scale:
+        dots.add((randomCoord(width, xFolds), randomCoord(height, yFolds)))
+    for x, y in rng.sample(sorted(dots), len(dots)):
+        yield f"{x},{y}"
+    yield ""
+    for x, y in zip(reversed(xFolds), reversed(yFolds)):
+        yield f"fold along x={x}"
+        yield f"fold along y={y}"
+
+@generator(2021, 14, 20)
+def extendedPolymerization(rng, scale):
+    """A polymer template of `scale` elements and insertion rules for every
+    pair of ten elements"""
+    elements = "BCFHKNOPSV"
+    yield "".join(rng.choices(elements, k = scale))
+    yield ""
+    for a, b in rng.sample(list(itertools.product(elements, repeat = 2)), 100):
+        yield f"{a}{b} -> {rng.choice(elements)}"
+
+@generator(2021, 15, 100)
+def chiton(rng, scale):
+    """A `scale` x `scale` risk map"""
+    return _digitGrid(rng, scale, scale, "123456789")
+
+def _bitsPacket(rng, budget, typeId = None):
+    """Return a random BITS packet, as a string of binary digits, and its
+    number of literal packets, containing at most `budget` literal packets.
+    If `typeId` is specified, the packet is an operator of that type."""
+    version = format(rng.randrange(8), "03b")
+    if typeId is None and (budget <= 1 or rng.random() < 0.3):
+        value = rng.randrange(1 << rng.randint(4, 36))
+        groups = [ ]
+        while True:
+            groups.append(value & 0xf)
+            value >>= 4
+            if not value: break
+        groups.reverse()
+        bits = "".join(("0" if i == len(groups) - 1 else "1") + format(g, "04b")
+                       for i, g in enumerate(groups))
+        return (version + "100" + bits, 1)
+
+    if typeId is None: typeId = rng.choice((0, 1, 2, 3, 5, 6, 7))
+    count = 2 if typeId >= 5 else rng.randint(1, min(budget, 8))
+    subpackets, used = [ ], 0
+    for i in range(count):
+        share = max(1, (budget - used) // (count - i))
+        packet, literals = _bitsPacket(rng, share)
+        subpackets.append(packet)
+        used += literals
+    body = "".join(subpackets)
+    if len(body) < (1 << 15) and rng.random() < 0.5:
+        header = "0" + format(len(body), "015b")
+    else:
+        header = "1" + format(count, "011b")
+    return (version + format(typeId, "03b") + header + body, used)
+
+@generator(2021, 16, 70)
+def packetDecoder(rng, scale):
+    """A BITS transmission containing about `scale` literal packets, whose
+    outermost packet is a sum"""
+    bits, literals = _bitsPacket(rng, scale, 0)
+    bits += "0" * (-len(bits) % 4)
+    yield "".join(format(int(bits[i : i + 4], 2), "X") for i in range(0, len(bits), 4))
+
+def _snailfishNumber(rng, depth = 1):
+    if depth < 4 and rng.random() < 0.7 or depth == 1:
+        return (f"[{_snailfishNumber(rng, depth + 1)},"
+                f"{_snailfishNumber(rng, depth + 1)}]")
+    elif depth == 4 and rng.random() < 0.5:
+        return f"[{rng.randrange(10)},{rng.randrange(10)}]"
+    else:
+        return str(rng.randrange(10))
+
+@generator(2021, 18, 100)
+def snailfish(rng, scale):
+    """`scale` reduced snailfish numbers"""
+    for i in range(scale):
+        yield _snailfishNumber(rng)
+
+def _rotations():
+    """Return the 24 proper rotations of 3-space, each as a tuple of
+    `(axis, sign)` pairs giving the source of each result coordinate"""
+    rotations = [ ]
+    for perm in itertools.permutations(range(3)):
+        parity = sum(perm[i] > perm[j] for i in range(3) for j in range(i + 1, 3))
+        for signs in itertools.product((1, -1), repeat = 3):
+            if (-1) ** parity * signs[0] * signs[1] * signs[2] == 1:
+                rotations.append(tuple(zip(perm, signs)))
+    return rotations
+
+@generator(2021, 19, 30)
+def beaconScanner(rng, scale):
+    """`scale` scanners, each of which overlaps some other scanner's range in
+    at least 12 beacons, and each of which reports every beacon within 1000
+    units on each axis, in its own random orientation"""
+    def inRange(beacon, scanner):
+        return all(abs(b - s) <= 1000 for b, s in zip(beacon, scanner))
+    def randomPoint(lo, hi):
+        return tuple(rng.randint(l, h) for l, h in zip(lo, hi))
+
+    def seenBy(scanner):
+        return sum(1 for b in beacons if inRange(b, scanner))
+
+    scanners = [ (0, 0, 0) ]
+    children = { (0, 0, 0) : 0 }
+    beacons = { randomPoint((-1000,) * 3, (1000,) * 3) for i in range(26) }
+    while len(scanners) < scale:
+        # Place a new scanner whose range overlaps its parent's by 750-1100
+        # units on each axis and is not too close to any other scanner.  No
+        # scanner is the parent of more than two others, so that none sees
+        # many more beacons than a real scanner does.
+        parent = rng.choice([ s for s in scanners if children[s] < 2 ])
+        offset = tuple(rng.choice((-1, 1)) * rng.randint(900, 1250) for i in range(3))
+        scanner = tuple(p + o for p, o in zip(parent, offset))
+        if any(max(abs(a - b) for a, b in zip(scanner, other)) < 900
+               for other in scanners):
+            continue
+
+        # Put 12-14 beacons in the overlap, then add beacons seen only by the
+        # new scanner until it sees about as many as a real scanner does
+        lo = tuple(max(p, s) - 1000 for p, s in zip(parent, scanner))
+        hi = tuple(min(p, s) + 1000 for p, s in zip(parent, scanner))
+        shared = sum(1 for b in beacons if inRange(b, parent) and inRange(b, scanner))
+        for i in range(max(0, rng.randint(12, 14) - shared)):
+            beacons.add(randomPoint(lo, hi))
+        target = rng.randint(25, 27)
+        for attempt in range(1000):
+            if seenBy(scanner) >= target: break
+            beacon = randomPoint(tuple(s - 1000 for s in scanner),
+                                 tuple(s + 1000 for s in scanner))
+            if not any(inRange(beacon, other) for other in scanners):
+                beacons.add(beacon)
+        scanners.append(scanner)
+        children[parent] += 1
+        children[scanner] = 0
+
+    rotations = _rotations()
+    beacons = sorted(beacons)
+    for n, scanner in enumerate(scanners):
+        if n > 0: yield ""
+        yield f"--- scanner {n} ---"
+        rotation = rotations[0] if n == 0 else rng.choice(rotations)
+        seen = [ b for b in beacons if inRange(b, scanner) ]
+        rng.shuffle(seen)
+        for beacon in seen:
+            relative = [ b - s for b, s in zip(beacon, scanner) ]
+            yield ",".join(str(sign * relative[axis]) for axis, sign in rotation)
+
+@generator(2021, 20, 100)
+def trenchMap(rng, scale):
+    """An enhancement algorithm that flips the infinite background on
+    alternate steps, and a `scale` x `scale` input image"""
+    algorithm = [ rng.choice("#.") for i in range(512) ]
+    algorithm[0], algorithm[511] = "#", "."
+    yield "".join(algorithm)
+    yield ""
+    yield from _digitGrid(rng, scale, scale, "#.")
+
+@generator(2021, 22, 420)
+def reactorReboot(rng, scale):
+    """`scale` reboot steps: up to 20 initialization steps within -50..50,
+    followed by large cuboids"""
+    for i in range(scale):
+        state = "on" if i == 0 or rng.random() < 0.6 else "off"
+        if i < 20:
+            ranges = [ sorted((rng.randint(-50, 50), rng.randint(-50, 50))) for a in range(3) ]
+        else:
+            ranges = [ ]
+            for a in range(3):
+                lo = rng.randint(-100000, 80000)
+                ranges.append((lo, lo + rng.randint(1000, 30000)))
+        yield f"{state} " + ",".join(f"{axis}={lo}..{hi}"
+                                     for axis, (lo, hi) in zip("xyz", ranges))
+
+# Starting burrows, as the top then bottom rows of the rooms, that are
+# solvable both as is (part 1) and with the extra rows of part 2 inserted.
+# About a fifth of random arrangements cannot be solved in part 2, and proving
+# that takes an exhaustive search, so the generator picks from arrangements
+# that have been checked offline.
+_amphipodBurrows = (
+    "BDACDACB", "BDCAABCD", "BCADACBD", "DBDCCABA", "DCBABACD", "CDABACBD",
+    "DACCBABD", "DADBCBCA", "DABCBCAD", "DBAABDCC", "AADCDBCB", "ADCBCBAD",
+    "BDDCAACB", "ABACDBCD", "DDBACCBA", "DCCABBAD", "CAACBBDD", "BCBDAACD",
+    "DBCABCDA", "BDCBADAC", "ABCDCDAB", "DAADBCBC", "ABDDCCBA", "CBCDBDAA",
+    "ADBABCCD", "DABDACCB", "BCDABCAD")
+
+@generator(2021, 23, 1)
+def amphipod(rng, scale):
+    """A random starting burrow that is solvable in both parts (`scale` is
+    ignored)"""
+    pods = rng.choice(_amphipodBurrows)
+    yield "#############"
+    yield "#...........#"
+    yield "###" + "#".join(pods[:4]) + "###"
+    yield "  #" + "#".join(pods[4:]) + "#"
+    yield "  #########"
+
+@generator(2021, 24, 1)
+def arithmeticLogicUnit(rng, scale):
+    """A MONAD program whose 14 digit-checking blocks are paired as pushes and
+    pops of base-26 digits of `z`, with offsets chosen so that valid model
+    numbers exist (`scale` is ignored)"""
+    while True:
+        pushes = [ True ] * 7 + [ False ] * 7
+        rng.shuffle(pushes)
+        depth = list(itertools.accumulate(1 if p else -1 for p in pushes))
+        if min(depth) >= 0: break
+
+    stack = [ ]
+    blocks = [ ]
+    for push in pushes:
+        if push:
+            yOffset = rng.randint(0, 16)
+            stack.append(yOffset)
+            blocks.append((1, rng.randint(10, 15), yOffset))
+        else:
+            difference = rng.randint(-8, 8)
+            blocks.append((26, difference - stack.pop(), rng.randint(0, 16)))
+
+    for divisor, xOffset, yOffset in blocks:
+        yield from ("inp w", "mul x 0", "add x z", "mod x 26", f"div z {divisor}",
+                    f"add x {xOffset}", "eql x w", "eql x 0", "mul y 0",
+                    "add y 25", "mul y x", "add y 1", "mul z y", "mul y 0",
+                    "add y w", f"add y {yOffset}", "mul y x", "add z y")
+
+@generator(2021, 25, 139)
+def seaCucumber(rng, scale):
+    """A `scale` x `scale` grid of sea cucumbers"""
+    return _digitGrid(rng, scale, scale, ">>>vvv....")
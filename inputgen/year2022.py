@@ -0,0 +1,257 @@
+# Input generators for the 2022 puzzles
+
+import string
+
+from . import generator
+
+@generator(2022, 1, 250)
+def calorieCounting(rng, scale):
+    """The snacks carried by `scale` elves"""
+    for elf in range(scale):
+        if elf > 0: yield ""
+        for i in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 60000))
+
+@generator(2022, 2, 2500)
+def rockPaperScissors(rng, scale):
+    """`scale` rounds of the strategy guide"""
+    for i in range(scale):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+
+@generator(2022, 3, 100)
+def rucksackReorganization(rng, scale):
+    """`scale` groups of three rucksacks.  Each rucksack has exactly one item
+    type in both compartments, and each group has exactly one item type (its
+    badge) in all three rucksacks."""
+    items = string.ascii_letters
+    for group in range(scale):
+        badge = rng.choice(items)
+        others = [ i for i in items if i != badge ]
+        rng.shuffle(others)
+        for elf in range(3):
+            # Each elf draws from a disjoint pool of items, plus the badge
+            pool = others[17 * elf : 17 * elf + 17]
+            shared = pool[0]
+            split = rng.randint(4, 12)
+            first, second = pool[1 : split], pool[split : ]
+            size = rng.randint(4, 16)
+            halves = [ [ shared ] + rng.choices(first, k = size - 1),
+                       [ shared ] + rng.choices(second, k = size - 1) ]
+            halves[rng.randrange(2)][-1] = badge
+            for half in halves: rng.shuffle(half)
+            yield "".join(halves[0] + halves[1])
+
+@generator(2022, 4, 1000)
+def campCleanup(rng, scale):
+    """`scale` pairs of section assignments"""
+    for i in range(scale):
+        ranges = [ sorted((rng.randint(1, 99), rng.randint(1, 99))) for j in range(2) ]
+        yield ",".join(f"{lo}-{hi}" for lo, hi in ranges)
+
+@generator(2022, 5, 500)
+def supplyStacks(rng, scale):
+    """Nine stacks of crates and `scale` moves, none of which empties a
+    stack"""
+    stacks = [ rng.choices(string.ascii_uppercase, k = rng.randint(1, 8))
+               for i in range(9) ]
+    height = max(len(s) for s in stacks)
+    for level in range(height, 0, -1):
+        yield " ".join(f"[{s[level - 1]}]" if len(s) >= level else "   "
+                       for s in stacks)
+    yield " " + "   ".join(str(i + 1) for i in range(9)) + " "
+    yield ""
+
+    sizes = [ len(s) for s in stacks ]
+    for i in range(scale):
+        src = rng.choice([ j for j in range(9) if sizes[j] > 1 ])
+        dest = rng.choice([ j for j in range(9) if j != src ])
+        count = rng.randint(1, sizes[src] - 1)
+        sizes[src] -= count
+        sizes[dest] += count
+        yield f"move {count} from {src + 1} to {dest + 1}"
+
+@generator(2022, 6, 4096)
+def tuningTrouble(rng, scale):
+    """A datastream of `scale` characters whose start-of-packet and
+    start-of-message markers both appear at the very end"""
+    body = rng.choices("abc", k = max(0, scale - 14))
+    yield "".join(body) + "".join(rng.sample("defghijklmnopqrstuvwxyz", 14))
+
+@generator(2022, 7, 250)
+def noSpaceLeftOnDevice(rng, scale):
+    """A terminal session exploring a tree of `scale` files, using between
+    41,000,000 and 69,000,000 of the 70,000,000 bytes of disk space"""
+    # Build the tree as nested (files, subdirectories) dictionaries
+    root = ({ }, { })
+    dirs = [ root ]
+    for i in range(scale):
+        parent = rng.choice(dirs)
+        if rng.random() < 0.25:
+            child = ({ }, { })
+            parent[1][f"{rng.choice(string.ascii_lowercase)}{len(dirs)}"] = child
+            dirs.append(child)
+        name = "".join(rng.choices(string.ascii_lowercase, k = rng.randint(1, 8)))
+        if rng.random() < 0.5: name += "." + "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k = 3))
+        parent[0][name] = rng.randint(1000, 2 * 55000000 // max(1, scale))
+
+    total = sum(sum(files.values()) for files, subdirs in dirs)
+    if not 41000000 <= total <= 69000000:
+        for files, subdirs in dirs:
+            for name in files:
+                files[name] = max(1, files[name] * 55000000 // total)
+
+    def explore(node):
+        files, subdirs = node
+        yield "$ ls"
+        entries = [ f"dir {d}" for d in subdirs ] + [ f"{s} {f}" for f, s in files.items() ]
+        rng.shuffle(entries)
+        yield from entries
+        for name, subdir in subdirs.items():
+            yield f"$ cd {name}"
+            yield from explore(subdir)
+            yield "$ cd .."
+
+    yield "$ cd /"
+    yield from explore(root)
+
+@generator(2022, 8, 99)
+def treetopTreeHouse(rng, scale):
+    """A `scale` x `scale` map of tree heights"""
+    for r in range(scale):
+        yield "".join(rng.choices("0123456789", k = scale))
+
+@generator(2022, 9, 2000)
+def ropeBridge(rng, scale):
+    """`scale` head motions"""
+    for i in range(scale):
+        yield f"{rng.choice('RULD')} {rng.randint(1, 19)}"
+
+@generator(2022, 10, 140)
+def cathodeRayTube(rng, scale):
+    """A program of `scale` instructions"""
+    x = 1
+    for i in range(scale):
+        if rng.random() < 0.25:
+            yield "noop"
+        else:
+            delta = rng.randint(-5, 5) or 1
+            if not -10 <= x + delta <= 50: delta = -delta
+            x += delta
+            yield f"addx {delta}"
+
+@generator(2022, 11, 8)
+def monkeyInTheMiddle(rng, scale):
+    """`scale` monkeys, each testing divisibility by a distinct prime"""
+    primes = [ p for p in range(2, 1000)
+               if all(p % d for d in range(2, int(p ** 0.5) + 1)) ]
+    divisors = rng.sample(primes[:max(scale, 8)], scale)
+    squarer = rng.randrange(scale)
+    for m in range(scale):
+        if m > 0: yield ""
+        items = [ rng.randint(50, 99) for i in range(rng.randint(1, 8)) ]
+        if m == squarer:
+            operation = "old * old"
+        elif rng.random() < 0.3:
+            operation = f"old * {rng.randint(2, 19)}"
+        else:
+            operation = f"old + {rng.randint(1, 8)}"
+        ifTrue, ifFalse = rng.sample([ t for t in range(scale) if t != m ], 2)
+        yield f"Monkey {m}:"
+        yield f"  Starting items: {', '.join(map(str, items))}"
+        yield f"  Operation: new = {operation}"
+        yield f"  Test: divisible by {divisors[m]}"
+        yield f"    If true: throw to monkey {ifTrue}"
+        yield f"    If false: throw to monkey {ifFalse}"
+
+@generator(2022, 12, 41)
+def hillClimbing(rng, scale):
+    """A height map of `scale` rows and four times as many columns, with a
+    climbable path that snakes from S to E along every other row"""
+    rows, cols = scale, 4 * scale
+    grid = [ rng.choices(string.ascii_lowercase, k = cols) for r in range(rows) ]
+    path = [ ]
+    for r in range(0, rows, 2):
+        columns = range(cols) if r % 4 == 0 else range(cols - 1, -1, -1)
+        path.extend((r, c) for c in columns)
+        if r + 1 < rows and r + 2 < rows:
+            path.append((r + 1, columns[-1]))
+    for i, (r, c) in enumerate(path):
+        grid[r][c] = string.ascii_lowercase[25 * i // (len(path) - 1)]
+    grid[path[0][0]][path[0][1]] = "S"
+    grid[path[-1][0]][path[-1][1]] = "E"
+    for row in grid:
+        yield "".join(row)
+
+def _packet(rng, depth = 0):
+    items = [ ]
+    for i in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(_packet(rng, depth + 1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return "[" + ",".join(items) + "]"
+
+@generator(2022, 13, 150)
+def distressSignal(rng, scale):
+    """`scale` pairs of packets"""
+    for i in range(scale):
+        if i > 0: yield ""
+        yield _packet(rng)
+        yield _packet(rng)
+
+@generator(2022, 14, 150)
+def regolithReservoir(rng, scale):
+    """`scale` rock paths below the sand source, reaching down to a depth of
+    about `scale`"""
+    depth = max(20, scale)
+    for i in range(scale):
+        x, y = rng.randint(500 - depth, 500 + depth), rng.randint(13, depth)
+        points = [ (x, y) ]
+        for j in range(rng.randint(1, 5)):
+            if j % 2 == 0:
+                x = max(1, x + rng.choice((-1, 1)) * rng.randint(1, 10))
+            else:
+                y = min(depth, max(13, y + rng.choice((-1, 1)) * rng.randint(1, 10)))
+            if (x, y) != points[-1]: points.append((x, y))
+        yield " -> ".join(f"{x},{y}" for x, y in points)
+
+@generator(2022, 18, 2000)
+def boilingBoulders(rng, scale):
+    """`scale` distinct cubes filling about a quarter of a cubic region"""
+    side = max(2, round((4 * scale) ** (1 / 3)))
+    cubes = rng.sample(range(side ** 3), min(scale, side ** 3))
+    for n in cubes:
+        yield f"{n % side},{n // side % side},{n // side // side}"
+
+@generator(2022, 22, 50)
+def monkeyMap(rng, scale):
+    """A cube net laid out like the real input, with faces of `scale` x `scale`
+    tiles, and a path of `80 * scale` moves and turns"""
+    n = scale
+    def tiles(count):
+        return "".join(rng.choices("........#", k = count))
+    for r in range(n):
+        yield " " * n + tiles(2 * n)
+    for r in range(n):
+        yield " " * n + tiles(n)
+    for r in range(n):
+        yield tiles(2 * n)
+    for r in range(n):
+        yield tiles(n)
+    yield ""
+    moves = [ str(rng.randint(1, n)) for i in range(40 * n) ]
+    yield "".join(m + rng.choice("LR") for m in moves[:-1]) + moves[-1]
+
+@generator(2022, 24, 100)
+def blizzardBasin(rng, scale):
+    """A valley `scale` tiles wide and about a third as high.  No vertical
+    blizzards are in the entrance or exit columns."""
+    width, height = scale, max(2, round(0.35 * scale))
+    yield "#." + "#" * width
+    for r in range(height):
+        row = [ ]
+        for c in range(width):
+            choices = "<>.." if c == 0 or c == width - 1 else "<>^v.."
+            row.append(rng.choice(choices))
+        yield "#" + "".join(row) + "#"
+    yield "#" * width + ".#"
@@ -0,0 +1,188 @@
+#! /usr/bin/python3
+
+# Usage: runbatch.py [-j JOBS] [--record] [--answers FILE] script glob...
+#
+# Run one puzzle script on many input files (e.g., the sample, the real input,
+# and a set of generated inputs) without starting Python for every input.  The
+# script is imported once and its `parse` and `partN` functions are called for
+# each input file matching the globs, which are taken relative to the current
+# directory or, if nothing matches there, to the script's year directory.  The
+# hard-coded input names of the 2021 scripts are therefore no obstacle.  With
+# `-j JOBS`, the inputs are shared among a pool of worker processes, each of
+# which imports the script once.
+#
+# The answers are checked against those recorded in *expected_answers.json*
+# for the puzzle part (so that every variant of the part is held to the same
+# answers), keyed by the SHA-256 of the input's contents, so that a generated
+# input that is regenerated with the same scale and seed keeps its answer.
+# The run stops at the first input, in file-name order, whose answer differs
+# from the recorded one.  With `--record`, the answers of inputs that have no
+# recorded answer are recorded.
+#
+# Unlike *runpuzzles.py*, no timeout or memory limit is enforced.
+
+import os
+import sys
+import glob
+import json
+import hashlib
+import argparse
+import concurrent.futures
+
+import runpuzzles
+
+defaultAnswers = os.path.join(runpuzzles.repoDir, "expected_answers.json")
+
+class BatchResult:
+    """The result of solving one input in a batch"""
+
+    def __init__(self, path, digest, result, expected):
+        self.path     = path      # Input file
+        self.digest   = digest    # SHA-256 of the input's contents
+        self.result   = result    # `RunResult`
+        self.expected = expected  # Recorded answer, or `None`
+
+    def check(self):
+        """Return "ok" or "WRONG" according to whether the answer matches the
+        recorded answer, "new" if there is none, or the status of a failed
+        run"""
+        if self.result.status != "ok": return self.result.status
+        if self.expected is None:      return "new"
+        return "ok" if self.result.answer == self.expected else "WRONG"
+
+def partKey(script):
+    """Return the name of the puzzle part implemented by `script`, e.g.,
+    "2021/puzzle15.2" for *2021/puzzle15.2b.py*"""
+    m = runpuzzles.puzzlePattern.fullmatch(os.path.basename(script))
+    return f"{os.path.dirname(script)}/puzzle{m[1]}.{m[2]}"
+
+def findInputs(script, patterns):
+    """Return the sorted list of input files matching any of the glob
+    `patterns`, each taken relative to the current directory or, failing
+    that, to the year directory of `script`"""
+    yearDir = os.path.join(runpuzzles.repoDir, os.path.dirname(script))
+    paths = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern) or glob.glob(os.path.join(yearDir, pattern))
+        paths.update(os.path.abspath(path) for path in matches if os.path.isfile(path))
+    return sorted(paths)
+
+def fileDigest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def loadAnswers(filename):
+    if not os.path.exists(filename): return { }
+    with open(filename, "r") as f:
+        return json.load(f)
+
+def saveAnswers(answers, filename):
+    with open(filename, "w") as f:
+        json.dump(answers, f, indent = 2, sort_keys = True)
+        f.write("\n")
+
+# Module imported by a worker process, set by `initWorker`
+workerModule = None
+
+def initWorker(script):
+    global workerModule
+    workerModule = runpuzzles.loadPuzzle(script)
+
+def solveInWorker(script, path):
+    return runpuzzles.solveFile(workerModule, script, path)
+
+def runBatch(script, paths, expected, jobs = 1):
+    """Solve `script` for each of the input files `paths`, in order, and
+    return a list of `BatchResult`s, stopping after the first answer that
+    differs from its entry in `expected` (a dictionary mapping the SHA-256 of
+    an input to its answer).  If `jobs` is more than 1, the inputs are solved
+    by a pool of that many worker processes."""
+    digests = [ fileDigest(path) for path in paths ]
+    results = [ ]
+    def collect(path, digest, result):
+        results.append(BatchResult(path, digest, result,
+                                   expected.get(digest, { }).get("answer")))
+        return results[-1].check() != "WRONG"
+
+    if jobs <= 1:
+        module = runpuzzles.loadPuzzle(script)
+        for path, digest in zip(paths, digests):
+            if not collect(path, digest, runpuzzles.solveFile(module, script, path)):
+                break
+        return results
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers = jobs,
+                                                initializer = initWorker,
+                                                initargs = (script,)) as pool:
+        futures = [ pool.submit(solveInWorker, script, path) for path in paths ]
+        for path, digest, future in zip(paths, digests, futures):
+            try:
+                result = future.result()
+            except concurrent.futures.process.BrokenProcessPool as e:
+                result = runpuzzles.RunResult(script, "error", 0.0, 0.0,
+                                              f"worker process died: {e}")
+            if not collect(path, digest, result):
+                pool.shutdown(cancel_futures = True)
+                break
+    return results
+
+def printBatchTable(results, file = sys.stdout):
+    """Print a table with one row per `BatchResult` in `results`, followed by
+    the totals."""
+    names = [ os.path.relpath(r.path) for r in results ]
+    width = max([ len(name) for name in names ] + [ len("Input") ])
+    print(f"{'Input':<{width}}  {'Check':<7} {'Wall(s)':>9} {'CPU(s)':>9}  Answer",
+          file = file)
+    for name, r in zip(names, results):
+        answer = r.result.answer
+        if r.check() == "WRONG":
+            answer += f" (expected {r.expected})"
+        print(f"{name:<{width}}  {r.check():<7} {r.result.wallTime:9.3f} "
+              f"{r.result.cpuTime:9.3f}  {answer}", file = file)
+    totalWall = sum(r.result.wallTime for r in results)
+    totalCpu  = sum(r.result.cpuTime  for r in results)
+    print(f"{'Total':<{width}}  {'':<7} {totalWall:9.3f} {totalCpu:9.3f}", file = file)
+
+def main(argv):
+    parser = argparse.ArgumentParser(description = "Run one puzzle script on many inputs")
+    parser.add_argument("script", help = "the puzzle script, e.g., 2021/puzzle15.2.py")
+    parser.add_argument("inputs", nargs = "+", metavar = "glob",
+                        help = "glob patterns selecting the input files")
+    parser.add_argument("-j", "--jobs", type = int, default = 1,
+                        help = "number of worker processes (default: 1, in this process)")
+    parser.add_argument("--answers", default = defaultAnswers,
+                        help = f"file of expected answers (default: {defaultAnswers})")
+    parser.add_argument("--record", action = "store_true",
+                        help = "record the answers of inputs that have no expected answer")
+    options = parser.parse_args(argv[1:])
+
+    scripts = runpuzzles.discoverPuzzles([ options.script ])
+    if len(scripts) != 1:
+        parser.error(f"{options.script!r} must select exactly one puzzle script, "
+                     f"not {len(scripts)}")
+    script = scripts[0]
+    paths = findInputs(script, options.inputs)
+    if not paths:
+        print("No input files found", file = sys.stderr)
+        return 1
+
+    answers  = loadAnswers(options.answers)
+    expected = answers.setdefault(partKey(script), { })
+    results  = runBatch(script, paths, expected, options.jobs)
+    printBatchTable(results)
+
+    if results[-1].check() == "WRONG":
+        print(f"\nStopped at the first wrong answer, for {os.path.relpath(results[-1].path)}",
+              file = sys.stderr)
+    if options.record:
+        new = [ r for r in results if r.check() == "new" ]
+        for r in new:
+            expected[r.digest] = { "input" : os.path.relpath(r.path, runpuzzles.repoDir),
+                                   "answer" : r.result.answer }
+        if new:
+            saveAnswers(answers, options.answers)
+            print(f"\nRecorded {len(new)} answers in {options.answers}", file = sys.stderr)
+    return 0 if all(r.check() in ("ok", "new") for r in results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,557 @@
+#! /usr/bin/python3
+
+# Usage: runpuzzles.py [-j JOBS] [--input SUFFIX] [--force] [--timeout SECONDS]
+#                      [--memory-limit MIB] [pattern...]
+#
+# Run every puzzle script (*puzzleXX.Y.py*, including lettered and other
+# variants such as *puzzle11.2a.py* or *puzzle24.2d.py*) in the year
+# directories of this repository, spreading the runs across a pool of worker
+# processes, and print a table of the wall time, CPU time, and answer for each.
+# If patterns are given (e.g., "2022/puzzle11*" or "puzzle24.*"), only the
+# scripts whose path relative to the repository (or whose bare name) matches
+# one of the patterns are run.
+#
+# Each script is run with its year directory as the current directory so that
+# both input conventions work: the 2021 scripts open a hard-coded
+# "puzzleN_input.txt" relative to the current directory, and the 2022 scripts
+# derive the input name from `sys.argv[0]` via `openInput`.  The `--input`
+# suffix is passed as `argv[1]` to the scripts that read their arguments.  For
+# a script with a hard-coded input name, the script is instead run in a
+# scratch directory in which the hard-coded name is a symbolic link to the
+# selected input file (e.g., "sample" selects "puzzleN_input.test.txt").  The
+# answer reported for a script is the last line it printed.  The peak resident
+# set size (RSS) of each script is reported, too.
+#
+# Each script is killed if it runs for longer than the timeout (default 600
+# seconds), and its address space is limited (default 4096 MiB) with
+# `setrlimit`, so that a runaway variant cannot stall or swamp a full run.
+# Such scripts are reported with a status of "timeout" or "oom" rather than
+# "error".  A script is out of memory if its stderr reports a failed
+# allocation (from Python, numpy, OpenBLAS, or C++) or if, under a memory
+# limit, it is killed by SIGKILL or SIGSEGV, as happens when an allocation
+# fails where it cannot be reported.  A value of 0 for either limit removes it.
+#
+# The answers of successful runs are cached in the *.answercache* directory,
+# keyed on the content hash of the script (and the sibling modules it imports),
+# the content hash of its input files, and the Python and numpy versions.  A
+# script whose key is found in the cache is not run; the answer and times
+# recorded for it are reported instead, with a status of "cached".  The
+# `--force` switch runs every script regardless, refreshing the cache.  The
+# cache holds at most `AOC_ANSWER_CACHE_MAX` (default 500) entries, evicting
+# the least-recently-used ones.
+#
+# Every script also exposes `parse(infile)` and `partN(data)` functions behind
+# an `if __name__ == "__main__"` guard, so `loadPuzzle` and `solveInProcess`
+# can import a script once and solve it repeatedly without spawning a process.
+
+import io
+import os
+import re
+import sys
+import json
+import time
+import fnmatch
+import hashlib
+import argparse
+import contextlib
+import resource
+import signal
+import tempfile
+import threading
+import subprocess
+import importlib.util
+import concurrent.futures
+
+repoDir = os.path.dirname(os.path.abspath(__file__))
+yearDirs = ("2021", "2022")
+
+puzzlePattern = re.compile(r'puzzle(\d+)\.(\d+)([^/\\]*)\.py')
+sourcePattern = re.compile(r'puzzle(\d+)\.(\d+)([^/\\]*)\.(py|cpp)')  # Python or C++
+hardCodedInputPattern = re.compile(r'(?:open|ifstream\s+\w+)\("(puzzle\d+_input[^"]*\.txt)"')
+importPattern = re.compile(r'^\s*(?:import|from)\s+(\w+)', re.MULTILINE)
+# Line printed to stderr by `search_stats.SearchStats.report`
+searchStatsPattern = re.compile(r'^Search stats: (.*)$', re.MULTILINE)
+
+defaultTimeout     = 600   # Seconds
+defaultMemoryLimit = 4096  # MiB of address space
+
+# Messages in the stderr of a script that ran out of memory, and the signals
+# that kill a script that runs out of address space
+outOfMemoryPattern = re.compile(r'MemoryError|Unable to allocate|Cannot allocate memory|'
+                                r'[Aa]llocation.*failed|ENOMEM|bad_alloc')
+outOfMemorySignals = (signal.SIGKILL, signal.SIGSEGV)
+
+answerCacheDir        = os.path.join(repoDir, ".answercache")
+answerCacheMaxEntries = int(os.environ.get("AOC_ANSWER_CACHE_MAX", 500))
+
+# Extensions of the compressed inputs that `openInput` reads if the
+# uncompressed input does not exist
+compressedExtensions = (".gz", ".xz", ".zst")
+
+class RunResult:
+    """The outcome of running one puzzle script"""
+
+    def __init__(self, script, status, wallTime, cpuTime, answer, output = "",
+                 cached = False):
+        self.script   = script    # Path relative to `repoDir`
+        self.status   = status    # "ok", "error", "timeout", or "oom"
+        self.wallTime = wallTime  # Seconds
+        self.cpuTime  = cpuTime   # User + system seconds used by the script
+        self.answer   = answer    # Last line printed by the script
+        self.output   = output    # Complete stdout (and stderr, on error)
+        self.cached   = cached    # True if taken from the answer cache
+        self.peakRss  = None      # Peak resident set size, in bytes
+        self.tracemallocPeak = None  # Peak memory traced by tracemalloc, in bytes
+        self.allocationSites = None  # [ site, bytes, count ] of the top sites
+        self.searchStats     = None  # Search counters reported by the script
+
+def puzzleKey(script):
+    """Return a sort key that orders puzzle scripts by year, then puzzle
+    number, then part, then variant, so that "puzzle9" sorts before
+    "puzzle10"."""
+    year = os.path.dirname(script)
+    m = puzzlePattern.fullmatch(os.path.basename(script))
+    return (year, int(m[1]), int(m[2]), m[3])
+
+def discoverPuzzles(patterns = ()):
+    """Return a sorted list of the puzzle scripts in the year directories,
+    relative to `repoDir`, restricted to those matching any of the glob
+    `patterns`, if any are given."""
+    scripts = [ ]
+    for year in yearDirs:
+        for name in os.listdir(os.path.join(repoDir, year)):
+            if not puzzlePattern.fullmatch(name): continue
+            script = year + "/" + name
+            if patterns and not any(fnmatch.fnmatch(script, p) or
+                                    fnmatch.fnmatch(name, p)
+                                    for p in patterns):
+                continue
+            scripts.append(script)
+    return sorted(scripts, key = puzzleKey)
+
+def lastLine(output):
+    """Return the last non-blank line of `output`.  Progress displays that
+    overwrite a line using carriage returns are reduced to the text after the
+    last carriage return."""
+    for line in reversed(output.splitlines()):
+        line = line.split('\r')[-1].strip()
+        if line: return line
+    return ""
+
+def inputFile(script, suffix):
+    """Return the path, relative to `repoDir`, of the input file that the
+    input `suffix` selects for `script` (a Python or C++ source file).  For the 2022 naming convention, this
+    is "puzzleXX_suffix.txt".  For the 2021 convention, "input" selects
+    "puzzleN_input.txt", "sample" selects "puzzleN_input.test.txt", and any
+    other suffix selects "puzzleN_input.suffix.txt"."""
+    year = os.path.dirname(script)
+    number = sourcePattern.fullmatch(os.path.basename(script))[1]
+    if not hardCodedInputs(script):
+        return f"{year}/puzzle{number}_{suffix}.txt"
+    elif suffix == "input":
+        return f"{year}/puzzle{number}_input.txt"
+    elif suffix == "sample":
+        return f"{year}/puzzle{number}_input.test.txt"
+    else:
+        return f"{year}/puzzle{number}_input.{suffix}.txt"
+
+def hardCodedInputs(script):
+    """Return the set of input file names that are hard-coded in the source
+    of `script` (relative to `repoDir`), whether opened with Python's `open`
+    or C++'s `std::ifstream`"""
+    with open(os.path.join(repoDir, script), "r") as f:
+        return set(hardCodedInputPattern.findall(f.read()))
+
+def runPuzzle(script, suffix = None, tracemallocTop = 0,
+              timeout = defaultTimeout, memoryLimit = defaultMemoryLimit):
+    """Run `script` (relative to `repoDir`) on the input selected by `suffix`
+    (by default, its usual input) and return a `RunResult`.  If
+    `tracemallocTop` is nonzero, the script is run under `tracemalloc`, and
+    the peak traced memory and the top `tracemallocTop` allocation sites are
+    recorded in the result.  The script is killed after `timeout` seconds and
+    its address space is limited to `memoryLimit` MiB; 0 means no limit."""
+    limits = (timeout, memoryLimit)
+    hardCoded = hardCodedInputs(script) if suffix else None
+    if hardCoded:
+        with tempfile.TemporaryDirectory(prefix = "runpuzzles") as scratch:
+            target = os.path.join(repoDir, inputFile(script, suffix))
+            for name in hardCoded:
+                os.symlink(target, os.path.join(scratch, name))
+            argv = _monitorArgv(os.path.join(repoDir, script), tracemallocTop)
+            return runCommand(script, argv, scratch, *limits)
+    else:
+        cwd  = os.path.join(repoDir, os.path.dirname(script))
+        args = (suffix,) if suffix else ()
+        argv = _monitorArgv(os.path.basename(script), tracemallocTop) + list(args)
+        return runCommand(script, argv, cwd, *limits)
+
+# Program run by `python3 -c` to run a script and measure its memory use.  The
+# arguments are the script, the number of allocation sites to report (0 to
+# run without `tracemalloc`), and the script's own arguments.  When the script
+# exits, its peak resident set size and, if traced, its peak traced memory and
+# the top allocation sites of the memory still allocated (excluding the import
+# machinery) are written to stderr as JSON, following `memoryMarker`.  The peak RSS is read from
+# */proc/self/status*, because the `ru_maxrss` of a child process includes the
+# memory of the parent that forked it.
+memoryMarker  = "runpuzzles-memory: "
+monitorProgram = """
+import os, sys, json, atexit, runpy
+script, top = sys.argv[1], int(sys.argv[2])
+sys.argv = [ script ] + sys.argv[3:]
+sys.path[0] = os.path.dirname(os.path.abspath(script))
+def report():
+    memory = { "peakRss" : None }
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    memory["peakRss"] = int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if top:
+        current, memory["tracemallocPeak"] = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, "<frozen *>"),
+            tracemalloc.Filter(False, tracemalloc.__file__)))
+        stats = snapshot.statistics("lineno")[:top]
+        memory["sites"] = [ [ str(s.traceback[0]), s.size, s.count ] for s in stats ]
+    sys.stdout.flush()
+    print(MARKER + json.dumps(memory), file = sys.stderr)
+atexit.register(report)
+if top:
+    import tracemalloc
+    tracemalloc.start()
+runpy.run_path(script, run_name = "__main__")
+""".replace("MARKER", repr(memoryMarker))
+
+def _monitorArgv(script, tracemallocTop = 0):
+    """Return the command line that runs the Python `script` under
+    `monitorProgram`"""
+    return [ sys.executable, "-c", monitorProgram, script, str(tracemallocTop) ]
+
+def _limitMemory(memoryLimit):
+    """Return a function that limits the address space of the calling process
+    to `memoryLimit` MiB, for use as the `preexec_fn` of a child process, or
+    `None` if `memoryLimit` is 0"""
+    if not memoryLimit: return None
+    def limit():
+        size = memoryLimit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (size, size))
+    return limit
+
+def outOfMemory(returncode, errors, memoryLimit):
+    """Return `True` if a process that failed with `returncode`, writing
+    `errors` to stderr, ran out of memory: if `errors` reports a failed
+    allocation or, when `memoryLimit` (MiB) is set, if it was killed by one of
+    the `outOfMemorySignals`"""
+    if outOfMemoryPattern.search(errors): return True
+    return bool(memoryLimit) and returncode < 0 and -returncode in outOfMemorySignals
+
+def runCommand(script, argv, cwd, timeout = defaultTimeout, memoryLimit = defaultMemoryLimit):
+    """Run the command line `argv` for `script` in directory `cwd` and return
+    a `RunResult`.  The process is killed after `timeout` seconds, and its
+    address space is limited to `memoryLimit` MiB.  The process is reaped with
+    `os.wait4`, so that the CPU time is its own, even when other scripts are
+    run concurrently."""
+    timedOut = threading.Event()
+    with tempfile.TemporaryFile("w+") as stdout, tempfile.TemporaryFile("w+") as stderr:
+        start = time.perf_counter()
+        proc  = subprocess.Popen(argv, cwd = cwd, stdin = subprocess.DEVNULL,
+                                 stdout = stdout, stderr = stderr,
+                                 preexec_fn = _limitMemory(memoryLimit))
+        def kill():
+            timedOut.set()
+            proc.kill()
+        timer = threading.Timer(timeout, kill) if timeout else None
+        if timer: timer.start()
+        pid, status, usage = os.wait4(proc.pid, 0)
+        if timer: timer.cancel()
+        wallTime = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        stdout.seek(0)
+        stderr.seek(0)
+        output, errors = stdout.read(), stderr.read()
+    cpuTime = usage.ru_utime + usage.ru_stime
+
+    memory = { }
+    errorLines = errors.splitlines(keepends = True)
+    for line in errorLines:
+        if line.startswith(memoryMarker):
+            memory = json.loads(line[len(memoryMarker):])
+            errorLines.remove(line)
+            errors = "".join(errorLines)
+            break
+
+    if proc.returncode == 0:
+        result = RunResult(script, "ok", wallTime, cpuTime, lastLine(output), output)
+    elif timedOut.is_set():
+        result = RunResult(script, "timeout", wallTime, cpuTime,
+                           f"killed after {timeout}s", output + errors)
+    else:
+        status  = "oom" if outOfMemory(proc.returncode, errors, memoryLimit) else "error"
+        message = lastLine(errors)
+        if not message and proc.returncode < 0:
+            message = f"killed by {signal.Signals(-proc.returncode).name}"
+            if status == "oom": message += f" under a {memoryLimit} MiB memory limit"
+        message = message or f"exit {proc.returncode}"
+        result = RunResult(script, status, wallTime, cpuTime, message, output + errors)
+    result.peakRss         = memory.get("peakRss")
+    result.tracemallocPeak = memory.get("tracemallocPeak")
+    result.allocationSites = memory.get("sites")
+    result.searchStats     = parseSearchStats(errors)
+    return result
+
+def parseSearchStats(errors):
+    """Return a dictionary of the counters in the last "Search stats:" line
+    in `errors`, or `None` if there is no such line"""
+    lines = searchStatsPattern.findall(errors)
+    if not lines: return None
+    return { name : int(value) for name, value in
+             (pair.split("=") for pair in lines[-1].split()) }
+
+def loadPuzzle(script):
+    """Import `script` (relative to `repoDir`) as a module, without running
+    its main program, and return the module.  The script's year directory is
+    moved to the front of `sys.path` so that it can import its sibling
+    modules, and any sibling modules previously imported from another year
+    directory (e.g., "loadGrid") are forgotten so that they are reimported
+    from this one."""
+    directory = os.path.join(repoDir, os.path.dirname(script))
+    otherDirs = { os.path.join(repoDir, y) for y in yearDirs } - { directory }
+    for name, module in list(sys.modules.items()):
+        if os.path.dirname(getattr(module, "__file__", None) or "") in otherDirs:
+            del sys.modules[name]
+    if directory in sys.path: sys.path.remove(directory)
+    sys.path.insert(0, directory)
+    name = os.path.splitext(script)[0].replace("/", "_").replace(".", "_")
+    spec = importlib.util.spec_from_file_location(name, os.path.join(repoDir, script))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# The *openInput.py* module, imported by `openText` when first needed
+openInputModule = None
+
+def openText(path):
+    """Open the input file `path` as the puzzle scripts' `openInput` does,
+    decompressing it if it has one of the `compressedExtensions`.  The
+    module is imported from its file, under a name of its own, so that
+    `loadPuzzle` neither forgets it nor lets a script see it."""
+    global openInputModule
+    if openInputModule is None:
+        spec = importlib.util.spec_from_file_location(
+            "runpuzzles_openInput", os.path.join(repoDir, "2022", "openInput.py"))
+        openInputModule = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(openInputModule)
+    return openInputModule.openText(path)
+
+def solveInProcess(module, script, suffix = "input"):
+    """Solve the part of the puzzle implemented by `script` on the input
+    selected by `suffix`, by calling the `parse` and `partN` functions of
+    `module`, the imported script, and return a `RunResult` whose answer is
+    the value returned by `partN`.  Anything printed is captured as the
+    output."""
+    return solveFile(module, script, os.path.join(repoDir, inputFiles(script, suffix)[0]))
+
+def solveFile(module, script, path):
+    """Like `solveInProcess`, but solve the puzzle for the input file `path`,
+    which is decompressed if it has one of the `compressedExtensions`"""
+    part = puzzlePattern.fullmatch(os.path.basename(script))[2]
+    output = io.StringIO()
+    start    = time.perf_counter()
+    cpuStart = time.process_time()
+    try:
+        with contextlib.redirect_stdout(output):
+            with openText(path) as infile:
+                data = module.parse(infile)
+            answer = str(getattr(module, f"part{part}")(data))
+        status = "ok"
+    except Exception as e:
+        status, answer = "error", f"{type(e).__name__}: {e}"
+    wallTime = time.perf_counter() - start
+    cpuTime  = time.process_time() - cpuStart
+    return RunResult(script, status, wallTime, cpuTime, answer, output.getvalue())
+
+def runAll(scripts, suffix = None, jobs = None, useCache = False, force = False,
+           tracemallocTop = 0, timeout = defaultTimeout,
+           memoryLimit = defaultMemoryLimit):
+    """Run each of `scripts` on the input selected by `suffix` using a pool of
+    `jobs` worker processes (by default, one per CPU) and return a list of
+    `RunResult`s in the same order as `scripts`.  If `useCache` is true, a
+    script whose result is in the answer cache is not run unless `force` is
+    true, and successful results are added to the cache.  `tracemallocTop`,
+    `timeout`, and `memoryLimit` are passed to `runPuzzle`.  If a worker
+    process dies, the scripts it was running are reported as errors and the
+    results already collected are kept."""
+    jobs = jobs or os.cpu_count() or 1
+    showProgress = sys.stderr.isatty()
+    results = { }
+    keys = { }
+    if useCache:
+        for s in scripts:
+            keys[s] = answerCacheKey(s, suffix)
+            cached = keys[s] and not force and readCachedResult(s, keys[s])
+            if cached: results[s] = cached
+    with concurrent.futures.ProcessPoolExecutor(max_workers = jobs) as pool:
+        futures = { pool.submit(runPuzzle, s, suffix, tracemallocTop,
+                                timeout, memoryLimit) : s
+                    for s in scripts if s not in results }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                result = future.result()
+            except concurrent.futures.process.BrokenProcessPool as e:
+                result = RunResult(futures[future], "error", 0.0, 0.0,
+                                   f"worker process died: {e}")
+            results[result.script] = result
+            if keys.get(result.script) and result.status == "ok":
+                writeCachedResult(result, keys[result.script])
+            if showProgress:
+                print(f"\r{len(results)}/{len(scripts)} done", end = '',
+                      file = sys.stderr, flush = True)
+    if showProgress: print("", file = sys.stderr)
+    return [ results[s] for s in scripts ]
+
+def sourceFiles(script):
+    """Return the sorted list of the paths, relative to `repoDir`, of `script`
+    and of the modules in its year directory that it imports, directly or
+    indirectly"""
+    year = os.path.dirname(script)
+    files, pending = { script }, [ script ]
+    while pending:
+        with open(os.path.join(repoDir, pending.pop()), "r") as f:
+            source = f.read()
+        for name in importPattern.findall(source):
+            module = f"{year}/{name}.py"
+            if module not in files and os.path.exists(os.path.join(repoDir, module)):
+                files.add(module)
+                pending.append(module)
+    return sorted(files)
+
+def inputFiles(script, suffix = None):
+    """Return the paths, relative to `repoDir`, of the input files read by
+    `script` when run on the input selected by `suffix` (by default, its usual
+    input).  A missing input is replaced by its compressed sibling, if any."""
+    year = os.path.dirname(script)
+    hardCoded = hardCodedInputs(script)
+    if hardCoded and not suffix:
+        names = [ f"{year}/{name}" for name in sorted(hardCoded) ]
+    else:
+        names = [ inputFile(script, suffix or "input") ]
+    files = [ ]
+    for name in names:
+        for candidate in (name,) + tuple(name + ext for ext in compressedExtensions):
+            if os.path.exists(os.path.join(repoDir, candidate)):
+                name = candidate
+                break
+        files.append(name)
+    return files
+
+def _environmentKey():
+    """Return a string identifying the versions of Python and numpy"""
+    import importlib.metadata
+    try:
+        numpyVersion = importlib.metadata.version("numpy")
+    except importlib.metadata.PackageNotFoundError:
+        numpyVersion = "none"
+    return f"python {sys.version}; numpy {numpyVersion}"
+
+def answerCacheKey(script, suffix = None):
+    """Return the key under which the result of running `script` on the input
+    selected by `suffix` is cached, or `None` if one of its input files does
+    not exist"""
+    digest = hashlib.sha256(_environmentKey().encode())
+    for kind, files in (("source", sourceFiles(script)),
+                        ("input", inputFiles(script, suffix))):
+        for name in files:
+            path = os.path.join(repoDir, name)
+            if not os.path.exists(path): return None
+            with open(path, "rb") as f:
+                contents = hashlib.sha256(f.read()).hexdigest()
+            digest.update(f"{kind} {name} {contents}\n".encode())
+    return digest.hexdigest()[:32]
+
+def readCachedResult(script, key):
+    """Return the `RunResult` cached for `script` under `key`, or `None` if
+    there is none"""
+    cacheFile = os.path.join(answerCacheDir, key + ".json")
+    try:
+        with open(cacheFile, "r") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    os.utime(cacheFile)  # Mark as recently used
+    result = RunResult(script, entry["status"], entry["wallTime"], entry["cpuTime"],
+                       entry["answer"], entry["output"], cached = True)
+    result.peakRss = entry.get("peakRss")
+    return result
+
+def writeCachedResult(result, key):
+    """Cache the successful `result` under `key`, then evict the
+    least-recently-used entries beyond `answerCacheMaxEntries`"""
+    os.makedirs(answerCacheDir, exist_ok = True)
+    entry = { "script"   : result.script,
+              "status"   : result.status,
+              "wallTime" : result.wallTime,
+              "cpuTime"  : result.cpuTime,
+              "peakRss"  : result.peakRss,
+              "answer"   : result.answer,
+              "output"   : result.output }
+    cacheFile = os.path.join(answerCacheDir, key + ".json")
+    tmpFile = f"{cacheFile}.{os.getpid()}.tmp"
+    with open(tmpFile, "w") as f:
+        json.dump(entry, f)
+    os.replace(tmpFile, cacheFile)
+
+    entries = sorted((os.stat(os.path.join(answerCacheDir, name)).st_mtime, name)
+                     for name in os.listdir(answerCacheDir))
+    for mtime, name in entries[:max(0, len(entries) - answerCacheMaxEntries)]:
+        os.remove(os.path.join(answerCacheDir, name))
+
+def printTable(results, file = sys.stdout):
+    """Print a table with one row per `RunResult` in `results`, followed by
+    the totals."""
+    width = max([ len(r.script) for r in results ] + [ len("Puzzle") ])
+    print(f"{'Puzzle':<{width}}  {'Status':<7} {'Wall(s)':>9} {'CPU(s)':>9} {'RSS(MiB)':>9}  Answer",
+          file = file)
+    for r in results:
+        status = "cached" if r.cached else r.status
+        rss = "-" if r.peakRss is None else f"{r.peakRss / (1024 * 1024):.1f}"
+        print(f"{r.script:<{width}}  {status:<7} {r.wallTime:9.3f} {r.cpuTime:9.3f} {rss:>9}  {r.answer}",
+              file = file)
+    totalWall = sum(r.wallTime for r in results)
+    totalCpu  = sum(r.cpuTime  for r in results)
+    print(f"{'Total':<{width}}  {'':<7} {totalWall:9.3f} {totalCpu:9.3f}",
+          file = file)
+
+def main(argv):
+    parser = argparse.ArgumentParser(description = "Run all puzzle scripts")
+    parser.add_argument("patterns", nargs = "*",
+                        help = "glob patterns selecting the scripts to run")
+    parser.add_argument("-j", "--jobs", type = int, default = None,
+                        help = "number of worker processes (default: CPUs)")
+    parser.add_argument("--input", metavar = "SUFFIX", default = None,
+                        help = "input suffix, e.g., \"sample\" (default: \"input\")")
+    parser.add_argument("--force", action = "store_true",
+                        help = "run every script, even if its answer is cached")
+    parser.add_argument("--timeout", metavar = "SECONDS", type = float,
+                        default = defaultTimeout,
+                        help = f"kill a script after this many seconds; 0 for no limit "
+                               f"(default: {defaultTimeout})")
+    parser.add_argument("--memory-limit", metavar = "MIB", type = int,
+                        default = defaultMemoryLimit,
+                        help = f"limit the address space of each script; 0 for no limit "
+                               f"(default: {defaultMemoryLimit})")
+    options = parser.parse_args(argv[1:])
+
+    scripts = discoverPuzzles(options.patterns)
+    if not scripts:
+        print("No puzzle scripts found", file = sys.stderr)
+        return 1
+    results = runAll(scripts, options.input, options.jobs, useCache = True,
+                     force = options.force, timeout = options.timeout,
+                     memoryLimit = options.memory_limit)
+    printTable(results)
+    return 0 if all(r.status == "ok" for r in results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,36 @@
+# Tests of the reports printed by benchmark.py
+
+import io
+import os
+import sys
+import contextlib
+import unittest
+
+repoDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDir)
+
+import benchmark
+
+class PrintStatsTest(unittest.TestCase):
+
+    def printed(self, stats):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            benchmark.printStats(stats)
+        return output.getvalue()
+
+    def test_empty(self):
+        self.assertEqual(self.printed({ }), "No benchmark results\n")
+
+    def test_oneEntry(self):
+        stats = { "2021/puzzle15.2.py:sample" : { "median" : 0.5, "min" : 0.4,
+                                                  "max" : 0.6, "stdev" : 0.1,
+                                                  "status" : "ok", "answer" : "315" } }
+        lines = self.printed(stats).splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("Variant:input"))
+        self.assertTrue(lines[1].startswith("2021/puzzle15.2.py:sample"))
+        self.assertTrue(lines[1].endswith("  315"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# Tests of 2021/interval.py and of the two puzzle24.2d solvers that use it
+
+import io
+import os
+import sys
+import random
+import unittest
+
+repoDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDir)
+sys.path.insert(0, os.path.join(repoDir, "2021"))
+
+import interval
+import runpuzzles
+from inputgen import year2021
+
+class IntervalArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(24)
+
+    def randomInterval(self, low, high):
+        a, b = self.rng.randint(low, high), self.rng.randint(low, high)
+        return interval.Interval(min(a, b), max(a, b))
+
+    def test_matchesInterval(self):
+        """Each element of an `IntervalArray` operation is the `Interval`
+        operation on the corresponding elements, for array, `Interval`, and
+        int operands"""
+        Interval, IntervalArray = interval.Interval, interval.IntervalArray
+        ranges = { 'add' : (-50, 50), 'mul' : (-50, 50), 'eql' : (-5, 5),
+                   'div' : (1, 30), 'mod' : (1, 30) }
+        for opcode, (low, high) in ranges.items():
+            for trial in range(50):
+                a = [ self.randomInterval(-100, 100) for i in range(9) ]
+                b = [ self.randomInterval(low, high) for i in range(9) ]
+                if opcode == 'div':  # Divisors of either sign, but not 0
+                    b = [ x if self.rng.random() < 0.5 else Interval(-x.hi, -x.lo) for x in b ]
+                array = IntervalArray([ x.lo for x in a ], [ x.hi for x in a ])
+                operands = [ (IntervalArray([ y.lo for y in b ], [ y.hi for y in b ]), b),
+                             (b[0], [ b[0] ] * 9),
+                             (b[0].lo, [ Interval(b[0].lo) ] * 9) ]
+                for operand, expected in operands:
+                    result = getattr(array, opcode)(operand)
+                    self.assertEqual([ result[i] for i in range(9) ],
+                                     [ getattr(x, opcode)(y) for x, y in zip(a, expected) ],
+                                     f"{opcode} {operand!r}")
+
+    def test_contains(self):
+        IntervalArray = interval.IntervalArray
+        array = IntervalArray([ -3, 0, 1 ], [ -1, 2, 4 ])
+        self.assertEqual(array.contains(0).tolist(), [ False, True, False ])
+
+class Puzzle24SolversTest(unittest.TestCase):
+
+    def test_vectorizedMatchesCompiled(self):
+        """The vectorized solver (puzzle24.2d1) and the compiled one
+        (puzzle24.2d) find the same model number for generated programs"""
+        vectorized = runpuzzles.loadPuzzle("2021/puzzle24.2d1.py")
+        compiled   = runpuzzles.loadPuzzle("2021/puzzle24.2d.py")
+        for seed in range(1, 4):
+            text = "\n".join(year2021.arithmeticLogicUnit(random.Random(seed), 1)) + "\n"
+            program = compiled.parse(io.StringIO(text))
+            expected = compiled.solve(compiled.startRegisters(program[0]), *program)
+            self.assertIsNotNone(expected)
+            self.assertEqual(vectorized.solve([ vectorized.Interval(0) ] * 4,
+                                              vectorized.parse(io.StringIO(text))),
+                             expected)
+
+if __name__ == "__main__":
+    unittest.main()
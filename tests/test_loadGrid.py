@@ -0,0 +1,56 @@
+# Tests of loadGrid.loadGrid (2022/loadGrid.py, shared by 2021)
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+repoDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(repoDir, "2022"))
+
+import loadGrid
+
+digits = { str(d) : d for d in range(10) }
+
+def load(text):
+    return loadGrid.loadGrid(io.BytesIO(text.encode()), digits).tolist()
+
+class LoadGridTest(unittest.TestCase):
+
+    def test_lineTerminators(self):
+        """LF and CR-LF input, with or without a final line terminator and
+        with trailing empty lines, all load the same grid"""
+        grid = [ [ 1, 2, 3 ], [ 4, 5, 6 ] ]
+        for text in ("123\n456\n", "123\n456", "123\n456\n\n\n",
+                     "123\r\n456\r\n", "123\r\n456", "123\r\n456\r\n\r\n"):
+            self.assertEqual(load(text), grid, repr(text))
+
+    def test_singleRow(self):
+        self.assertEqual(load("12"), [ [ 1, 2 ] ])
+        self.assertEqual(load("12\r\n"), [ [ 1, 2 ] ])
+
+    def test_empty(self):
+        self.assertEqual(loadGrid.loadGrid(io.BytesIO(b"\n\n"), digits).shape, (0, 0))
+
+    def test_fileName(self):
+        with tempfile.TemporaryDirectory(prefix = "loadGrid") as scratch:
+            path = os.path.join(scratch, "grid.txt")
+            with open(path, "wb") as f:
+                f.write(b"12\r\n34\r\n\r\n")
+            self.assertEqual(loadGrid.loadGrid(path, digits).tolist(), [ [ 1, 2 ], [ 3, 4 ] ])
+
+    def test_raggedRows(self):
+        with self.assertRaisesRegex(ValueError, "row 2 has 2 characters, not 3"):
+            load("123\n45\n678\n")
+        with self.assertRaisesRegex(ValueError, "row 3 has 4 characters, not 3"):
+            load("123\r\n456\r\n7890\r\n")
+        with self.assertRaisesRegex(ValueError, "row 2 does not end with CR-LF"):
+            load("123\r\n456\n789\r\n")
+
+    def test_invalidCharacter(self):
+        with self.assertRaisesRegex(ValueError, "'x' at grid row 2, column 3"):
+            load("123\n45x\n")
+
+if __name__ == "__main__":
+    unittest.main()
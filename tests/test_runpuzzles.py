@@ -0,0 +1,81 @@
+# Tests of the failure classification of runpuzzles.runCommand and of
+# solving compressed inputs in-process
+
+import os
+import gzip
+import lzma
+import sys
+import signal
+import tempfile
+import unittest
+
+repoDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDir)
+
+import runpuzzles
+
+class RunCommandTest(unittest.TestCase):
+
+    def setUp(self):
+        scratch = tempfile.TemporaryDirectory(prefix = "runpuzzles")
+        self.addCleanup(scratch.cleanup)
+        self.scratch = scratch.name
+
+    def runScript(self, source, memoryLimit):
+        """Run the Python `source` as a script with the address space limited
+        to `memoryLimit` MiB and return its `RunResult`"""
+        path = os.path.join(self.scratch, "script.py")
+        with open(path, "w") as f:
+            f.write(source)
+        return runpuzzles.runCommand("script.py", [ sys.executable, path ], self.scratch,
+                                     timeout = 60, memoryLimit = memoryLimit)
+
+    def test_numpyAllocation(self):
+        """A numpy allocation beyond the limit is "oom", whether numpy
+        reports it (a MemoryError) or OpenBLAS does, at import"""
+        source = "import numpy as np\nprint(np.ones(2**30).sum())\n"
+        for memoryLimit in (60, 512):
+            result = self.runScript(source, memoryLimit)
+            self.assertEqual(result.status, "oom", f"{memoryLimit} MiB: {result.answer}")
+
+    def test_numpyAllocationWithoutLimit(self):
+        result = self.runScript("import numpy as np\nprint(np.ones(10).sum())\n", 0)
+        self.assertEqual((result.status, result.answer), ("ok", "10.0"))
+
+    def test_otherErrors(self):
+        """Failures that are not allocation failures are "error" """
+        result = self.runScript("raise ValueError('bad input')\n", 512)
+        self.assertEqual((result.status, result.answer), ("error", "ValueError: bad input"))
+
+    def test_killedUnderLimit(self):
+        """A script killed by SIGSEGV or SIGKILL under a memory limit is
+        "oom", but without a limit it is "error" """
+        source = f"import os\nos.kill(os.getpid(), {int(signal.SIGSEGV)})\n"
+        result = self.runScript(source, 512)
+        self.assertEqual(result.status, "oom")
+        self.assertEqual(result.answer, "killed by SIGSEGV under a 512 MiB memory limit")
+        self.assertEqual(self.runScript(source, 0).status, "error")
+
+class SolveFileTest(unittest.TestCase):
+
+    def test_compressedInputs(self):
+        """`solveFile` (used by *runbatch.py*) decompresses the input, as
+        `openInput` does for a script run on its own"""
+        script = "2022/puzzle01.1.py"
+        module = runpuzzles.loadPuzzle(script)
+        sample = os.path.join(repoDir, "2022", "puzzle01_sample.txt")
+        expected = runpuzzles.solveFile(module, script, sample)
+        self.assertEqual(expected.status, "ok", expected.answer)
+        with open(sample, "rb") as f:
+            data = f.read()
+        with tempfile.TemporaryDirectory(prefix = "runpuzzles") as scratch:
+            for ext, compress in ((".gz", gzip.compress), (".xz", lzma.compress)):
+                path = os.path.join(scratch, "puzzle01_sample.txt" + ext)
+                with open(path, "wb") as f:
+                    f.write(compress(data))
+                result = runpuzzles.solveFile(module, script, path)
+                self.assertEqual((result.status, result.answer),
+                                 ("ok", expected.answer), ext)
+
+if __name__ == "__main__":
+    unittest.main()